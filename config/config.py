@@ -12,18 +12,83 @@ class Config:
     APP_TITLE = os.getenv("APP_TITLE", "University Analytics Dashboard")
     APP_VERSION = os.getenv("APP_VERSION", "1.0.0")
     DEBUG = os.getenv("DEBUG", "False") == "True"
+    # With DEBUG, per-stage profiling records are also appended to this JSONL file (empty = off)
+    PROFILE_LOG = os.getenv("PROFILE_LOG", "")
+    # Seconds between checks for rows appended to the dataset; 0 disables live refresh
+    REFRESH_INTERVAL_SECONDS = int(os.getenv("REFRESH_INTERVAL_SECONDS", 0))
     
 class DatabaseConfig:
     """Database configuration"""
+    # Only "sqlite" is implemented (src.sqlite_backend); open_store rejects anything else
     DB_TYPE = os.getenv("DB_TYPE", "sqlite")
     DB_PATH = os.getenv("DB_PATH", "./database/university.db")
+    POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 4))
     
 class StreamlitConfig:
     """Streamlit-specific configuration"""
     SERVER_PORT = int(os.getenv("STREAMLIT_SERVER_PORT", 8501))
     LOGGER_LEVEL = os.getenv("STREAMLIT_LOGGER_LEVEL", "info")
+    # Replicas started by python -m src.shared_dataset on SERVER_PORT, SERVER_PORT + 1, ...
+    REPLICAS = int(os.getenv("STREAMLIT_REPLICAS", 1))
+    # Published column files mapped by every replica (DATA_SOURCE=shared); /dev/shm keeps them in RAM
+    SHARED_DATASET_DIR = os.getenv(
+        "SHARED_DATASET_DIR", "/dev/shm/social_media_engagement" if os.path.isdir("/dev/shm") else "./database/shared"
+    )
+
+class CacheConfig:
+    """Cache configuration"""
+    FIGURE_CACHE_MB = int(os.getenv("FIGURE_CACHE_MB", 64))
+
+class ServiceConfig:
+    """Aggregation service configuration (python -m src.aggregation_service)"""
+    HOST = os.getenv("AGG_SERVICE_HOST", "127.0.0.1")
+    PORT = int(os.getenv("AGG_SERVICE_PORT", 8765))
+    URL = os.getenv("AGG_SERVICE_URL", f"http://{HOST}:{PORT}")
+    CACHE_ENTRIES = int(os.getenv("AGG_SERVICE_CACHE_ENTRIES", 4096))
+    TIMEOUT_SECONDS = int(os.getenv("AGG_SERVICE_TIMEOUT", 30))
+    # Partition files are rescanned for changes at most this often (0 = on every query)
+    RESCAN_SECONDS = float(os.getenv("AGG_SERVICE_RESCAN_SECONDS", 5))
+
+class ChartConfig:
+    """Chart rendering configuration"""
+    # Point budget per time-series trace, roughly the chart width in pixels
+    MAX_POINTS = int(os.getenv("CHART_MAX_POINTS", 1000))
+    DOWNSAMPLE_METHOD = os.getenv("DOWNSAMPLE_METHOD", "lttb")  # "lttb" or "minmax"
+    # Rows kept per (metric, platform, post_type) cell and shown in the leaderboard
+    LEADERBOARD_TOP_K = int(os.getenv("LEADERBOARD_TOP_K", 10))
+
+class UploadConfig:
+    """CSV upload configuration (COVID-19 dashboard)"""
+    # Parsed uploads larger than this are rejected or summarised, per OVER_BUDGET
+    MEMORY_BUDGET_MB = int(os.getenv("UPLOAD_MEMORY_BUDGET_MB", 256))
+    OVER_BUDGET = os.getenv("UPLOAD_OVER_BUDGET", "sample")  # "sample" or "reject"
+    CACHE_ENTRIES = int(os.getenv("UPLOAD_CACHE_ENTRIES", 4))
+
+class BenchmarkConfig:
+    """Benchmark configuration (python -m src.benchmark)"""
+    RESULTS_DIR = os.getenv("BENCHMARK_DIR", "./database/benchmarks")
+    # Import-time budget per dashboard entry point (python -m src.benchmark --startup)
+    STARTUP_BUDGET_MS = int(os.getenv("STARTUP_BUDGET_MS", 2000))
+    STARTUP_REPEATS = int(os.getenv("STARTUP_REPEATS", 5))
+
+class SnapshotConfig:
+    """Static snapshot export (python -m src.snapshot)"""
+    OUTPUT_DIR = os.getenv("SNAPSHOT_DIR", "./database/snapshots")
+    # JSON list of filter states besides the default view, e.g.
+    # [{"platforms": ["Instagram"]}, {"post_types": ["video", "image"]}]; empty = one per platform
+    FILTERS = os.getenv("SNAPSHOT_FILTERS", "")
+    PLOTLYJS = os.getenv("SNAPSHOT_PLOTLYJS", "directory")  # "directory", "inline" or "cdn"
 
 class DataConfig:
     """Data configuration"""
+    # "local" (files), "sqlite" (DatabaseConfig), "service" (ServiceConfig) or "shared" (StreamlitConfig.SHARED_DATASET_DIR)
     DATA_SOURCE = os.getenv("DATA_SOURCE", "local")
     DATA_PATH = os.getenv("DATA_PATH", "./database/data")
+    CACHE_DIR = os.getenv("DATA_CACHE_DIR", "./database/cache")
+    # Every file under DATA_PATH matching this pattern is one dataset partition
+    PARTITION_PATTERN = os.getenv("PARTITION_PATTERN", "*.csv")
+    LOAD_WORKERS = int(os.getenv("LOAD_WORKERS", 0))  # 0 = os.cpu_count()
+    # Files larger than this are ingested in chunks into running aggregates
+    STREAMING_THRESHOLD_MB = int(os.getenv("STREAMING_THRESHOLD_MB", 512))
+    CHUNK_ROWS = int(os.getenv("CHUNK_ROWS", 500000))
+    RESERVOIR_SIZE = int(os.getenv("RESERVOIR_SIZE", 1000))
@@ -4,12 +4,12 @@ Soal 2: Analisis 2a-2e (insight, target user, elemen desain, hambatan, rekomenda
 """
 import streamlit as st
 import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import matplotlib.pyplot as plt
-import seaborn as sns
+
+from config.config import ChartConfig, UploadConfig
+from src.covid import StateWindow, build_state_analytics, is_state_level
+from src.downsample import downsample_frame
+from src.profiling import Profiler
+from src.uploads import UploadTooLarge, content_hash, parse_upload
 
 # Page configuration
 st.set_page_config(
@@ -19,6 +19,81 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Metrics selectable for the per-state bar chart
+STATE_METRICS = {
+    'cases': 'Kasus baru (rentang)',
+    'cases_per_100k': 'Kasus per 100 ribu penduduk',
+    'avg7_cases': 'Rata-rata 7 hari kasus baru (akhir rentang)',
+    'cfr': 'Case fatality ratio (%)',
+}
+
+
+@st.cache_resource(max_entries=UploadConfig.CACHE_ENTRIES)
+def load_state_analytics(digest, _frame):
+    """Analitik per negara bagian, dibangun sekali per isi upload dan dibagi antar sesi"""
+    return build_state_analytics(_frame)
+
+
+def date_range_input(first_day, last_day):
+    """Slider rentang tanggal; data satu hari (mis. ekstrak harian NYT/JHU) langsung memakai hari itu"""
+    if first_day == last_day:
+        # st.slider rejects min_value == max_value
+        st.caption(f"Data hanya berisi satu tanggal: {first_day:%Y-%m-%d}")
+        return first_day, last_day
+    return st.slider(
+        "Rentang tanggal",
+        min_value=first_day,
+        max_value=last_day,
+        value=(first_day, last_day)
+    )
+
+
+def state_section(analytics, digest, profiler):
+    """Tren nasional, bar per negara bagian, dan scatter kasus vs kematian untuk rentang tanggal"""
+    import plotly.express as px  # only needed once a dataset is uploaded
+    
+    start, end = date_range_input(analytics.first_date.date(), analytics.last_date.date())
+    
+    with profiler.stage('state_window') as stage:
+        # Per-session window state: a slider move only recomputes states whose rows changed
+        windows = st.session_state.setdefault('state_windows', {})
+        if digest not in windows:
+            windows[digest] = StateWindow(analytics)
+        table = windows[digest].summary(start, end)
+        stage['rows'] = windows[digest].recomputed
+    
+    cases, deaths = table['cases'].sum(), table['deaths'].sum()
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Kasus baru", f"{cases:,.0f}")
+    col2.metric("Kematian baru", f"{deaths:,.0f}")
+    col3.metric("CFR rentang", f"{deaths / cases * 100:.2f}%" if cases > 0 else "-")
+    
+    with profiler.stage('cases_chart') as stage:
+        national = analytics.national_daily()
+        national = national[national['date'].dt.date.between(start, end)]
+        stage['rows'] = len(national)
+        # At most ChartConfig.MAX_POINTS points reach the browser, peaks included
+        series = downsample_frame(national, 'date', 'avg7_cases')
+        fig_cases = px.line(series, x='date', y='avg7_cases', title="Kasus Baru Harian Nasional (rata-rata 7 hari)")
+        st.plotly_chart(fig_cases, use_container_width=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        metric = st.selectbox("Metrik per negara bagian", list(STATE_METRICS), format_func=STATE_METRICS.get)
+        ranked = table.dropna(subset=[metric]).sort_values(metric, ascending=False)
+        fig_bar = px.bar(ranked, x='state', y=metric, title=f"{STATE_METRICS[metric]} per Negara Bagian",
+                         labels={metric: STATE_METRICS[metric], 'state': 'State'})
+        st.plotly_chart(fig_bar, use_container_width=True)
+    
+    with col2:
+        fig_scatter = px.scatter(table, x='cases', y='deaths', color='cfr', hover_name='state',
+                                 hover_data=['cases_per_100k', 'cfr'], log_x=True, log_y=True,
+                                 labels={'cases': 'Kasus baru', 'deaths': 'Kematian baru', 'cfr': 'CFR (%)'},
+                                 title="Hubungan Kasus vs Kematian per Negara Bagian")
+        st.plotly_chart(fig_scatter, use_container_width=True)
+
+
 def main():
     st.title("🦠 COVID-19 United States Dashboard")
     
@@ -33,35 +108,91 @@ def main():
     - Rekomendasi (Analisis 2e)
     """)
     
+    # Each stage is timed when Config.DEBUG is on (sidebar "Profiling" panel)
+    profiler = Profiler('covid19_united_states')
+    
     # Upload data
     st.header("Upload Dataset")
     uploaded_file = st.file_uploader("Choose a COVID-19 CSV file", type="csv")
     
+    # Parsed uploads are cached under their content hash, so reruns never re-parse; the frame
+    # is only read afterwards, so every rerun and session shares it instead of unpickling a copy
+    @st.cache_resource(max_entries=UploadConfig.CACHE_ENTRIES)
+    def load_upload(digest, _file):
+        profiler.miss()
+        return parse_upload(_file, digest)
+    
+    upload = None
     if uploaded_file is not None:
-        df = pd.read_csv(uploaded_file)
-        st.success(f"COVID-19 dataset loaded successfully with shape: {df.shape}")
-        
-        st.subheader("Dataset Preview")
-        st.dataframe(df.head())
+        with profiler.stage('load_upload', cached=True) as stage:
+            # Hash once per uploaded file, not on every rerun
+            digests = st.session_state.setdefault('upload_digests', {})
+            if uploaded_file.file_id not in digests:
+                digests[uploaded_file.file_id] = content_hash(uploaded_file)
+            digest = digests[uploaded_file.file_id]
+            # Rejections are remembered too, so an oversized file is parsed only once
+            rejected = st.session_state.setdefault('upload_rejected', {})
+            if digest not in rejected:
+                try:
+                    upload = load_upload(digest, uploaded_file)
+                    stage['rows'] = upload.shape[0]
+                except UploadTooLarge as exc:
+                    rejected[digest] = str(exc)
+            if digest in rejected:
+                st.error(f"{rejected[digest]}. Perkecil file atau naikkan UPLOAD_MEMORY_BUDGET_MB.")
+    
+    if upload is not None:
+        if upload.sampled:
+            # Over the memory budget: only a row sample and daily totals were kept
+            summary = upload.summary
+            st.success(f"COVID-19 dataset streamed successfully with shape: {summary.shape}")
+            st.warning(
+                f"Dataset melebihi anggaran memori {UploadConfig.MEMORY_BUDGET_MB} MB; "
+                "ditampilkan sampel acak dan total harian."
+            )
+            
+            st.subheader("Dataset Preview (sampel acak)")
+            st.dataframe(summary.sample.head())
+            df = summary.daily if summary.daily is not None else summary.sample
+        else:
+            df = upload.frame
+            st.success(
+                f"COVID-19 dataset loaded successfully with shape: {df.shape} "
+                f"({upload.memory_mb:.1f} MB in memory)"
+            )
+            
+            st.subheader("Dataset Preview")
+            st.dataframe(df.head())
         
-        # Sample visualization - replace with actual COVID-19 data analysis
         st.header("COVID-19 Cases Visualization")
         
-        # Prepare sample data if needed
-        if 'date' in df.columns and 'cases' in df.columns:
-            fig_cases = px.line(df, x='date', y='cases', title="Tren Kasus COVID-19")
-            st.plotly_chart(fig_cases, use_container_width=True)
-        else:
-            # Create sample data for demonstration
-            dates = pd.date_range(start='2020-01-01', periods=365, freq='D')
-            cases = np.random.normal(loc=1000, scale=300, size=len(dates)).cumsum()
-            cases = np.abs(cases)  # Ensure positive values
+        analytics = None
+        if not upload.sampled and is_state_level(df):
+            with profiler.stage('state_analytics', rows=len(df), cached=True):
+                analytics = load_state_analytics(upload.digest, df)
+        
+        if analytics is not None:
+            state_section(analytics, upload.digest, profiler)
+        elif 'date' in df.columns and 'cases' in df.columns:
+            import plotly.express as px  # only needed once a dataset is uploaded
             
-            sample_df = pd.DataFrame({'date': dates, 'cases': cases})
-            fig_cases = px.line(sample_df, x='date', y='cases', title="Contoh Tren Kasus COVID-19 (Simulasi)")
-            st.plotly_chart(fig_cases, use_container_width=True)
+            with profiler.stage('cases_chart', rows=len(df)):
+                series = df[['date', 'cases']].assign(date=pd.to_datetime(df['date'])).sort_values('date', kind='stable')
+                if len(series) > ChartConfig.MAX_POINTS:
+                    # Zooming into a narrower range re-runs the downsampling at finer granularity
+                    date_range = date_range_input(*series['date'].iloc[[0, -1]].dt.date)
+                    series = series[series['date'].dt.date.between(*date_range)]
+                # At most ChartConfig.MAX_POINTS points reach the browser, peaks included
+                series = downsample_frame(series, 'date', 'cases')
+                fig_cases = px.line(series, x='date', y='cases', title="Tren Kasus COVID-19")
+                st.plotly_chart(fig_cases, use_container_width=True)
+        else:
+            st.info(
+                "Kolom 'date' dan 'cases' tidak ditemukan. Gunakan data bergaya NYT/JHU "
+                "(date, state, cases, deaths) untuk analisis per negara bagian."
+            )
     
-    else:
+    elif uploaded_file is None:
         st.info("Silakan upload file CSV dataset COVID-19 untuk memulai analisis.")
     
     # Analysis Section
@@ -149,32 +280,7 @@ def main():
       berbagai kemampuan, termasuk dukungan untuk pembaca layar.
     """)
     
-    # Sample COVID-19 visualizations
-    st.header("Contoh Visualisasi COVID-19")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Sample bar chart
-        states = ['California', 'Texas', 'Florida', 'New York', 'Illinois']
-        cases = [800000, 750000, 650000, 550000, 450000]
-        deaths = [10000, 12000, 8000, 9000, 7000]
-        
-        sample_data = pd.DataFrame({
-            'State': states,
-            'Cases': cases,
-            'Deaths': deaths
-        })
-        
-        fig_bar = px.bar(sample_data, x='State', y='Cases', title="Contoh Kasus per Negara Bagian (Simulasi)")
-        st.plotly_chart(fig_bar, use_container_width=True)
-    
-    with col2:
-        # Sample scatter plot
-        fig_scatter = px.scatter(sample_data, x='Cases', y='Deaths', 
-                                color='State', title="Hubungan Kasus vs Kematian",
-                                hover_data=['State'])
-        st.plotly_chart(fig_scatter, use_container_width=True)
+    profiler.render()
 
 if __name__ == "__main__":
     main()
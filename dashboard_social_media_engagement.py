@@ -3,18 +3,22 @@ Social Media Engagement Dashboard - Data Insight UAS
 Soal 1: Dataset Social Media Engagement - 6 Visualisasi + Deskripsi Insight
 """
 import streamlit as st
-import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import matplotlib.pyplot as plt
-import seaborn as sns
-from matplotlib import cm
-from matplotlib.colors import Normalize
-import matplotlib.colors as mcolors
-import os
-from pathlib import Path
+
+from config.config import CacheConfig, ChartConfig, Config, DataConfig
+from src.boxstats import box_figure, platform_box_stats
+from src.charts import BOX_CHART, ENGAGEMENT_CHARTS, ENGAGEMENT_SECTIONS, ChartSet
+from src.colors import blues_hex
+from src.cube import build_cube
+from src.figcache import FigureCache, selection_key
+from src.filter_index import build_filter_index
+from src.leaderboard import build_leaderboard
+from src.loader import (
+    METRIC_COLUMNS, dataset_signature, discover_partitions, load_partitions, memory_report, post_day_mismatches
+)
+from src.posting_time import build_posting_time_cube, posting_time_figure
+from src.profiling import Profiler
+from src.sentiment import build_sentiment_cube, sentiment_bar_figure, sentiment_heatmap_figure, sentiment_mix_figure
 
 def apply_skyblues_by_value(values, patches):
     """
@@ -22,11 +26,10 @@ def apply_skyblues_by_value(values, patches):
     Skema warna: Sky Blue
     Aman dari konflik variabel
     """
-    cmap = plt.colormaps.get_cmap('Blues')  # Sky blue → biru tua
-    norm = mcolors.Normalize(vmin=min(values), vmax=max(values))
+    colors = blues_hex(values)  # Sky blue → biru tua
 
-    for v, p in zip(values, patches):
-        p.set_facecolor(cmap(norm(v)))
+    for c, p in zip(colors, patches):
+        p.set_facecolor(c)
         p.set_edgecolor('black')
 
 # Page configuration
@@ -47,406 +50,399 @@ def main():
     beserta insight-insight yang dapat diambil dari data tersebut.
     """)
     
-    # Load the dataset from the specified path
-    @st.cache_data
-    def load_data():
-        # Get the directory where the script is located
-        # For Streamlit compatibility, use current working directory if __file__ fails
-        try:
-            script_dir = Path(__file__).parent
-            data_path = script_dir / 'database' / 'data' / 'social_media_engagement1.csv'
-        except NameError:
-            # If __file__ is not defined (in some environments), use current directory
-            data_path = Path('database') / 'data' / 'social_media_engagement1.csv'
-        
-        # Also try the absolute path approach
-        if not data_path.exists():
-            data_path = Path.cwd() / 'database' / 'data' / 'social_media_engagement1.csv'
-        
-        # Check if file exists before reading
-        if not data_path.exists():
-            raise FileNotFoundError(f"Data file not found at: {data_path}")
-            
-        df = pd.read_csv(data_path)
-        # Convert post_time to datetime
-        df['post_time'] = pd.to_datetime(df['post_time'])
-        # Convert post_day to categorical
-        df['post_day'] = df['post_day'].astype('category')
-        # Explicitly set category order to avoid pandas deprecation warning later
-        df['post_day'] = pd.Categorical(df['post_day'], categories=['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'], ordered=True)
-        return df
-    
-    df = load_data()
-    st.success(f"Dataset loaded successfully with shape: {df.shape}")
-    
-    st.subheader("Dataset Preview")
-    st.dataframe(df.head())
+    # Load every partition file under DataConfig.DATA_PATH (in parallel when there are several)
+    # Cache key = (path, size, mtime) per partition so an updated CSV invalidates the cache too
+    # The frame is only read, so every rerun shares one object instead of unpickling a copy;
+    # only the current version is kept
+    @st.cache_resource(max_entries=1)
+    def load_data(signature):
+        profiler.miss()
+        return load_partitions([s[0] for s in signature])
+    
+    # Shared deployment: columns published once by src.shared_dataset, mapped zero-copy by each replica
+    # Only the current version stays mapped; older versions are released on republish
+    @st.cache_resource(max_entries=1)
+    def load_shared_data(signature):
+        from src.shared_dataset import attach
+        profiler.miss()
+        return attach(signature)
+    
+    def dataset(signature):
+        return load_shared_data(signature) if DataConfig.DATA_SOURCE == 'shared' else load_data(signature)
+    
+    # Every loader keyed by the dataset signature keeps only the current version (max_entries=1),
+    # so appended or refreshed partitions do not leave old indexes, cubes or connections behind
+    
+    # Per-column memory of the compacted frame versus the typed frame it replaces,
+    # plus the rows whose post_day disagrees with post_time (loaded anyway, see loader)
+    @st.cache_data(max_entries=1)
+    def load_memory_report(signature):
+        df = dataset(signature)
+        return memory_report(df), post_day_mismatches(df)
+    
+    # Pre-aggregated cube, built once per dataset version for Visualisasi 2-5
+    @st.cache_data(max_entries=1)
+    def load_cube(signature):
+        profiler.miss()
+        return build_cube(dataset(signature))
+    
+    # Per-value row bitmaps for the sidebar filters; read-only, so shared without copying
+    @st.cache_resource(max_entries=1)
+    def load_filter_index(signature):
+        profiler.miss()
+        return build_filter_index(dataset(signature))
+    
+    # Per-cell top-K lists and frequency tables; leaderboards merge these instead of sorting
+    @st.cache_resource(max_entries=1)
+    def load_leaderboard(signature):
+        profiler.miss()
+        return build_leaderboard(dataset(signature))
+    
+    # Sentiment x platform x post_type sums and weekly sentiment counts from one bincount pass
+    @st.cache_resource(max_entries=1)
+    def load_sentiment(signature):
+        profiler.miss()
+        return build_sentiment_cube(dataset(signature))
+    
+    # Platform x post_type x day-of-week x hour sums from one bincount over integer time keys
+    @st.cache_resource(max_entries=1)
+    def load_posting_time(signature):
+        profiler.miss()
+        return build_posting_time_cube(dataset(signature))
+    
+    # Data-source backends below are imported on first use, so only the active mode pays for them
+    
+    # Files larger than RAM are streamed in chunks into running aggregates
+    @st.cache_data(max_entries=1)
+    def load_aggregates(signature):
+        from src.streaming import stream_engagement
+        profiler.miss()
+        return stream_engagement([s[0] for s in signature])
+    
+    # SQLite backend: filters and group-bys run as SQL, only aggregates reach this process;
+    # an evicted store closes its connection pool
+    @st.cache_resource(max_entries=1, on_release=lambda store: store.close())
+    def load_store(signature):
+        from src.sqlite_backend import open_store
+        profiler.miss()
+        return open_store(signature)
+    
+    # Append-only live dataset: each refresh parses only rows written since the last one
+    @st.cache_resource
+    def load_live_dataset():
+        from src.refresh import LiveDataset
+        return LiveDataset()
+    
+    # Aggregation service client; every session shares the service's result cache
+    @st.cache_resource
+    def get_service_client():
+        from src.aggregation_service import AggregationClient
+        return AggregationClient()
+    
+    # One figure cache per server process, shared by every session
+    @st.cache_resource
+    def get_figure_cache():
+        return FigureCache(CacheConfig.FIGURE_CACHE_MB * 1024 * 1024)
+    
+    # Each stage is timed when Config.DEBUG is on (sidebar "Profiling" panel)
+    profiler = Profiler('social_media_engagement')
+    
+    leaderboard = sentiment = posting_time = None
+    with profiler.stage('load_data', cached=True) as stage:
+        if DataConfig.DATA_SOURCE == 'service':
+            # Thin client: the dataset version comes from the aggregation service
+            store = get_service_client()
+            signature = store.signature()
+        elif DataConfig.DATA_SOURCE == 'shared':
+            # Version published by the loader process; a new publish switches every replica over
+            from src.shared_dataset import published_signature
+            signature = published_signature()
+        else:
+            signature = dataset_signature(discover_partitions())
+    
+        if DataConfig.DATA_SOURCE in ('sqlite', 'service'):
+            data_mode = DataConfig.DATA_SOURCE
+        elif DataConfig.DATA_SOURCE != 'shared' and sum(s[1] for s in signature) > DataConfig.STREAMING_THRESHOLD_MB * 1024 * 1024:
+            data_mode = 'streaming'
+        else:
+            data_mode = 'memory'
+    
+        if data_mode in ('sqlite', 'service'):
+            if data_mode == 'sqlite':
+                store = load_store(signature)
+            cube = store  # same mean()/total() contract as EngagementCube
+            data_shape = store.shape
+            source = 'SQLite' if data_mode == 'sqlite' else 'aggregation service'
+            st.success(f"Dataset loaded from {source} with shape: {data_shape}")
+            st.subheader("Dataset Preview")
+            st.dataframe(store.preview())
+            platform_options = store.distinct('platform')
+            post_type_options = store.distinct('post_type')
+        elif data_mode == 'streaming':
+            aggregates = load_aggregates(signature)
+            cube = aggregates.cube
+            sentiment = aggregates.sentiment
+            posting_time = aggregates.posting_time
+            data_shape = aggregates.shape
+            st.success(f"Dataset streamed successfully with shape: {data_shape}")
+            st.subheader("Dataset Preview (sampel acak)")
+            st.dataframe(aggregates.preview())
+            platform_options = cube.cells['platform'].unique()
+            post_type_options = cube.cells['post_type'].unique()
+        elif Config.REFRESH_INTERVAL_SECONDS > 0 and DataConfig.DATA_SOURCE != 'shared':
+            live = load_live_dataset()
+            live.refresh_if_due(Config.REFRESH_INTERVAL_SECONDS)
+            # Frame and version key come from the same refresh, so figures are cached under their own version
+            signature, (df, cube, filter_index, leaderboard, sentiment, posting_time) = live.versioned_snapshot()
+            data_shape = df.shape
+            st.success(f"Dataset loaded successfully with shape: {data_shape}")
+            st.caption(f"Live refresh tiap {Config.REFRESH_INTERVAL_SECONDS} detik, +{live.rows_added} baris baru")
+            st.subheader("Dataset Preview")
+            st.dataframe(df.head())
+            platform_options = filter_index.values['platform']
+            post_type_options = filter_index.values['post_type']
+        else:
+            df = dataset(signature)
+            cube = load_cube(signature)
+            filter_index = load_filter_index(signature)
+            leaderboard = load_leaderboard(signature)
+            sentiment = load_sentiment(signature)
+            posting_time = load_posting_time(signature)
+            data_shape = df.shape
+            st.success(f"Dataset loaded successfully with shape: {data_shape}")
+            report, mismatches = load_memory_report(signature)
+            if mismatches:
+                st.warning(f"{mismatches} baris memiliki post_day yang tidak cocok dengan post_time; "
+                           "analisis jam dan hari memakai post_time")
+            with st.expander(f"Memori dataset: {report.loc['total', 'mb']:.1f} MB ({report.loc['total', 'dtype']} lebih kecil)"):
+                st.dataframe(report.round({'typed_mb': 2, 'mb': 2}))
+            st.subheader("Dataset Preview")
+            st.dataframe(df.head())
+            platform_options = filter_index.values['platform']
+            post_type_options = filter_index.values['post_type']
+        stage['rows'] = data_shape[0]
     
     
     # Feature 1: Platform selection filter
     st.sidebar.header("Filters")
     platforms = st.sidebar.multiselect(
         'Select Platforms:',
-        options=df['platform'].unique(),
-        default=df['platform'].unique()
+        options=platform_options,
+        default=platform_options
     )
     
     post_types = st.sidebar.multiselect(
         'Select Post Types:',
-        options=df['post_type'].unique(),
-        default=df['post_type'].unique()
+        options=post_type_options,
+        default=post_type_options
     )
     
     # Apply filters
-    filtered_df = df[(df['platform'].isin(platforms)) & (df['post_type'].isin(post_types))]
-    
-    st.subheader(f"Filtered Dataset ({len(filtered_df)} records)")
-    st.dataframe(filtered_df.head())
+    with profiler.stage('filter') as stage:
+        if data_mode in ('sqlite', 'service'):
+            n_filtered = store.count(platforms, post_types)
+            filtered_preview = store.preview(platforms, post_types)
+        elif data_mode == 'streaming':
+            n_filtered = int(cube.select(platforms, post_types)['count'].sum())
+            filtered_preview = aggregates.preview(platforms, post_types)
+        else:
+            # Row positions from the bitmap index; columns are gathered only when a chart needs them
+            filtered_rows = filter_index.select(platform=platforms, post_type=post_types)
+            n_filtered = len(filtered_rows)
+            filtered_preview = df.iloc[filtered_rows[:5]]
+        stage['rows'] = n_filtered
+    
+    def filtered_column(col):
+        return df[col].to_numpy()[filtered_rows]
+    
+    def metric_histograms(metrics):
+        if data_mode in ('sqlite', 'service'):
+            return {m: store.histogram(m, platforms, post_types) for m in metrics}
+        if data_mode == 'streaming':
+            return {m: aggregates.histogram(m, platforms, post_types) for m in metrics}
+        return {m: np.histogram(filtered_column(m), bins=20) for m in metrics}
+    
+    st.subheader(f"Filtered Dataset ({n_filtered} records)")
+    st.dataframe(filtered_preview)
+    
+    # Figures are memoised per (dataset version, sorted selections, chart id)
+    figure_cache = get_figure_cache()
+    filter_key = selection_key(signature, platforms, post_types)
+    
+    def cached_figure(chart_id, build):
+        def build_on_miss():
+            profiler.miss()
+            return build()
+        return figure_cache.get_or_build(filter_key + (chart_id,), build_on_miss)
+    
+    # Aggregates for every chart spec are computed together on first use
+    charts = ChartSet(ENGAGEMENT_CHARTS, cube, metric_histograms, platforms, post_types)
+    # Section titles and insight texts, shared with the static snapshot export (src.snapshot)
+    sections = {section.section_id: section for section in ENGAGEMENT_SECTIONS}
+
     
     
     # Visualisasi 1: Distribution of Engagement Metrics with Consistent Sky Blue Palette
-    st.header("Visualisasi 1: Distribusi Metrik Engagement")
+    st.header(sections['visualisasi_1'].title)
     
-    if len(filtered_df.columns) >= 3:
+    if data_shape[1] >= 3:
         numeric_cols = ['likes', 'comments', 'shares']  # Focus on the key engagement metrics
         
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            # Create histogram with sky blue color gradient based on value magnitude
-            fig1 = go.Figure()
-            hist_data = np.histogram(filtered_df['likes'], bins=20)
-            values = hist_data[0]
-            
-            # Normalize values to use with Blues colormap
-            norm = mcolors.Normalize(vmin=min(values), vmax=max(values))
-            cmap = plt.colormaps.get_cmap('Blues')
-            
-            colors = [mcolors.to_hex(cmap(norm(v))) for v in values]
-            
-            fig1.add_trace(go.Bar(
-                x=hist_data[1][:-1],
-                y=values,
-                marker_color=colors,
-                width=np.diff(hist_data[1])[0]
-            ))
-            fig1.update_layout(
-                title="Distribusi Jumlah Likes",
-                xaxis_title="Jumlah Likes",
-                yaxis_title="Frekuensi"
-            )
-            st.plotly_chart(fig1, width='stretch')
-        
-        with col2:
-            # Create histogram with sky blue color gradient based on value magnitude
-            fig2 = go.Figure()
-            hist_data = np.histogram(filtered_df['comments'], bins=20)
-            values = hist_data[0]
-            
-            # Normalize values to use with Blues colormap
-            norm = mcolors.Normalize(vmin=min(values), vmax=max(values))
-            cmap = plt.colormaps.get_cmap('Blues')
-            
-            colors = [mcolors.to_hex(cmap(norm(v))) for v in values]
-            
-            fig2.add_trace(go.Bar(
-                x=hist_data[1][:-1],
-                y=values,
-                marker_color=colors,
-                width=np.diff(hist_data[1])[0]
-            ))
-            fig2.update_layout(
-                title="Distribusi Jumlah Comments",
-                xaxis_title="Jumlah Comments",
-                yaxis_title="Frekuensi"
-            )
-            st.plotly_chart(fig2, width='stretch')
-        
-        with col3:
-            # Create histogram with sky blue color gradient based on value magnitude
-            fig3 = go.Figure()
-            hist_data = np.histogram(filtered_df['shares'], bins=20)
-            values = hist_data[0]
-            
-            # Normalize values to use with Blues colormap
-            norm = mcolors.Normalize(vmin=min(values), vmax=max(values))
-            cmap = plt.colormaps.get_cmap('Blues')
-            
-            colors = [mcolors.to_hex(cmap(norm(v))) for v in values]
-            
-            fig3.add_trace(go.Bar(
-                x=hist_data[1][:-1],
-                y=values,
-                marker_color=colors,
-                width=np.diff(hist_data[1])[0]
-            ))
-            fig3.update_layout(
-                title="Distribusi Jumlah Shares",
-                xaxis_title="Jumlah Shares",
-                yaxis_title="Frekuensi"
-            )
-            st.plotly_chart(fig3, width='stretch')
+        with profiler.stage('visualisasi_1', rows=n_filtered, cached=True):
+            for col, metric in zip(st.columns(3), numeric_cols):
+                with col:
+                    chart_id = f'hist_{metric}'
+                    st.plotly_chart(cached_figure(chart_id, lambda: charts.figure(chart_id)), width='stretch')
         
-        st.markdown("""
-        **Insight 1:**
-        Distribusi metrik engagement menunjukkan bahwa sebagian besar postingan mendapatkan jumlah likes, comments, dan shares yang bervariasi. 
-        Dengan menggunakan histogram dengan warna biru (skala Blues) yang semakin pekat sesuai nilai frekuensi data, kita bisa melihat bagaimana penyebaran masing-masing metrik, apakah cenderung normal, skewed, atau memiliki outlier. 
-        Ini membantu kita memahami pola umum keterlibatan pengguna di platform media sosial.
-        """)
+        st.markdown(sections['visualisasi_1'].insight)
     
     # Visualisasi 2: Platform Performance Comparison with Consistent Sky Blue Palette
-    st.header("Visualisasi 2: Perbandingan Kinerja Platform Media Sosial")
-    
-    platform_metrics = filtered_df.groupby('platform')[['likes', 'comments', 'shares']].mean().reset_index()
-    
-    # Combine all values to normalize across all metrics for consistent coloring
-    all_values = list(platform_metrics['likes']) + list(platform_metrics['comments']) + list(platform_metrics['shares'])
-    norm = mcolors.Normalize(vmin=min(all_values), vmax=max(all_values))
-    cmap = plt.colormaps.get_cmap('Blues')
-    
-    fig_platform = go.Figure()
-    
-    fig_platform.add_trace(go.Bar(
-        x=platform_metrics['platform'],
-        y=platform_metrics['likes'],
-        name='Rata-rata Likes',
-        marker_color=[mcolors.to_hex(cmap(norm(val))) for val in platform_metrics['likes']]
-    ))
-    
-    fig_platform.add_trace(go.Bar(
-        x=platform_metrics['platform'],
-        y=platform_metrics['comments'],
-        name='Rata-rata Comments',
-        marker_color=[mcolors.to_hex(cmap(norm(val))) for val in platform_metrics['comments']]
-    ))
-    
-    fig_platform.add_trace(go.Bar(
-        x=platform_metrics['platform'],
-        y=platform_metrics['shares'],
-        name='Rata-rata Shares',
-        marker_color=[mcolors.to_hex(cmap(norm(val))) for val in platform_metrics['shares']]
-    ))
-    
-    fig_platform.update_layout(
-        title="Perbandingan Rata-rata Metrik Engagement Berdasarkan Platform",
-        xaxis_title="Platform",
-        yaxis_title="Jumlah Rata-rata",
-        barmode='group'
-    )
+    st.header(sections['visualisasi_2'].title)
     
-    st.plotly_chart(fig_platform, width='stretch')
+    # Each chart is built only on a figure-cache miss
+    with profiler.stage('visualisasi_2', rows=n_filtered, cached=True):
+        st.plotly_chart(cached_figure('platform', lambda: charts.figure('platform')), width='stretch')
     
-    st.markdown("""
-    **Insight 2:**
-    Visualisasi ini menunjukkan perbedaan kinerja antar platform media sosial dalam hal engagement. 
-    Dengan menggunakan bar chart grouped dalam skema warna biru (Blues) yang konsisten dan semakin gelap untuk nilai yang lebih tinggi, kita bisa membandingkan rata-rata jumlah likes, comments, dan shares 
-    untuk setiap platform secara langsung. Ini membantu mengidentifikasi platform mana yang paling efektif 
-    dalam meningkatkan engagement pengguna.
-    """)
+    st.markdown(sections['visualisasi_2'].insight)
     
     # Visualisasi 3: Post Type Effectiveness with Consistent Sky Blue Palette
-    st.header("Visualisasi 3: Efektivitas Jenis Postingan")
-    
-    post_type_metrics = filtered_df.groupby('post_type')[['likes', 'comments', 'shares']].mean().reset_index()
-    
-    # Melt the dataframe for easier plotting
-    post_type_metrics_melted = post_type_metrics.melt(id_vars=['post_type'], 
-                                                      value_vars=['likes', 'comments', 'shares'],
-                                                      var_name='metric', 
-                                                      value_name='average')
-    
-    # Normalize all values for consistent coloring
-    all_values = post_type_metrics_melted['average'].tolist()
-    norm = mcolors.Normalize(vmin=min(all_values), vmax=max(all_values))
-    cmap = plt.colormaps.get_cmap('Blues')
-    
-    # Assign colors based on the normalized values
-    colors = [mcolors.to_hex(cmap(norm(val))) for val in all_values]
-    
-    fig_post_type = go.Figure()
-    
-    for metric in post_type_metrics_melted['metric'].unique():
-        metric_data = post_type_metrics_melted[post_type_metrics_melted['metric'] == metric]
-        fig_post_type.add_trace(go.Bar(
-            name=metric,
-            x=metric_data['post_type'],
-            y=metric_data['average'],
-            marker_color=[mcolors.to_hex(cmap(norm(val))) for val in metric_data['average']]
-        ))
-    
-    fig_post_type.update_layout(
-        title="Rata-rata Engagement Berdasarkan Jenis Postingan",
-        xaxis_title="Jenis Postingan",
-        yaxis_title="Jumlah Rata-rata",
-        barmode='group'
-    )
+    st.header(sections['visualisasi_3'].title)
     
-    st.plotly_chart(fig_post_type, width='stretch')
+    with profiler.stage('visualisasi_3', rows=n_filtered, cached=True):
+        st.plotly_chart(cached_figure('post_type', lambda: charts.figure('post_type')), width='stretch')
     
-    st.markdown("""
-    **Insight 3:**
-    Grafik ini menunjukkan seberapa efektif berbagai jenis postingan (image, video, carousel, dll.) dalam 
-    menghasilkan engagement. Dengan memvisualisasikan data ini dalam bentuk grouped bar chart dengan skema warna biru (Blues) yang konsisten dan semakin gelap untuk nilai yang lebih tinggi, 
-    kita bisa melihat jenis konten mana yang paling banyak mendapatkan likes, comments, dan shares, sehingga bisa 
-    membantu dalam merancang strategi konten yang lebih efektif.
-    """)
+    st.markdown(sections['visualisasi_3'].insight)
     
     
     # Visualisasi 4: Engagement Trend by Day of Week with Line Chart
-    st.header("Visualisasi 4: Tren Engagement Berdasarkan Hari dalam Seminggu")
-    
-    # Group by day of week to get average engagement metrics
-    day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-    day_engagement = filtered_df.groupby('post_day', observed=False)[['likes', 'comments', 'shares']].mean().reindex(day_order)
-    
-    # Prepare data for line chart
-    days = day_engagement.index
-    likes_data = day_engagement['likes']
-    comments_data = day_engagement['comments']
-    shares_data = day_engagement['shares']
-    
-    # Create line chart with consistent sky blue palette
-    fig_trend = go.Figure()
-    
-    # Normalize all values for consistent coloring
-    all_values = list(likes_data) + list(comments_data) + list(shares_data)
-    norm = mcolors.Normalize(vmin=min(all_values), vmax=max(all_values))
-    cmap = plt.colormaps.get_cmap('Blues')
-    
-    fig_trend.add_trace(go.Scatter(
-        x=days,
-        y=likes_data,
-        mode='lines+markers',
-        name='Rata-rata Likes',
-        line=dict(color=mcolors.to_hex(cmap(norm(max(likes_data))))),
-        marker=dict(color=[mcolors.to_hex(cmap(norm(val))) for val in likes_data])
-    ))
-    
-    fig_trend.add_trace(go.Scatter(
-        x=days,
-        y=comments_data,
-        mode='lines+markers',
-        name='Rata-rata Comments',
-        line=dict(color=mcolors.to_hex(cmap(norm(max(comments_data))))),
-        marker=dict(color=[mcolors.to_hex(cmap(norm(val))) for val in comments_data])
-    ))
-    
-    fig_trend.add_trace(go.Scatter(
-        x=days,
-        y=shares_data,
-        mode='lines+markers',
-        name='Rata-rata Shares',
-        line=dict(color=mcolors.to_hex(cmap(norm(max(shares_data))))),
-        marker=dict(color=[mcolors.to_hex(cmap(norm(val))) for val in shares_data])
-    ))
-    
-    fig_trend.update_layout(
-        title="Tren Rata-rata Engagement Berdasarkan Hari dalam Seminggu",
-        xaxis_title="Hari dalam Seminggu",
-        yaxis_title="Jumlah Rata-rata",
-        hovermode='x unified'
-    )
+    st.header(sections['visualisasi_4'].title)
     
-    st.plotly_chart(fig_trend, width='stretch')
+    with profiler.stage('visualisasi_4', rows=n_filtered, cached=True):
+        st.plotly_chart(cached_figure('post_day', lambda: charts.figure('post_day')), width='stretch')
     
-    st.markdown("""
-    **Insight 4:**
-    Visualisasi line chart ini menunjukkan tren engagement berdasarkan hari dalam seminggu.
-    Dengan menggunakan line chart dalam skema warna biru (Blues) yang konsisten dan semakin gelap untuk nilai yang lebih tinggi,
-    kita bisa mengamati pola engagement harian - kapan engagement tertinggi dan terendah terjadi.
-    Ini sangat berguna untuk menentukan waktu optimal untuk memposting konten di media sosial.
-    """)
+    st.markdown(sections['visualisasi_4'].insight)
 
     # Visualisasi 5: Time Series Engagement Trend with Enhanced Line Chart
-    st.header("Visualisasi 5: Tren Engagement Harian (Time Series)")
+    st.header(sections['visualisasi_5'].title)
 
-    # Extract date part from datetime for daily aggregation
-    filtered_df_with_date = filtered_df.copy()
-    filtered_df_with_date['date_only'] = pd.to_datetime(filtered_df_with_date['post_time']).dt.date
-    
-    # Group by date to get daily totals
-    daily_engagement = filtered_df_with_date.groupby('date_only')[['likes', 'comments', 'shares']].sum().reset_index()
-    
-    # Create time series line chart
-    fig_timeseries = go.Figure()
-    
-    # Normalize all values for consistent coloring
-    all_values_ts = list(daily_engagement['likes']) + list(daily_engagement['comments']) + list(daily_engagement['shares'])
-    norm_ts = mcolors.Normalize(vmin=min(all_values_ts), vmax=max(all_values_ts))
-    cmap_ts = plt.colormaps.get_cmap('Blues')
-    
-    fig_timeseries.add_trace(go.Scatter(
-        x=pd.to_datetime(daily_engagement['date_only']).dt.strftime('%Y-%m-%d'),
-        y=daily_engagement['likes'],
-        mode='lines+markers',
-        name='Total Likes Harian',
-        line=dict(color=mcolors.to_hex(cmap_ts(norm_ts(max(daily_engagement['likes']))))),
-        marker=dict(color=[mcolors.to_hex(cmap_ts(norm_ts(val))) for val in daily_engagement['likes']])
-    ))
-    
-    fig_timeseries.add_trace(go.Scatter(
-        x=pd.to_datetime(daily_engagement['date_only']).dt.strftime('%Y-%m-%d'),
-        y=daily_engagement['comments'],
-        mode='lines+markers',
-        name='Total Comments Harian',
-        line=dict(color=mcolors.to_hex(cmap_ts(norm_ts(max(daily_engagement['comments']))))),
-        marker=dict(color=[mcolors.to_hex(cmap_ts(norm_ts(val))) for val in daily_engagement['comments']])
-    ))
-    
-    fig_timeseries.add_trace(go.Scatter(
-        x=pd.to_datetime(daily_engagement['date_only']).dt.strftime('%Y-%m-%d'),
-        y=daily_engagement['shares'],
-        mode='lines+markers',
-        name='Total Shares Harian',
-        line=dict(color=mcolors.to_hex(cmap_ts(norm_ts(max(daily_engagement['shares']))))),
-        marker=dict(color=[mcolors.to_hex(cmap_ts(norm_ts(val))) for val in daily_engagement['shares']])
-    ))
-    
-    fig_timeseries.update_layout(
-        title="Tren Total Engagement Harian (Time Series)",
-        xaxis_title="Tanggal",
-        yaxis_title="Jumlah Total",
-        hovermode='x unified'
-    )
-    
-    st.plotly_chart(fig_timeseries, width='stretch')
-    
-    st.markdown("""
-    **Insight 5:**
-    Visualisasi time series ini menunjukkan tren engagement harian dari postingan media sosial.
-    Dengan menggunakan line chart dalam skema warna biru (Blues) yang konsisten,
-    kita bisa mengamati fluktuasi engagement harian sepanjang periode waktu yang tersedia dalam dataset.
-    Ini membantu mengidentifikasi pola musiman atau periode puncak engagement.
-    """)
+    # Daily totals rolled up from the cube's date dimension
+    date_range = None
+    if len(charts.frame('total', 'date')) > ChartConfig.MAX_POINTS:
+        # Narrowing the range re-runs the downsampling at finer granularity
+        first_day, last_day = charts.frame('total', 'date').index[[0, -1]].date
+        date_range = st.slider(
+            "Rentang tanggal",
+            min_value=first_day,
+            max_value=last_day,
+            value=(first_day, last_day)
+        )
+    
+    with profiler.stage('visualisasi_5', rows=n_filtered, cached=True):
+        st.plotly_chart(cached_figure(('daily', date_range), lambda: charts.figure('daily', date_range)), width='stretch')
+    
+    st.markdown(sections['visualisasi_5'].insight)
 
 
     # Visualisasi 6: Box Plot - Distribusi Engagement per Platform
-    st.header("Visualisasi 6: Box Plot - Distribusi Engagement per Platform")
-    
-    # Melt the dataframe for box plot
-    box_plot_data = filtered_df.melt(
-        id_vars=['platform'],
-        value_vars=['likes', 'comments', 'shares'],
-        var_name='metric',
-        value_name='count'
-    )
+    st.header(sections['visualisasi_6'].title)
+    
+    def build_box_chart():
+        # Only a handful of numbers per box reach the browser, independent of row count
+        box_platforms = [p for p in platform_options if p in platforms]
+        if data_mode in ('sqlite', 'service'):
+            # Exact statistics computed by the store (SQL frequency tables or the service)
+            per_platform = {p: {m: store.box_stats(m, p, post_types) for m in METRIC_COLUMNS} for p in box_platforms}
+            box_platforms = [p for p in box_platforms if per_platform[p]['likes'] is not None]
+            box_stats = {m: [per_platform[p][m] for p in box_platforms] for m in METRIC_COLUMNS}
+        elif data_mode == 'streaming':
+            # Quartiles and fences from the streamed quantile sketches
+            sketches = {m: {p: aggregates.sketch(m, [p], post_types) for p in box_platforms} for m in METRIC_COLUMNS}
+            box_platforms = [p for p in box_platforms if sketches['likes'][p].n > 0]
+            box_stats = {m: [sketches[m][p].box_stats() for p in box_platforms] for m in METRIC_COLUMNS}
+        else:
+            # Exact quartiles, fences and a capped outlier sample per platform
+            box_platforms, box_stats = platform_box_stats(df, filtered_rows, box_platforms, METRIC_COLUMNS)
+        
+        return box_figure(box_platforms, box_stats, **BOX_CHART)
     
-    fig_box = px.box(
-        box_plot_data,
-        x='platform',
-        y='count',
-        color='metric',
-        title='Distribusi Metrik Engagement per Platform',
-        labels={'platform': 'Platform', 'count': 'Jumlah', 'metric': 'Metrik'}
-    )
-    st.plotly_chart(fig_box, width='stretch')
+    with profiler.stage('visualisasi_6', rows=n_filtered, cached=True):
+        st.plotly_chart(cached_figure('box', build_box_chart), width='stretch')
     
-    st.markdown("""
-    **Insight 6:**
-    Box plot ini menunjukkan distribusi metrik engagement (likes, comments, shares) untuk setiap platform.
-    Visualisasi ini membantu memahami sebaran data, median, serta adanya outlier pada masing-masing platform.
-    Kita dapat melihat platform mana yang memiliki distribusi engagement lebih tinggi secara keseluruhan.
-    """)
+    st.markdown(sections['visualisasi_6'].insight)
+    
+    # Sentiment breakdown: answered from the sentiment cube, so filters never rescan rows
+    if sentiment is not None:
+        st.header("Analisis Sentimen: Engagement per Sentimen")
+        
+        with profiler.stage('sentimen', rows=n_filtered, cached=True):
+            st.plotly_chart(
+                cached_figure('sentiment_bar', lambda: sentiment_bar_figure(sentiment.by_sentiment(platforms, post_types))),
+                width='stretch'
+            )
+            heatmap_metric = st.selectbox("Metrik heatmap sentimen:", METRIC_COLUMNS)
+            st.plotly_chart(
+                cached_figure(
+                    ('sentiment_heatmap', heatmap_metric),
+                    lambda: sentiment_heatmap_figure(sentiment.breakdown(platforms, post_types), heatmap_metric)
+                ),
+                width='stretch'
+            )
+            st.plotly_chart(
+                cached_figure('sentiment_mix', lambda: sentiment_mix_figure(sentiment.weekly_mix(platforms, post_types))),
+                width='stretch'
+            )
+        
+        st.markdown("""
+        **Insight Sentimen:**
+        Bagian ini membandingkan rata-rata likes, comments, dan shares antara postingan bersentimen positif, netral, dan negatif,
+        dirinci per platform dan jenis postingan dalam heatmap skema warna biru (Blues).
+        Grafik komposisi mingguan menunjukkan apakah porsi sentimen bergeser dari waktu ke waktu.
+        """)
+    
+    # Best time to post: hour x day-of-week heatmap per platform from the posting-time cube
+    if posting_time is not None:
+        st.header("Waktu Posting Terbaik: Engagement per Jam dan Hari")
+        
+        time_metric = st.selectbox("Metrik heatmap waktu posting:", METRIC_COLUMNS)
+        with profiler.stage('waktu_posting', rows=n_filtered, cached=True):
+            st.plotly_chart(
+                cached_figure(
+                    ('posting_time', time_metric),
+                    lambda: posting_time_figure(posting_time.by_platform(time_metric, platforms, post_types), time_metric)
+                ),
+                width='stretch'
+            )
+        
+        st.markdown("""
+        **Insight Waktu Posting:**
+        Heatmap ini menunjukkan rata-rata engagement untuk setiap kombinasi jam (sumbu horizontal) dan hari (sumbu vertikal),
+        dipisah per platform dalam skema warna biru (Blues) yang semakin pekat untuk nilai yang lebih tinggi.
+        Sel yang paling gelap menandai waktu posting dengan engagement tertinggi; arahkan kursor untuk melihat jumlah postingan di balik setiap rata-rata.
+        """)
+    
+    # Leaderboard: top posts and percentiles for the current filters
+    if leaderboard is not None:
+        st.header("Leaderboard Postingan")
+        
+        metric = st.selectbox("Urutkan berdasarkan:", METRIC_COLUMNS)
+        with profiler.stage('leaderboard', rows=n_filtered):
+            _, top_rows = leaderboard.top_k(metric, platforms, post_types)
+            percentiles = leaderboard.percentile_table(platforms, post_types)
+        
+        col1, col2 = st.columns([2, 1])
+        with col1:
+            st.subheader(f"Top {leaderboard.k} Postingan ({metric})")
+            st.dataframe(df.iloc[top_rows].reset_index(drop=True))
+        with col2:
+            st.subheader("Persentil Metrik")
+            st.dataframe(percentiles)
+    
+    cache_stats = figure_cache.stats()
+    st.sidebar.caption(
+        f"Figure cache: {cache_stats['hits']} hit / {cache_stats['misses']} miss, "
+        f"{cache_stats['entries']} figure ({cache_stats['bytes'] / 1024:.0f} KB)"
+    )
+    profiler.render()
 
 
 
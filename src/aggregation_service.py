@@ -0,0 +1,321 @@
+"""
+Layanan agregasi lokal yang dipakai bersama oleh semua sesi Streamlit
+Satu proses memegang dataset engagement (frame, cube, filter index) dan menjawab
+query agregat lewat HTTP dari cache hasil bersama; query identik yang datang
+bersamaan hanya dihitung sekali. Jalankan dengan: python -m src.aggregation_service
+"""
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import OrderedDict
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+
+from config.config import ServiceConfig
+from src.boxstats import MAX_OUTLIERS, sorted_box_stats
+from src.cube import build_cube
+from src.filter_index import build_filter_index
+from src.loader import METRIC_COLUMNS, apply_schema, dataset_signature, discover_partitions, load_partitions
+
+
+def _jsonable(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialise {type(value).__name__}")
+
+
+def encode(payload):
+    return json.dumps(payload, default=_jsonable).encode()
+
+
+class ResultCache:
+    """LRU hasil terserialisasi dengan penggabungan (coalescing) query yang sedang dihitung"""
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._entries = OrderedDict()
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key, compute):
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return payload
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+                self.misses += 1
+            else:
+                self.coalesced += 1
+        if not owner:
+            return future.result()
+
+        try:
+            payload = compute()
+        except BaseException as exc:
+            with self._lock:
+                del self._inflight[key]
+            future.set_exception(exc)
+            raise
+        with self._lock:
+            del self._inflight[key]
+            self._entries[key] = payload
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        future.set_result(payload)
+        return payload
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'coalesced': self.coalesced,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+            }
+
+
+def _frame_payload(df):
+    index = df.index
+    if pd.api.types.is_datetime64_any_dtype(index):
+        index = index.strftime('%Y-%m-%d')
+    return {
+        'index_name': df.index.name,
+        'index': list(index),
+        'columns': {col: df[col].to_numpy() for col in df.columns},
+    }
+
+
+class AggregationService:
+    """
+    Dataset engagement in-memory beserta operasi agregat yang bisa di-query.
+    Kontrak sama dengan SqliteEngagementStore; dataset dimuat ulang jika partisi berubah.
+    """
+
+    OPERATIONS = ['distinct', 'count', 'preview', 'mean', 'total', 'histogram', 'box_stats']
+
+    def __init__(self, data_dir=None, cache_entries=None, rescan_seconds=None):
+        self.data_dir = data_dir
+        self.cache = ResultCache(cache_entries or ServiceConfig.CACHE_ENTRIES)
+        self.rescan_seconds = ServiceConfig.RESCAN_SECONDS if rescan_seconds is None else rescan_seconds
+        self.last_scan = None
+        self._lock = threading.Lock()
+        self._state = None
+        self.current()
+
+    def current(self):
+        """
+        State (signature, df, cube, filter_index). Partisi dipindai ulang paling sering tiap
+        `rescan_seconds`; di antaranya query memakai state terakhir tanpa menyentuh disk.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._state is not None and now - self.last_scan < self.rescan_seconds:
+                return self._state
+            # One thread scans per interval; concurrent queries wait for it instead of rescanning
+            signature = dataset_signature(discover_partitions(self.data_dir))
+            self.last_scan = now
+            if self._state is None or self._state[0] != signature:
+                df = load_partitions([s[0] for s in signature])
+                self._state = (signature, df, build_cube(df), build_filter_index(df))
+            return self._state
+
+    def query(self, op, args):
+        """Payload JSON untuk operasi `op`; hasil di-cache per (versi dataset, op, argumen)"""
+        if op not in self.OPERATIONS:
+            raise ValueError(f"Unknown operation: {op}")
+        state = self.current()
+        for name in ['platforms', 'post_types']:
+            if args.get(name) is not None:
+                args[name] = sorted(map(str, args[name]))
+        key = (state[0], op, json.dumps(args, sort_keys=True))
+        return self.cache.get_or_compute(key, lambda: encode(getattr(self, f'_{op}')(state, **args)))
+
+    def signature(self):
+        signature, df = self.current()[:2]
+        return encode({'signature': signature, 'shape': df.shape})
+
+    @staticmethod
+    def _rows(state, platforms=None, post_types=None):
+        return state[3].select(platform=platforms, post_type=post_types)
+
+    def _distinct(self, state, col):
+        return list(state[3].values[col]) if col in state[3].values else list(map(str, state[1][col].unique()))
+
+    def _count(self, state, platforms=None, post_types=None):
+        return state[3].count(platform=platforms, post_type=post_types)
+
+    def _preview(self, state, platforms=None, post_types=None, n=5):
+        rows = state[1].iloc[self._rows(state, platforms, post_types)[:int(n)]]
+        rows = rows.assign(post_time=rows['post_time'].dt.strftime('%Y-%m-%d %H:%M:%S'))
+        return {'columns': list(rows.columns), 'data': rows.astype(object).to_numpy().tolist()}
+
+    def _mean(self, state, by, platforms=None, post_types=None):
+        return _frame_payload(state[2].mean(by, platforms, post_types))
+
+    def _total(self, state, by, platforms=None, post_types=None):
+        return _frame_payload(state[2].total(by, platforms, post_types))
+
+    def _histogram(self, state, metric, platforms=None, post_types=None, bins=20):
+        counts, edges = np.histogram(state[1][metric].to_numpy()[self._rows(state, platforms, post_types)], bins=bins)
+        return {'counts': counts, 'edges': edges}
+
+    def _box_stats(self, state, metric, platform, post_types=None, max_outliers=MAX_OUTLIERS):
+        values = state[1][metric].to_numpy()[self._rows(state, [platform], post_types)]
+        if not len(values):
+            return None
+        return sorted_box_stats(np.sort(values), max_outliers)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    service = None
+
+    def _send(self, status, payload):
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _send_internal_error(self, exc):
+        # Anything unexpected (e.g. a partition that fails to load) still gets a JSON answer
+        self._send(500, encode({'error': f"{type(exc).__name__}: {exc}"}))
+
+    def do_GET(self):
+        if self.path == '/signature':
+            try:
+                payload = self.service.signature()
+            except Exception as exc:
+                self._send_internal_error(exc)
+                return
+            self._send(200, payload)
+        elif self.path == '/stats':
+            self._send(200, encode(self.service.cache.stats()))
+        else:
+            self._send(404, encode({'error': f"Not found: {self.path}"}))
+
+    def do_POST(self):
+        if self.path != '/query':
+            self._send(404, encode({'error': f"Not found: {self.path}"}))
+            return
+        try:
+            request = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+            payload = self.service.query(request['op'], request.get('args', {}))
+        except (KeyError, TypeError, ValueError) as exc:
+            self._send(400, encode({'error': str(exc)}))
+            return
+        except Exception as exc:
+            self._send_internal_error(exc)
+            return
+        self._send(200, payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(host=None, port=None, data_dir=None):
+    """Muat dataset lalu layani query sampai proses dihentikan"""
+    handler = type('Handler', (_Handler,), {'service': AggregationService(data_dir)})
+    server = ThreadingHTTPServer((host or ServiceConfig.HOST, port or ServiceConfig.PORT), handler)
+    print(f"Aggregation service listening on http://{server.server_address[0]}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+
+
+class AggregationClient:
+    """
+    Klien tipis untuk dashboard. mean()/total()/histogram()/box_stats() punya kontrak
+    yang sama dengan SqliteEngagementStore sehingga dashboard memakai keduanya bergantian.
+    """
+
+    def __init__(self, url=None, timeout=None):
+        self.url = (url or ServiceConfig.URL).rstrip('/')
+        self.timeout = timeout or ServiceConfig.TIMEOUT_SECONDS
+
+    def _request(self, path, body=None):
+        data = None if body is None else json.dumps(body).encode()
+        request = urllib.request.Request(self.url + path, data=data, headers={'Content-Type': 'application/json'})
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return json.loads(response.read())
+        except urllib.error.HTTPError as exc:
+            raise RuntimeError(f"Aggregation service error: {json.loads(exc.read()).get('error')}") from exc
+
+    def _query(self, op, **args):
+        return self._request('/query', {'op': op, 'args': args})
+
+    def signature(self):
+        """Versi dataset di server (untuk key cache figure) dan shape-nya"""
+        info = self._request('/signature')
+        self.shape = tuple(info['shape'])
+        self.n_rows = self.shape[0]
+        return tuple(tuple(s) for s in info['signature'])
+
+    @staticmethod
+    def _selection(platforms, post_types):
+        return {
+            'platforms': None if platforms is None else [str(p) for p in platforms],
+            'post_types': None if post_types is None else [str(p) for p in post_types],
+        }
+
+    def distinct(self, col):
+        return self._query('distinct', col=col)
+
+    def count(self, platforms=None, post_types=None):
+        return self._query('count', **self._selection(platforms, post_types))
+
+    def preview(self, platforms=None, post_types=None, n=5):
+        payload = self._query('preview', n=n, **self._selection(platforms, post_types))
+        df = pd.DataFrame(payload['data'], columns=payload['columns'])
+        df['post_time'] = pd.to_datetime(df['post_time'])
+        return apply_schema(df)
+
+    def _frame(self, op, by, platforms, post_types):
+        payload = self._query(op, by=by, **self._selection(platforms, post_types))
+        index = pd.Index(payload['index'], name=payload['index_name'])
+        if by == 'date':
+            index = pd.to_datetime(index)
+        return pd.DataFrame({m: payload['columns'][m] for m in METRIC_COLUMNS}, index=index)
+
+    def mean(self, by, platforms=None, post_types=None):
+        return self._frame('mean', by, platforms, post_types).astype(float)
+
+    def total(self, by, platforms=None, post_types=None):
+        return self._frame('total', by, platforms, post_types).astype(np.int64)
+
+    def histogram(self, metric, platforms=None, post_types=None, bins=20):
+        payload = self._query('histogram', metric=metric, bins=bins, **self._selection(platforms, post_types))
+        return np.array(payload['counts'], dtype=np.int64), np.array(payload['edges'])
+
+    def box_stats(self, metric, platform, post_types=None, max_outliers=MAX_OUTLIERS):
+        payload = self._query(
+            'box_stats', metric=metric, platform=str(platform), max_outliers=max_outliers,
+            post_types=self._selection(None, post_types)['post_types']
+        )
+        if payload is None:
+            return None
+        payload['outliers'] = np.array(payload['outliers'])
+        return payload
+
+
+if __name__ == '__main__':
+    serve()
@@ -0,0 +1,292 @@
+"""
+Benchmark headless untuk pipeline dashboard Social Media Engagement
+Dataset sintetis (src.synthetic) dijalankan melalui stage load, filter, agregasi, dan
+pembangunan figure tanpa server Streamlit; tiap stage mencatat wall time, RSS puncak,
+dan ukuran JSON figure. Hasil disimpan sebagai JSON agar bisa dibandingkan antar versi.
+Mode --startup mengukur waktu import tiap entry point dashboard (python -X importtime)
+terhadap BenchmarkConfig.STARTUP_BUDGET_MS.
+
+    python -m src.benchmark --rows 1e3 1e4 1e5 1e6
+    python -m src.benchmark --compare database/benchmarks/a.json database/benchmarks/b.json
+    python -m src.benchmark --startup
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from config.config import BenchmarkConfig, DataConfig
+from src.boxstats import box_figure, platform_box_stats
+from src.charts import BOX_CHART, ENGAGEMENT_CHARTS, ChartSet
+from src.cube import build_cube
+from src.filter_index import build_filter_index
+from src.loader import METRIC_COLUMNS, load_partitions, project_path
+from src.profiling import rss_bytes
+from src.streaming import stream_engagement
+from src.synthetic import write_engagement_csv
+
+DEFAULT_ROWS = [1e3, 1e4, 1e5, 1e6]
+ENTRY_POINTS = ['dashboard_social_media_engagement', 'dashboard_covid19_united_states_view']
+# Filter state applied in every run, mirroring a typical sidebar selection
+SELECTION = {'platforms': ['Instagram'], 'post_types': ['image', 'video']}
+
+
+class StageTimer:
+    """Catat wall time dan RSS puncak (disampling di thread terpisah) per stage"""
+
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.records = []
+
+    @contextmanager
+    def stage(self, name, **extra):
+        peak = [rss_bytes()]
+        done = threading.Event()
+
+        def sample():
+            while not done.wait(self.interval):
+                peak[0] = max(peak[0], rss_bytes())
+
+        sampler = threading.Thread(target=sample, daemon=True)
+        sampler.start()
+        record = {'stage': name, **extra}
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record['seconds'] = time.perf_counter() - start
+            done.set()
+            sampler.join()
+            record['peak_rss_mb'] = max(peak[0], rss_bytes()) / 2 ** 20
+            self.records.append(record)
+
+
+def run_size(n_rows, data_dir, seed=0):
+    """Jalankan semua stage untuk satu ukuran dataset; return list record per stage"""
+    timer = StageTimer()
+    csv_path = Path(data_dir) / f'engagement-{n_rows}-seed{seed}.csv'
+    if not csv_path.exists():
+        with timer.stage('generate'):
+            write_engagement_csv(csv_path, n_rows, seed=seed)
+    platforms, post_types = SELECTION['platforms'], SELECTION['post_types']
+    streaming = csv_path.stat().st_size > DataConfig.STREAMING_THRESHOLD_MB * 1024 * 1024
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        if streaming:
+            # Same switch as the dashboard: files over the threshold are streamed
+            with timer.stage('stream'):
+                aggregates = stream_engagement([csv_path])
+            source = aggregates.cube
+
+            def histograms(metrics):
+                return {m: aggregates.histogram(m, platforms, post_types) for m in metrics}
+
+            def box_stats():
+                sketches = {m: {p: aggregates.sketch(m, [p], post_types) for p in platforms} for m in METRIC_COLUMNS}
+                kept = [p for p in platforms if sketches['likes'][p].n > 0]
+                return kept, {m: [sketches[m][p].box_stats() for p in kept] for m in METRIC_COLUMNS}
+        else:
+            with timer.stage('load_cold'):
+                load_partitions([csv_path], cache_dir=cache_dir)
+            with timer.stage('load_warm') as record:
+                df = load_partitions([csv_path], cache_dir=cache_dir)
+                record['frame_mb'] = df.memory_usage(deep=True).sum() / 2 ** 20
+            with timer.stage('build_cube'):
+                source = build_cube(df)
+            with timer.stage('build_filter_index'):
+                filter_index = build_filter_index(df)
+            with timer.stage('filter'):
+                rows = filter_index.select(platform=platforms, post_type=post_types)
+
+            def histograms(metrics):
+                return {m: np.histogram(df[m].to_numpy()[rows], bins=20) for m in metrics}
+
+            def box_stats():
+                return platform_box_stats(df, rows, platforms, METRIC_COLUMNS)
+
+        with timer.stage('aggregate'):
+            charts = ChartSet(ENGAGEMENT_CHARTS, source, histograms, platforms, post_types)
+            for spec in ENGAGEMENT_CHARTS:
+                if spec.agg == 'histogram':
+                    charts.histogram(spec.metrics[0])
+                else:
+                    charts.frame(spec.agg, spec.by)
+            box_platforms, box = box_stats()
+        with timer.stage('figures') as record:
+            figures = [charts.figure(spec.chart_id) for spec in ENGAGEMENT_CHARTS]
+            figures.append(box_figure(box_platforms, box, **BOX_CHART))
+            # Streamlit ships figures as JSON, so serialisation is part of the cost
+            record['json_bytes'] = sum(len(fig.to_json()) for fig in figures)
+            record['figures'] = len(figures)
+
+    for record in timer.records:
+        record['rows'] = n_rows
+        record['mode'] = 'streaming' if streaming else 'memory'
+    return timer.records
+
+
+def _version_label():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True,
+            cwd=project_path('.')
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'local'
+
+
+def run_benchmark(rows=DEFAULT_ROWS, seed=0, label=None, output_dir=None):
+    """Jalankan benchmark untuk setiap ukuran (masing-masing di proses baru) dan simpan hasil"""
+    output_dir = project_path(output_dir or BenchmarkConfig.RESULTS_DIR)
+    data_dir = output_dir / 'data'
+    records = []
+    for n_rows in rows:
+        # A fresh process per size keeps peak RSS from leaking between sizes
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            records += pool.submit(run_size, int(n_rows), data_dir, seed).result()
+
+    result = {
+        'label': label or _version_label(),
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': sys.version.split()[0],
+        'pandas': pd.__version__,
+        'cpu_count': os.cpu_count(),
+        'records': records,
+    }
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = output_dir / f"{time.strftime('%Y%m%d-%H%M%S')}-{result['label']}.json"
+    path.write_text(json.dumps(result, indent=2))
+    return path, result
+
+
+def parse_importtime(stderr):
+    """Baris `-X importtime` menjadi list (nama modul, kedalaman, self us, cumulative us)"""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        imports.append((name.strip(), depth, int(self_us), int(cumulative_us)))
+    return imports
+
+
+def measure_startup(module, repeats=None, top=8):
+    """
+    Import `module` di proses baru sebanyak `repeats` kali; waktu import = median cumulative
+    modul tersebut. `top_imports` = import langsung termahal dari run median.
+    """
+    repeats = repeats or BenchmarkConfig.STARTUP_REPEATS
+    runs = []
+    for _ in range(repeats):
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+            capture_output=True, text=True, check=True, cwd=project_path('.')
+        )
+        imports = parse_importtime(proc.stderr)
+        total = next(cumulative for name, depth, _, cumulative in imports if name == module and depth == 0)
+        runs.append((total, imports))
+    runs.sort(key=lambda run: run[0])
+    total, imports = runs[len(runs) // 2]
+    children = sorted((i for i in imports if i[1] == 1), key=lambda i: -i[3])[:top]
+    return {
+        'entry_point': module,
+        'import_ms': total / 1000,
+        'runs_ms': [run[0] / 1000 for run in runs],
+        'stdev_ms': statistics.pstdev(run[0] / 1000 for run in runs),
+        'budget_ms': BenchmarkConfig.STARTUP_BUDGET_MS,
+        'within_budget': total / 1000 <= BenchmarkConfig.STARTUP_BUDGET_MS,
+        'top_imports': [[name, cumulative / 1000] for name, _, _, cumulative in children],
+    }
+
+
+def run_startup(label=None, output_dir=None, repeats=None):
+    """Ukur waktu import semua ENTRY_POINTS dan simpan hasil JSON"""
+    result = {
+        'label': label or _version_label(),
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': sys.version.split()[0],
+        'startup': [measure_startup(module, repeats) for module in ENTRY_POINTS],
+    }
+    output_dir = project_path(output_dir or BenchmarkConfig.RESULTS_DIR)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = output_dir / f"{time.strftime('%Y%m%d-%H%M%S')}-{result['label']}-startup.json"
+    path.write_text(json.dumps(result, indent=2))
+    return path, result
+
+
+def format_startup(records):
+    lines = []
+    for r in records:
+        status = 'OK' if r['within_budget'] else 'OVER BUDGET'
+        lines.append(f"{r['entry_point']}: {r['import_ms']:.0f} ms (budget {r['budget_ms']} ms) {status}")
+        lines += [f"    {name:<40}{ms:>10.1f} ms" for name, ms in r['top_imports']]
+    return '\n'.join(lines)
+
+
+def format_records(records):
+    lines = [f"{'rows':>11}  {'stage':<20}{'seconds':>10}{'peak MB':>10}{'JSON KB':>10}"]
+    for r in records:
+        json_kb = f"{r['json_bytes'] / 1024:.1f}" if 'json_bytes' in r else '-'
+        lines.append(f"{r['rows']:>11,}  {r['stage']:<20}{r['seconds']:>10.3f}{r['peak_rss_mb']:>10.1f}{json_kb:>10}")
+    return '\n'.join(lines)
+
+
+def compare(baseline_path, candidate_path):
+    """Tabel perbandingan per (rows, stage): waktu dan RSS puncak baseline vs kandidat"""
+    baseline, candidate = (json.loads(Path(p).read_text()) for p in (baseline_path, candidate_path))
+    before = {(r['rows'], r['stage']): r for r in baseline['records']}
+    lines = [
+        f"{baseline['label']} -> {candidate['label']}",
+        f"{'rows':>11}  {'stage':<20}{'before s':>10}{'after s':>10}{'ratio':>8}{'before MB':>11}{'after MB':>10}",
+    ]
+    for r in candidate['records']:
+        b = before.get((r['rows'], r['stage']))
+        if b is None:
+            continue
+        ratio = r['seconds'] / b['seconds'] if b['seconds'] else float('nan')
+        lines.append(
+            f"{r['rows']:>11,}  {r['stage']:<20}{b['seconds']:>10.3f}{r['seconds']:>10.3f}{ratio:>8.2f}"
+            f"{b['peak_rss_mb']:>11.1f}{r['peak_rss_mb']:>10.1f}"
+        )
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', nargs='+', type=float, default=DEFAULT_ROWS, help='dataset sizes, e.g. 1e3 1e6')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--label', help='name for this run (default: git short hash)')
+    parser.add_argument('--output-dir', help=f'default: {BenchmarkConfig.RESULTS_DIR}')
+    parser.add_argument('--compare', nargs=2, metavar=('BASELINE', 'CANDIDATE'), help='diff two result files')
+    parser.add_argument('--startup', action='store_true', help='measure dashboard import time instead')
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        print(compare(*args.compare))
+        return
+    if args.startup:
+        path, result = run_startup(args.label, args.output_dir)
+        print(format_startup(result['startup']))
+        print(f"\nResults written to {path}")
+        if not all(r['within_budget'] for r in result['startup']):
+            sys.exit(1)
+        return
+    path, result = run_benchmark(args.rows, args.seed, args.label, args.output_dir)
+    print(format_records(result['records']))
+    print(f"\nResults written to {path}")
+
+
+if __name__ == '__main__':
+    main()
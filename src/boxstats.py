@@ -0,0 +1,136 @@
+"""
+Statistik box plot yang dihitung di server untuk Visualisasi 6
+Kuartil, pagar Tukey, dan sampel outlier terbatas dihitung dengan NumPy
+sehingga figure hanya membawa beberapa angka per box, bukan setiap baris.
+"""
+import numpy as np
+import plotly.graph_objects as go
+
+MAX_OUTLIERS = 50
+STAT_KEYS = ['q1', 'median', 'q3', 'lowerfence', 'upperfence']
+
+
+def _sorted_quantile(sorted_values, q):
+    """Kuantil linear (seperti np.quantile / plotly quartilemethod='linear') dari array terurut"""
+    rank = np.asarray(q, dtype=float) * (len(sorted_values) - 1)
+    lower = np.floor(rank).astype(int)
+    upper = np.ceil(rank).astype(int)
+    lo, hi = sorted_values[lower], sorted_values[upper]
+    return lo + (rank - lower) * (hi - lo)
+
+
+def sorted_box_stats(sorted_values, max_outliers=MAX_OUTLIERS):
+    """Statistik box dari array nilai yang sudah terurut"""
+    q1, median, q3 = _sorted_quantile(sorted_values, [0.25, 0.5, 0.75])
+    iqr = q3 - q1
+    # Fences are the most extreme observations inside 1.5 IQR, as plotly draws them
+    lo_idx = np.searchsorted(sorted_values, q1 - 1.5 * iqr, side='left')
+    hi_idx = np.searchsorted(sorted_values, q3 + 1.5 * iqr, side='right')
+    outliers = np.concatenate([sorted_values[:lo_idx], sorted_values[hi_idx:]])
+    if len(outliers) > max_outliers:
+        # Evenly spaced picks keep both extremes while capping the payload
+        outliers = outliers[np.linspace(0, len(outliers) - 1, max_outliers).astype(int)]
+    return {
+        'q1': q1,
+        'median': median,
+        'q3': q3,
+        'lowerfence': sorted_values[lo_idx],
+        'upperfence': sorted_values[hi_idx - 1],
+        'outliers': outliers,
+    }
+
+
+def frequency_quantile(values, counts, q):
+    """Kuantil linear (seperti np.quantile) dari tabel frekuensi `values` unik terurut"""
+    values = np.asarray(values)
+    cumulative = np.cumsum(counts)
+
+    def order_statistic(k):
+        return values[np.searchsorted(cumulative, k, side='right')]
+
+    rank = np.asarray(q, dtype=float) * (cumulative[-1] - 1)
+    lower, upper = np.floor(rank), np.ceil(rank)
+    lo, hi = order_statistic(lower), order_statistic(upper)
+    return lo + (rank - lower) * (hi - lo)
+
+
+def frequency_box_stats(values, counts, max_outliers=MAX_OUTLIERS):
+    """
+    Statistik box dari tabel frekuensi: `values` unik terurut dan jumlah
+    kemunculannya (mis. hasil GROUP BY di database). Hasil sama persis dengan
+    sorted_box_stats atas data yang sudah diekspansi.
+    """
+    values = np.asarray(values)
+    counts = np.asarray(counts)
+    q1, median, q3 = frequency_quantile(values, counts, [0.25, 0.5, 0.75])
+    iqr = q3 - q1
+    lo_idx = np.searchsorted(values, q1 - 1.5 * iqr, side='left')
+    hi_idx = np.searchsorted(values, q3 + 1.5 * iqr, side='right')
+
+    outlier_values = np.concatenate([values[:lo_idx], values[hi_idx:]])
+    outlier_counts = np.cumsum(np.concatenate([counts[:lo_idx], counts[hi_idx:]]))
+    n_outliers = int(outlier_counts[-1]) if len(outlier_counts) else 0
+    picks = np.linspace(0, n_outliers - 1, min(n_outliers, max_outliers)).astype(int)
+    return {
+        'q1': q1,
+        'median': median,
+        'q3': q3,
+        'lowerfence': values[lo_idx],
+        'upperfence': values[hi_idx - 1],
+        'outliers': outlier_values[np.searchsorted(outlier_counts, picks, side='right')],
+    }
+
+
+def grouped_box_stats(codes, values, max_outliers=MAX_OUTLIERS):
+    """
+    Statistik box per kode grup dengan satu kali sort (kode, nilai).
+    Return dict {kode: stats}; grup tanpa baris tidak muncul.
+    """
+    codes = np.asarray(codes)
+    values = np.asarray(values)
+    order = np.lexsort((values, codes))
+    codes, values = codes[order], values[order]
+    bounds = np.flatnonzero(np.diff(codes)) + 1
+    starts = np.concatenate([[0], bounds])
+    stops = np.concatenate([bounds, [len(codes)]])
+    return {
+        codes[start]: sorted_box_stats(values[start:stop], max_outliers)
+        for start, stop in zip(starts, stops) if stop > start
+    }
+
+
+def box_figure(categories, stats_by_trace, title=None, labels=None):
+    """
+    Bangun go.Figure berisi box precomputed per trace.
+    `stats_by_trace` = {nama_trace: [stats per kategori]}; stats boleh tanpa 'outliers'.
+    """
+    labels = labels or {}
+    fig = go.Figure()
+    for name, stats in stats_by_trace.items():
+        fig.add_trace(go.Box(
+            name=name,
+            x=list(categories),
+            y=[list(s.get('outliers', [])) for s in stats],
+            boxpoints='outliers',
+            **{key: [float(s[key]) for s in stats] for key in STAT_KEYS}
+        ))
+    fig.update_layout(
+        title=title,
+        xaxis_title=labels.get('x'),
+        yaxis_title=labels.get('y'),
+        legend_title_text=labels.get('legend'),
+        boxmode='group'
+    )
+    return fig
+
+
+def platform_box_stats(df, rows, platforms, metrics):
+    """
+    Statistik box per platform untuk baris `rows` (posisi) di frame bertipe.
+    Return (platform yang berisi data, urut seperti `platforms`; {metric: [stats per platform]}).
+    """
+    platform_codes = df['platform'].cat.codes.to_numpy()[rows]
+    code_of = {p: i for i, p in enumerate(df['platform'].cat.categories)}
+    per_metric = {m: grouped_box_stats(platform_codes, df[m].to_numpy()[rows]) for m in metrics}
+    platforms = [p for p in platforms if code_of.get(p) in per_metric[metrics[0]]]
+    return platforms, {m: [per_metric[m][code_of[p]] for p in platforms] for m in metrics}
@@ -0,0 +1,276 @@
+"""
+Lapisan chart-spec untuk dashboard Social Media Engagement
+Setiap visualisasi dideklarasikan sebagai data (metrik, dimensi grouping, agregasi,
+palet); ChartSet menghitung semua agregat yang dibutuhkan untuk satu state filter
+dalam satu pass, lalu figure dibangun dari hasil tersebut. Judul dan insight tiap
+bagian (Section) juga dideklarasikan di sini agar dashboard dan snapshot statis sama.
+"""
+import numpy as np
+import plotly.graph_objects as go
+
+from src.colors import blues_hex
+from src.cube import rollup_mean, rollup_total
+from src.downsample import downsample_frame
+from src.loader import DAY_ORDER, METRIC_COLUMNS
+
+PALETTES = {'Blues': blues_hex}
+ROLLUP_AGGREGATES = {'mean': rollup_mean, 'total': rollup_total}
+
+
+class ChartSpec:
+    """
+    Deklarasi satu chart.
+    kind: 'bar' | 'line' | 'histogram'; agg: 'mean' | 'total' | 'histogram';
+    by: dimensi cube ('platform', 'post_type', 'post_day', 'date'), None untuk histogram.
+    trace_name boleh memakai {metric} dan {label} (nama metrik berhuruf kapital).
+    """
+
+    def __init__(self, chart_id, kind, agg, metrics, by=None, trace_name='{metric}',
+                 order=None, palette='Blues', layout=None):
+        self.chart_id = chart_id
+        self.kind = kind
+        self.agg = agg
+        self.metrics = list(metrics)
+        self.by = by
+        self.trace_name = trace_name
+        self.order = order
+        self.palette = palette
+        self.layout = layout or {}
+
+
+class ChartSet:
+    """
+    Kumpulan ChartSpec untuk satu state filter.
+    `source` adalah EngagementCube atau store dengan kontrak mean()/total() yang sama;
+    `histograms(metrics)` mengembalikan {metric: (counts, edges)} dalam satu pass.
+    """
+
+    def __init__(self, specs, source, histograms, platforms=None, post_types=None):
+        self.specs = {spec.chart_id: spec for spec in specs}
+        self.source = source
+        self.histograms = histograms
+        self.platforms = platforms
+        self.post_types = post_types
+        self._frames = None
+        self._histograms = None
+
+    def _compute_frames(self):
+        """Semua frame mean/total yang dibutuhkan specs, dihitung sekali untuk state filter ini"""
+        needed = {(s.agg, s.by) for s in self.specs.values() if s.agg in ROLLUP_AGGREGATES}
+        bys = sorted({by for _, by in needed})
+        if hasattr(self.source, 'rollups'):
+            # One cell selection, one rollup per dimension; mean and total share it
+            rolled = self.source.rollups(bys, self.platforms, self.post_types)
+            self._frames = {(agg, by): ROLLUP_AGGREGATES[agg](rolled[by]) for agg, by in needed}
+        else:
+            self._frames = {
+                (agg, by): getattr(self.source, agg)(by, self.platforms, self.post_types)
+                for agg, by in needed
+            }
+
+    def frame(self, agg, by):
+        """Frame agregat (index = nilai `by`, kolom = metrik) dari pass bersama"""
+        if self._frames is None:
+            self._compute_frames()
+        return self._frames[(agg, by)]
+
+    def histogram(self, metric):
+        """(counts, edges) histogram `metric`; semua histogram specs dihitung bersama"""
+        if self._histograms is None:
+            metrics = [m for s in self.specs.values() if s.agg == 'histogram' for m in s.metrics]
+            self._histograms = self.histograms(list(dict.fromkeys(metrics)))
+        return self._histograms[metric]
+
+    def figure(self, chart_id, date_range=None):
+        """Bangun figure untuk `chart_id`; seri tanggal bisa dibatasi ke `date_range`"""
+        spec = self.specs[chart_id]
+        palette = PALETTES[spec.palette]
+        fig = go.Figure()
+
+        if spec.kind == 'histogram':
+            for metric in spec.metrics:
+                counts, edges = self.histogram(metric)
+                fig.add_trace(go.Bar(
+                    x=edges[:-1],
+                    y=counts,
+                    marker_color=palette(counts),
+                    width=np.diff(edges)[0]
+                ))
+            fig.update_layout(**spec.layout)
+            return fig
+
+        frame = self.frame(spec.agg, spec.by)
+        if spec.order is not None:
+            frame = frame.reindex(spec.order)
+        if date_range is not None:
+            frame = frame[frame.index.date >= date_range[0]]
+            frame = frame[frame.index.date <= date_range[1]]
+        # One normalisation across every trace of the chart keeps the colours comparable;
+        # a filter state without rows (or only missing days) leaves nothing to scale
+        values = frame[spec.metrics].to_numpy(dtype=float)
+        values = values[~np.isnan(values)]
+        vmin, vmax = (values.min(), values.max()) if values.size else (0.0, 0.0)
+
+        for metric in spec.metrics:
+            x, y = frame.index, frame[metric]
+            if spec.by == 'date':
+                # Date axes are downsampled to ChartConfig.MAX_POINTS per trace
+                series = downsample_frame(frame.reset_index(), 'date', metric)
+                x, y = series['date'].dt.strftime('%Y-%m-%d'), series[metric]
+            name = spec.trace_name.format(metric=metric, label=metric.capitalize())
+            if spec.kind == 'bar':
+                fig.add_trace(go.Bar(x=x, y=y, name=name, marker_color=palette(y, vmin, vmax)))
+            else:
+                fig.add_trace(go.Scatter(
+                    x=x,
+                    y=y,
+                    mode='lines+markers',
+                    name=name,
+                    line=dict(color=palette([frame[metric].max()], vmin, vmax)[0]),
+                    marker=dict(color=palette(y, vmin, vmax))
+                ))
+        fig.update_layout(**spec.layout)
+        return fig
+
+
+# Visualisasi 1-5 of the engagement dashboard, declared as data
+ENGAGEMENT_CHARTS = [
+    ChartSpec(
+        f'hist_{metric}', 'histogram', 'histogram', [metric],
+        layout=dict(
+            title=f"Distribusi Jumlah {metric.capitalize()}",
+            xaxis_title=f"Jumlah {metric.capitalize()}",
+            yaxis_title="Frekuensi"
+        )
+    )
+    for metric in METRIC_COLUMNS
+] + [
+    ChartSpec(
+        'platform', 'bar', 'mean', METRIC_COLUMNS, by='platform', trace_name='Rata-rata {label}',
+        layout=dict(
+            title="Perbandingan Rata-rata Metrik Engagement Berdasarkan Platform",
+            xaxis_title="Platform",
+            yaxis_title="Jumlah Rata-rata",
+            barmode='group'
+        )
+    ),
+    ChartSpec(
+        'post_type', 'bar', 'mean', METRIC_COLUMNS, by='post_type',
+        layout=dict(
+            title="Rata-rata Engagement Berdasarkan Jenis Postingan",
+            xaxis_title="Jenis Postingan",
+            yaxis_title="Jumlah Rata-rata",
+            barmode='group'
+        )
+    ),
+    ChartSpec(
+        'post_day', 'line', 'mean', METRIC_COLUMNS, by='post_day', trace_name='Rata-rata {label}',
+        order=DAY_ORDER,
+        layout=dict(
+            title="Tren Rata-rata Engagement Berdasarkan Hari dalam Seminggu",
+            xaxis_title="Hari dalam Seminggu",
+            yaxis_title="Jumlah Rata-rata",
+            hovermode='x unified'
+        )
+    ),
+    ChartSpec(
+        'daily', 'line', 'total', METRIC_COLUMNS, by='date', trace_name='Total {label} Harian',
+        layout=dict(
+            title="Tren Total Engagement Harian (Time Series)",
+            xaxis_title="Tanggal",
+            yaxis_title="Jumlah Total",
+            hovermode='x unified'
+        )
+    ),
+]
+
+
+class Section:
+    """Satu bagian dashboard: judul, chart yang ditampilkan, dan teks insight (markdown)"""
+
+    def __init__(self, section_id, title, chart_ids, insight):
+        self.section_id = section_id
+        self.title = title
+        self.chart_ids = list(chart_ids)
+        self.insight = insight
+
+
+# Visualisasi 6 is drawn from box statistics (src.boxstats) rather than a ChartSpec
+BOX_CHART = dict(
+    title='Distribusi Metrik Engagement per Platform',
+    labels={'x': 'Platform', 'y': 'Jumlah', 'legend': 'Metrik'}
+)
+
+# Sections 1-6 of the engagement dashboard, shared with the static snapshot export
+ENGAGEMENT_SECTIONS = [
+    Section(
+        'visualisasi_1',
+        "Visualisasi 1: Distribusi Metrik Engagement",
+        ['hist_likes', 'hist_comments', 'hist_shares'],
+        """\
+**Insight 1:**
+Distribusi metrik engagement menunjukkan bahwa sebagian besar postingan mendapatkan jumlah likes, comments, dan shares yang bervariasi.
+Dengan menggunakan histogram dengan warna biru (skala Blues) yang semakin pekat sesuai nilai frekuensi data, kita bisa melihat bagaimana penyebaran masing-masing metrik, apakah cenderung normal, skewed, atau memiliki outlier.
+Ini membantu kita memahami pola umum keterlibatan pengguna di platform media sosial.
+"""
+    ),
+    Section(
+        'visualisasi_2',
+        "Visualisasi 2: Perbandingan Kinerja Platform Media Sosial",
+        ['platform'],
+        """\
+**Insight 2:**
+Visualisasi ini menunjukkan perbedaan kinerja antar platform media sosial dalam hal engagement.
+Dengan menggunakan bar chart grouped dalam skema warna biru (Blues) yang konsisten dan semakin gelap untuk nilai yang lebih tinggi, kita bisa membandingkan rata-rata jumlah likes, comments, dan shares
+untuk setiap platform secara langsung. Ini membantu mengidentifikasi platform mana yang paling efektif
+dalam meningkatkan engagement pengguna.
+"""
+    ),
+    Section(
+        'visualisasi_3',
+        "Visualisasi 3: Efektivitas Jenis Postingan",
+        ['post_type'],
+        """\
+**Insight 3:**
+Grafik ini menunjukkan seberapa efektif berbagai jenis postingan (image, video, carousel, dll.) dalam
+menghasilkan engagement. Dengan memvisualisasikan data ini dalam bentuk grouped bar chart dengan skema warna biru (Blues) yang konsisten dan semakin gelap untuk nilai yang lebih tinggi,
+kita bisa melihat jenis konten mana yang paling banyak mendapatkan likes, comments, dan shares, sehingga bisa
+membantu dalam merancang strategi konten yang lebih efektif.
+"""
+    ),
+    Section(
+        'visualisasi_4',
+        "Visualisasi 4: Tren Engagement Berdasarkan Hari dalam Seminggu",
+        ['post_day'],
+        """\
+**Insight 4:**
+Visualisasi line chart ini menunjukkan tren engagement berdasarkan hari dalam seminggu.
+Dengan menggunakan line chart dalam skema warna biru (Blues) yang konsisten dan semakin gelap untuk nilai yang lebih tinggi,
+kita bisa mengamati pola engagement harian - kapan engagement tertinggi dan terendah terjadi.
+Ini sangat berguna untuk menentukan waktu optimal untuk memposting konten di media sosial.
+"""
+    ),
+    Section(
+        'visualisasi_5',
+        "Visualisasi 5: Tren Engagement Harian (Time Series)",
+        ['daily'],
+        """\
+**Insight 5:**
+Visualisasi time series ini menunjukkan tren engagement harian dari postingan media sosial.
+Dengan menggunakan line chart dalam skema warna biru (Blues) yang konsisten,
+kita bisa mengamati fluktuasi engagement harian sepanjang periode waktu yang tersedia dalam dataset.
+Ini membantu mengidentifikasi pola musiman atau periode puncak engagement.
+"""
+    ),
+    Section(
+        'visualisasi_6',
+        "Visualisasi 6: Box Plot - Distribusi Engagement per Platform",
+        ['box'],
+        """\
+**Insight 6:**
+Box plot ini menunjukkan distribusi metrik engagement (likes, comments, shares) untuk setiap platform.
+Visualisasi ini membantu memahami sebaran data, median, serta adanya outlier pada masing-masing platform.
+Kita dapat melihat platform mana yang memiliki distribusi engagement lebih tinggi secara keseluruhan.
+"""
+    ),
+]
@@ -0,0 +1,61 @@
+"""
+Palet warna Blues untuk seluruh visualisasi dashboard
+Lookup table 256 warna hex diinterpolasi sekali per proses dari 9 warna jangkar
+ColorBrewer 'Blues' (identik dengan colormap matplotlib 'Blues', tanpa mengimpor
+matplotlib), lalu seluruh array nilai dipetakan ke warna dalam satu operasi vektor.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+LUT_SIZE = 256
+BAD_COLOR = '#000000'  # matplotlib's 'bad' colour (transparent black) used for NaN
+# ColorBrewer Blues (9 classes); matplotlib's 'Blues' interpolates linearly between them
+BLUES_ANCHORS = [
+    '#f7fbff', '#deebf7', '#c6dbef', '#9ecae1', '#6baed6',
+    '#4292c6', '#2171b5', '#08519c', '#08306b',
+]
+
+
+@lru_cache(maxsize=None)
+def blues_lut():
+    """Lookup table 256 warna hex, sama dengan matplotlib.colormaps['Blues'].resampled(256)"""
+    anchors = np.array([[int(h[i:i + 2], 16) for i in (1, 3, 5)] for h in BLUES_ANCHORS]) / 255
+    positions = np.linspace(0, 1, len(anchors))
+    x = np.linspace(0, 1, LUT_SIZE)
+    rgb = np.stack([np.interp(x, positions, anchors[:, channel]) for channel in range(3)], axis=1)
+    # Same rounding as matplotlib.colors.to_hex
+    return np.array(['#' + ''.join(f'{round(v * 255):02x}' for v in row) for row in rgb])
+
+
+def normalize(values, vmin=None, vmax=None):
+    """Skala linear ke [0, 1] seperti matplotlib.colors.Normalize"""
+    values = np.asarray(values, dtype=float)
+    if values.size == 0:
+        return values
+    vmin = np.nanmin(values) if vmin is None else vmin
+    vmax = np.nanmax(values) if vmax is None else vmax
+    if vmax == vmin:
+        return np.where(np.isnan(values), np.nan, 0.0)
+    return (values - vmin) / (vmax - vmin)
+
+
+def blues_hex(values, vmin=None, vmax=None):
+    """
+    Petakan array nilai ke warna hex Blues (nilai terbesar → paling pekat).
+    Default vmin/vmax = min/max dari `values`; berikan eksplisit untuk
+    normalisasi bersama lintas beberapa trace.
+    """
+    x = normalize(values, vmin, vmax)
+    missing = np.isnan(x)
+    idx = np.clip(np.floor(np.where(missing, 0, x) * LUT_SIZE), 0, LUT_SIZE - 1).astype(np.intp)
+    colors = blues_lut()[idx]
+    colors[missing] = BAD_COLOR
+    return colors
+
+
+def blues_colorscale(n_steps=9):
+    """Colorscale plotly (mis. untuk heatmap) dari lookup table Blues yang sama"""
+    lut = blues_lut()
+    idx = np.linspace(0, LUT_SIZE - 1, n_steps).astype(np.intp)
+    return [[i / (n_steps - 1), lut[j]] for i, j in enumerate(idx)]
@@ -0,0 +1,204 @@
+"""
+Analitik COVID-19 per negara bagian untuk data bergaya NYT/JHU (state, date, cases, deaths kumulatif)
+Satu pass ter-vektorisasi setelah pengurutan (state, date) menghasilkan kasus/kematian baru harian,
+rata-rata bergulir 7 hari, dan indeks baris per negara bagian; ringkasan per rentang tanggal
+(total, per 100 ribu penduduk, CFR) cukup mencari batas rentang di indeks tersebut.
+"""
+import numpy as np
+import pandas as pd
+
+ROLLING_DAYS = 7
+PER_CAPITA = 100_000
+# JHU daily reports use different column names for the same fields
+COLUMN_ALIASES = {'Province_State': 'state', 'Confirmed': 'cases', 'Deaths': 'deaths', 'Date': 'date'}
+REQUIRED_COLUMNS = ['state', 'date', 'cases']
+
+# US Census 2020 resident population (April 1), 50 states + DC + territories
+STATE_POPULATION = {
+    'Alabama': 5024279, 'Alaska': 733391, 'Arizona': 7151502, 'Arkansas': 3011524,
+    'California': 39538223, 'Colorado': 5773714, 'Connecticut': 3605944, 'Delaware': 989948,
+    'District of Columbia': 689545, 'Florida': 21538187, 'Georgia': 10711908, 'Hawaii': 1455271,
+    'Idaho': 1839106, 'Illinois': 12812508, 'Indiana': 6785528, 'Iowa': 3190369,
+    'Kansas': 2937880, 'Kentucky': 4505836, 'Louisiana': 4657757, 'Maine': 1362359,
+    'Maryland': 6177224, 'Massachusetts': 7029917, 'Michigan': 10077331, 'Minnesota': 5706494,
+    'Mississippi': 2961279, 'Missouri': 6154913, 'Montana': 1084225, 'Nebraska': 1961504,
+    'Nevada': 3104614, 'New Hampshire': 1377529, 'New Jersey': 9288994, 'New Mexico': 2117522,
+    'New York': 20201249, 'North Carolina': 10439388, 'North Dakota': 779094, 'Ohio': 11799448,
+    'Oklahoma': 3959353, 'Oregon': 4237256, 'Pennsylvania': 13002700, 'Rhode Island': 1097379,
+    'South Carolina': 5118425, 'South Dakota': 886667, 'Tennessee': 6910840, 'Texas': 29145505,
+    'Utah': 3271616, 'Vermont': 643077, 'Virginia': 8631393, 'Washington': 7705281,
+    'West Virginia': 1793716, 'Wisconsin': 5893718, 'Wyoming': 576851,
+    'Puerto Rico': 3285874, 'Guam': 153836, 'Virgin Islands': 87146,
+    'Northern Mariana Islands': 47329, 'American Samoa': 49710,
+}
+
+SUMMARY_COLUMNS = ['cases', 'deaths', 'cases_total', 'deaths_total', 'avg7_cases', 'cases_per_100k', 'cfr']
+
+
+def normalize_columns(df):
+    return df.rename(columns={k: v for k, v in COLUMN_ALIASES.items() if k in df.columns})
+
+
+def is_state_level(df):
+    """True jika frame memiliki kolom state, date, dan cases (setelah alias JHU)"""
+    return set(REQUIRED_COLUMNS) <= set(normalize_columns(df.iloc[:0]).columns)
+
+
+def _grouped_rolling_mean(values, group_start, window=ROLLING_DAYS):
+    """Rata-rata `window` baris terakhir di dalam grupnya (min_periods=1), via cumsum global"""
+    csum = np.concatenate([[0.0], np.cumsum(values)])
+    idx = np.arange(len(values))
+    first = np.maximum(idx - window + 1, group_start)
+    return (csum[idx + 1] - csum[first]) / (idx - first + 1)
+
+
+class StateAnalytics:
+    """
+    Deret harian per negara bagian, terurut (state, day) dengan `offsets` sebagai indeks:
+    baris negara bagian ke-s ada di offsets[s]:offsets[s + 1]. Objek tidak berubah setelah dibuat.
+    """
+
+    def __init__(self, states, population, offsets, day, cases_cum, deaths_cum):
+        self.states = states
+        self.population = population
+        self.offsets = offsets
+        self.day = day
+        self.cases_cum = cases_cum
+        self.deaths_cum = deaths_cum
+
+        codes = np.repeat(np.arange(len(states)), np.diff(offsets))
+        group_start = offsets[codes]
+        self.new_cases = self._daily_new(cases_cum, offsets[:-1])
+        self.new_deaths = self._daily_new(deaths_cum, offsets[:-1])
+        self.avg7_cases = _grouped_rolling_mean(self.new_cases, group_start)
+        self.avg7_deaths = _grouped_rolling_mean(self.new_deaths, group_start)
+        # (state, day) packed into one sorted key so window bounds are a single searchsorted
+        self._day0 = int(day.min()) if len(day) else 0
+        self._span = (int(day.max()) - self._day0 + 2) if len(day) else 1
+        self._keys = codes.astype(np.int64) * self._span + (day - self._day0)
+
+    @staticmethod
+    def _daily_new(cumulative, starts):
+        # The first report of each state counts as that day's new value
+        new = np.diff(cumulative, prepend=0.0)
+        new[starts] = cumulative[starts]
+        return new
+
+    def __len__(self):
+        return len(self.day)
+
+    @property
+    def first_date(self):
+        return pd.Timestamp(np.datetime64(self._day0, 'D'))
+
+    @property
+    def last_date(self):
+        return pd.Timestamp(np.datetime64(self._day0 + self._span - 2, 'D'))
+
+    def bounds(self, start, end):
+        """Posisi [lo, hi) baris tiap negara bagian dengan start <= date <= end"""
+        d0 = np.clip(_to_day(start) - self._day0, 0, self._span - 1)
+        d1 = np.clip(_to_day(end) - self._day0, -1, self._span - 2)
+        base = np.arange(len(self.states), dtype=np.int64) * self._span
+        return np.searchsorted(self._keys, base + d0, 'left'), np.searchsorted(self._keys, base + d1, 'right')
+
+    def summarize(self, lo, hi, states=None):
+        """Ringkasan rentang untuk negara bagian `states` (indeks posisi; default semua)"""
+        states = np.arange(len(self.states)) if states is None else states
+        lo, hi, first = lo[states], hi[states], self.offsets[states]
+        has_end, has_before = hi > first, lo > first
+
+        def at(values, pos, mask):
+            return np.where(mask, values[np.where(mask, pos, 0)], 0.0) if len(values) else np.zeros(len(pos))
+
+        cases_total = at(self.cases_cum, hi - 1, has_end)
+        deaths_total = at(self.deaths_cum, hi - 1, has_end)
+        population = self.population[states]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cases = cases_total - at(self.cases_cum, lo - 1, has_before)
+            return {
+                'cases': cases,
+                'deaths': deaths_total - at(self.deaths_cum, lo - 1, has_before),
+                'cases_total': cases_total,
+                'deaths_total': deaths_total,
+                'avg7_cases': np.where(has_end, at(self.avg7_cases, hi - 1, has_end), np.nan),
+                'cases_per_100k': cases / population * PER_CAPITA,
+                'cfr': np.where(cases_total > 0, deaths_total / cases_total * 100, np.nan),
+            }
+
+    def national_daily(self):
+        """Total nasional per hari: kasus/kematian baru dan rata-rata 7 hari kasus baru"""
+        slot = self.day - self._day0
+        n_days = self._span - 1
+        new_cases = np.bincount(slot, weights=self.new_cases, minlength=n_days)
+        new_deaths = np.bincount(slot, weights=self.new_deaths, minlength=n_days)
+        return pd.DataFrame({
+            'date': (self._day0 + np.arange(n_days)).astype('datetime64[D]'),
+            'new_cases': new_cases,
+            'new_deaths': new_deaths,
+            'avg7_cases': _grouped_rolling_mean(new_cases, np.zeros(n_days, dtype=np.int64)),
+        })
+
+
+def _to_day(value):
+    return int(np.datetime64(pd.Timestamp(value).date(), 'D').astype(np.int64))
+
+
+def build_state_analytics(df, population=None):
+    """
+    Bangun StateAnalytics dari frame state-date (kumulatif). Baris per county dijumlahkan
+    ke tingkat negara bagian; kolom `population` pada data, jika ada, menggantikan sensus 2020.
+    """
+    df = normalize_columns(df)
+    dates = pd.to_datetime(df['date'], errors='coerce')
+    valid = (dates.notna() & df['state'].notna()).to_numpy()
+    state = df['state'][valid].astype('category').cat.remove_unused_categories()
+    codes = state.cat.codes.to_numpy()
+    day = dates[valid].to_numpy().astype('datetime64[D]').astype(np.int64)
+    cases = pd.to_numeric(df['cases'][valid], errors='coerce').fillna(0).to_numpy(np.float64)
+    deaths = (pd.to_numeric(df['deaths'][valid], errors='coerce').fillna(0).to_numpy(np.float64)
+              if 'deaths' in df.columns else np.zeros(len(cases)))
+
+    order = np.lexsort((day, codes))
+    codes, day, cases, deaths = codes[order], day[order], cases[order], deaths[order]
+    # County-level files have many rows per (state, date); collapse them in one reduceat
+    if len(day):
+        first = np.flatnonzero(np.r_[True, (codes[1:] != codes[:-1]) | (day[1:] != day[:-1])])
+        cases, deaths = np.add.reduceat(cases, first), np.add.reduceat(deaths, first)
+        codes, day = codes[first], day[first]
+
+    states = state.cat.categories
+    offsets = np.searchsorted(codes, np.arange(len(states) + 1)).astype(np.int64)
+    lookup = dict(STATE_POPULATION, **(population or {}))
+    if 'population' in df.columns:
+        uploaded = df[valid].groupby(state, observed=True)['population'].max()
+        lookup.update(uploaded.dropna().to_dict())
+    pop = np.array([lookup.get(s, np.nan) for s in states], dtype=np.float64)
+    return StateAnalytics(states, pop, offsets, day, cases, deaths)
+
+
+class StateWindow:
+    """
+    Ringkasan per negara bagian untuk rentang tanggal yang digeser-geser (slider). Hanya negara
+    bagian yang batas barisnya berubah yang dihitung ulang; sisanya memakai hasil sebelumnya.
+    """
+
+    def __init__(self, analytics):
+        self.analytics = analytics
+        self._lo = self._hi = None
+        self._table = None
+        self.recomputed = 0
+
+    def summary(self, start, end):
+        lo, hi = self.analytics.bounds(start, end)
+        if self._table is None:
+            changed = np.arange(len(lo))
+            self._table = {col: np.full(len(lo), np.nan) for col in SUMMARY_COLUMNS}
+        else:
+            changed = np.flatnonzero((lo != self._lo) | (hi != self._hi))
+        if len(changed):
+            for col, values in self.analytics.summarize(lo, hi, changed).items():
+                self._table[col][changed] = values
+        self._lo, self._hi = lo, hi
+        self.recomputed = len(changed)
+        return pd.DataFrame({'state': self.analytics.states, **{c: v.copy() for c, v in self._table.items()}})
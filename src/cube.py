@@ -0,0 +1,113 @@
+"""
+Engagement cube untuk dashboard Social Media Engagement
+Agregat ringkas per platform x post_type x post_day x tanggal yang dibangun
+sekali per versi dataset; grafik cukup me-roll-up sel cube sesuai filter.
+"""
+import numpy as np
+import pandas as pd
+
+from src.loader import METRIC_COLUMNS
+
+# Days are keyed by the int32 day_number from ingest; rollups by 'date' return timestamps
+DIMENSIONS = ['platform', 'post_type', 'post_day', 'day_number']
+
+
+def _stat_columns(stat):
+    return [f'{m}_{stat}' for m in METRIC_COLUMNS]
+
+
+class EngagementCube:
+    """Sel cube berisi count serta sum/sumsq/min/max tiap metrik engagement"""
+
+    def __init__(self, cells):
+        self.cells = cells
+
+    def __len__(self):
+        return len(self.cells)
+
+    def select(self, platforms=None, post_types=None):
+        """Sel cube yang lolos filter sidebar - biaya O(jumlah sel), bukan O(baris)"""
+        mask = np.ones(len(self.cells), dtype=bool)
+        if platforms is not None:
+            mask &= self.cells['platform'].isin(platforms).to_numpy()
+        if post_types is not None:
+            mask &= self.cells['post_type'].isin(post_types).to_numpy()
+        return self.cells[mask]
+
+    def rollup(self, by, platforms=None, post_types=None):
+        """Gabungkan sel terpilih ke dimensi `by` (count, sum, sumsq, min, max)"""
+        return _rollup_cells(self.select(platforms, post_types), by)
+
+    def rollups(self, bys, platforms=None, post_types=None):
+        """Roll-up ke beberapa dimensi sekaligus dengan satu kali seleksi sel"""
+        cells = self.select(platforms, post_types)
+        return {by: _rollup_cells(cells, by) for by in bys}
+
+    def mean(self, by, platforms=None, post_types=None):
+        """Rata-rata likes/comments/shares per nilai `by`"""
+        return rollup_mean(self.rollup(by, platforms, post_types))
+
+    def total(self, by, platforms=None, post_types=None):
+        """Total likes/comments/shares per nilai `by`"""
+        return rollup_total(self.rollup(by, platforms, post_types))
+
+    def std(self, by, platforms=None, post_types=None):
+        """Standar deviasi populasi per nilai `by`, dihitung dari sum dan sumsq"""
+        rolled = self.rollup(by, platforms, post_types)
+        out = {}
+        for m in METRIC_COLUMNS:
+            mean = rolled[f'{m}_sum'] / rolled['count']
+            out[m] = np.sqrt((rolled[f'{m}_sumsq'] / rolled['count'] - mean ** 2).clip(lower=0))
+        return pd.DataFrame(out)
+
+
+def rollup_mean(rolled):
+    """Rata-rata per metrik dari hasil rollup()"""
+    return pd.DataFrame({m: rolled[f'{m}_sum'] / rolled['count'] for m in METRIC_COLUMNS})
+
+
+def rollup_total(rolled):
+    """Total per metrik dari hasil rollup()"""
+    return rolled[_stat_columns('sum')].set_axis(METRIC_COLUMNS, axis=1)
+
+
+def _rollup_cells(cells, by):
+    key = 'day_number' if by == 'date' else by
+    grouped = cells.groupby(key, observed=True, sort=True)
+    additive = grouped[['count'] + _stat_columns('sum') + _stat_columns('sumsq')].sum()
+    rolled = additive.join(grouped[_stat_columns('min')].min()).join(grouped[_stat_columns('max')].max())
+    if by == 'date':
+        rolled.index = pd.to_datetime(rolled.index.to_numpy().astype('datetime64[D]')).rename('date')
+    return rolled
+
+
+def build_cube(df):
+    """Bangun EngagementCube dari frame engagement hasil load_engagement()"""
+    frame = df[['platform', 'post_type', 'post_day', 'day_number']].copy()
+    frame['count'] = 1
+    for m in METRIC_COLUMNS:
+        # int64 / float64 so sums over tens of millions of rows cannot overflow
+        values = df[m].to_numpy(dtype=np.int64)
+        frame[f'{m}_sum'] = values
+        frame[f'{m}_sumsq'] = values.astype(np.float64) ** 2
+        frame[f'{m}_min'] = values
+        frame[f'{m}_max'] = values
+
+    return EngagementCube(_aggregate_cells(frame))
+
+
+def merge_cubes(*cubes):
+    """Gabungkan beberapa cube (mis. hasil per chunk) menjadi satu cube"""
+    cells = pd.concat([cube.cells for cube in cubes], ignore_index=True)
+    for col in ['platform', 'post_type']:
+        # Chunks carry different category sets; re-encode on the union
+        cells[col] = cells[col].astype('category')
+    return EngagementCube(_aggregate_cells(cells))
+
+
+def _aggregate_cells(frame):
+    """Reduksi baris (atau sel) ke satu sel per kombinasi DIMENSIONS"""
+    grouped = frame.groupby(DIMENSIONS, observed=True, sort=False)
+    cells = grouped[['count'] + _stat_columns('sum') + _stat_columns('sumsq')].sum()
+    cells = cells.join(grouped[_stat_columns('min')].min()).join(grouped[_stat_columns('max')].max())
+    return cells.reset_index()
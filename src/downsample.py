@@ -0,0 +1,74 @@
+"""
+Downsampling time series di server sebelum dikirim ke browser
+LTTB (Largest-Triangle-Three-Buckets) atau min-max per bucket mereduksi seri
+menjadi anggaran titik sesuai lebar chart, dengan puncak dan lembah tetap terjaga.
+"""
+import numpy as np
+
+from config.config import ChartConfig
+
+
+def _as_float(x):
+    """Sumbu x sebagai float64 (datetime -> nanodetik) untuk perhitungan luas segitiga"""
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        return x.astype('datetime64[ns]').astype(np.int64).astype(np.float64)
+    return x.astype(np.float64)
+
+
+def lttb_indices(x, y, n_out):
+    """Indeks titik terpilih LTTB (urut naik); titik pertama dan terakhir selalu ikut"""
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = _as_float(x)
+    y = np.asarray(y, dtype=np.float64)
+    # n - 2 interior points split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_start, next_stop = edges[i + 1], edges[i + 2]
+            avg_x, avg_y = x[next_start:next_stop].mean(), y[next_start:next_stop].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:stop] - y[a])
+            - (x[a] - x[start:stop]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def minmax_indices(y, n_out):
+    """Indeks minimum dan maksimum tiap bucket (n_out // 2 bucket), urut naik"""
+    n = len(y)
+    if n_out >= n or n_out < 2:
+        return np.arange(n)
+    y = np.asarray(y)
+    edges = np.linspace(0, n, n_out // 2 + 1).astype(np.int64)
+    picks = []
+    for start, stop in zip(edges[:-1], edges[1:]):
+        if stop > start:
+            bucket = y[start:stop]
+            picks += [start + int(np.argmin(bucket)), start + int(np.argmax(bucket))]
+    return np.unique(picks)
+
+
+def downsample_indices(x, y, max_points=None, method=None):
+    """Indeks baris yang dipertahankan untuk satu seri; seri pendek tidak diubah"""
+    max_points = max_points or ChartConfig.MAX_POINTS
+    method = method or ChartConfig.DOWNSAMPLE_METHOD
+    if method == 'minmax':
+        return minmax_indices(y, max_points)
+    return lttb_indices(x, y, max_points)
+
+
+def downsample_frame(df, x, y, max_points=None, method=None):
+    """Subset baris `df` (urut menurut `x`) hasil downsampling kolom `y`"""
+    idx = downsample_indices(df[x].to_numpy(), df[y].to_numpy(), max_points, method)
+    return df.iloc[idx]
@@ -0,0 +1,69 @@
+"""
+Cache figure Plotly untuk dashboard
+Figure disimpan sebagai JSON terserialisasi dalam LRU berbatas memori,
+dengan key (versi dataset, seleksi filter terurut, id chart).
+"""
+import threading
+from collections import OrderedDict
+
+import plotly.io as pio
+
+
+def selection_key(signature, *selections):
+    """Key filter yang stabil: setiap seleksi multiselect diurutkan"""
+    return (tuple(signature),) + tuple(tuple(sorted(map(str, s))) for s in selections)
+
+
+class FigureCache:
+    """LRU figure JSON dengan anggaran byte dan penghitung hit/miss"""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key, build):
+        """Kembalikan figure dari cache, atau bangun lewat `build()` lalu simpan"""
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return pio.from_json(payload)
+            self.misses += 1
+
+        fig = build()
+        self._put(key, fig.to_json())
+        return fig
+
+    def _put(self, key, payload):
+        size = len(payload)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old)
+            self._entries[key] = payload
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+            }
@@ -0,0 +1,72 @@
+"""
+Filter index untuk multiselect sidebar (platform / post_type)
+Setiap nilai kategori punya bitmap baris (np.packbits) yang dibangun sekali saat
+load; kombinasi filter apa pun cukup OR di dalam kolom lalu AND antar kolom.
+"""
+import numpy as np
+import pandas as pd
+
+FILTER_COLUMNS = ['platform', 'post_type']
+
+
+class FilterIndex:
+    """Bitmap per nilai kategori plus daftar nilai unik yang sudah di-cache"""
+
+    def __init__(self, n_rows, bitmaps, values):
+        self.n_rows = n_rows
+        self.bitmaps = bitmaps
+        self.values = values
+
+    def mask(self, **selections):
+        """Bitmap terpaket untuk seleksi; kolom bernilai None tidak difilter"""
+        n_bytes = (self.n_rows + 7) // 8
+        result = np.full(n_bytes, 0xFF, dtype=np.uint8)
+        for col, selected in selections.items():
+            if selected is None:
+                continue
+            column_bits = np.zeros(n_bytes, dtype=np.uint8)
+            for value in selected:
+                bits = self.bitmaps[col].get(value)
+                if bits is not None:
+                    column_bits |= bits
+            result &= column_bits
+        return result
+
+    def select(self, **selections):
+        """Posisi baris (view lazy) yang lolos seleksi, urut naik"""
+        bits = np.unpackbits(self.mask(**selections), count=self.n_rows)
+        return np.flatnonzero(bits)
+
+    def extend(self, df):
+        """FilterIndex baru dengan baris `df` ditambahkan di akhir (untuk data append-only)"""
+        n_rows = self.n_rows + len(df)
+        bitmaps = {}
+        values = {}
+        for col, col_bitmaps in self.bitmaps.items():
+            new_values = df[col].astype(str).to_numpy()
+            values[col] = self.values[col] + [v for v in pd.unique(new_values) if v not in col_bitmaps]
+            bitmaps[col] = {}
+            for value in values[col]:
+                old = col_bitmaps.get(value)
+                old_bits = np.unpackbits(old, count=self.n_rows) if old is not None else np.zeros(self.n_rows, dtype=np.uint8)
+                bitmaps[col][value] = np.packbits(np.concatenate([old_bits, (new_values == value).astype(np.uint8)]))
+        return FilterIndex(n_rows, bitmaps, values)
+
+    def count(self, **selections):
+        """Jumlah baris yang lolos seleksi tanpa membuka bitmap"""
+        return int(np.unpackbits(self.mask(**selections), count=self.n_rows).sum())
+
+
+def build_filter_index(df, columns=FILTER_COLUMNS):
+    """Bangun FilterIndex dari kolom kategorikal `columns`"""
+    bitmaps = {}
+    values = {}
+    for col in columns:
+        series = df[col].astype('category')
+        codes = series.cat.codes.to_numpy()
+        values[col] = list(series.unique())
+        bitmaps[col] = {
+            value: np.packbits(codes == code)
+            for code, value in enumerate(series.cat.categories)
+        }
+    return FilterIndex(len(df), bitmaps, values)
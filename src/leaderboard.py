@@ -0,0 +1,115 @@
+"""
+Leaderboard engagement: top-K dan persentil per (platform, post_type)
+Setiap sel menyimpan K baris teratas per metrik dan tabel frekuensi nilai metrik,
+dibangun sekali saat load dan diperbarui saat baris bertambah; kombinasi filter apa pun
+dijawab dengan menggabungkan daftar parsial sel yang terpilih, tanpa mengurutkan dataset.
+"""
+import numpy as np
+import pandas as pd
+
+from config.config import ChartConfig
+from src.boxstats import frequency_quantile
+from src.loader import METRIC_COLUMNS
+
+CELL_COLUMNS = ['platform', 'post_type']
+PERCENTILES = {'p50': 0.5, 'p90': 0.9, 'p99': 0.99}
+
+
+def _top(values, rows, k):
+    """K nilai terbesar; seri diurutkan berdasarkan posisi baris (postingan lebih awal dulu)"""
+    order = np.lexsort((rows, -values))[:k]
+    return values[order], rows[order]
+
+
+def _merge_frequencies(tables):
+    values = np.concatenate([t[0] for t in tables])
+    counts = np.concatenate([t[1] for t in tables])
+    unique, inverse = np.unique(values, return_inverse=True)
+    return unique, np.bincount(inverse, weights=counts, minlength=len(unique)).astype(np.int64)
+
+
+class Leaderboard:
+    """
+    `top[metric][cell]` = (nilai menurun, posisi baris) berisi maksimal k entri;
+    `frequencies[metric][cell]` = (nilai unik terurut, jumlah). Cell = (platform, post_type).
+    """
+
+    def __init__(self, k, n_rows, top, frequencies):
+        self.k = k
+        self.n_rows = n_rows
+        self.top = top
+        self.frequencies = frequencies
+
+    def _cells(self, metric, platforms=None, post_types=None):
+        return [
+            cell for cell in self.top[metric]
+            if (platforms is None or cell[0] in platforms) and (post_types is None or cell[1] in post_types)
+        ]
+
+    def top_k(self, metric, platforms=None, post_types=None, k=None):
+        """(nilai, posisi baris) K teratas untuk seleksi, hasil merge top-K per sel"""
+        cells = self._cells(metric, platforms, post_types)
+        k = min(k or self.k, self.k)
+        if not cells:
+            return np.empty(0), np.empty(0, dtype=np.int64)
+        values = np.concatenate([self.top[metric][c][0] for c in cells])
+        rows = np.concatenate([self.top[metric][c][1] for c in cells])
+        return _top(values, rows, k)
+
+    def percentiles(self, metric, platforms=None, post_types=None, q=tuple(PERCENTILES.values())):
+        """Persentil eksak dari gabungan tabel frekuensi sel terpilih (NaN jika kosong)"""
+        cells = self._cells(metric, platforms, post_types)
+        if not cells:
+            return np.full(len(q), np.nan)
+        values, counts = _merge_frequencies([self.frequencies[metric][c] for c in cells])
+        return frequency_quantile(values, counts, q)
+
+    def percentile_table(self, platforms=None, post_types=None):
+        """Tabel p50/p90/p99 per metrik untuk seleksi"""
+        return pd.DataFrame(
+            [self.percentiles(m, platforms, post_types) for m in METRIC_COLUMNS],
+            index=pd.Index(METRIC_COLUMNS, name='metric'),
+            columns=list(PERCENTILES)
+        )
+
+    def extend(self, df):
+        """Leaderboard baru dengan baris `df` ditambahkan di akhir (untuk data append-only)"""
+        new = build_leaderboard(df, self.k, first_row=self.n_rows)
+        top, frequencies = {}, {}
+        for metric in self.top:
+            top[metric] = dict(self.top[metric])
+            frequencies[metric] = dict(self.frequencies[metric])
+            for cell, (values, rows) in new.top[metric].items():
+                if cell in top[metric]:
+                    old_values, old_rows = top[metric][cell]
+                    values, rows = _top(np.concatenate([old_values, values]), np.concatenate([old_rows, rows]), self.k)
+                top[metric][cell] = (values, rows)
+            for cell, table in new.frequencies[metric].items():
+                if cell in frequencies[metric]:
+                    table = _merge_frequencies([frequencies[metric][cell], table])
+                frequencies[metric][cell] = table
+        return Leaderboard(self.k, self.n_rows + len(df), top, frequencies)
+
+
+def build_leaderboard(df, k=None, first_row=0, metrics=METRIC_COLUMNS):
+    """Bangun Leaderboard dengan satu lexsort per metrik; posisi baris dimulai dari `first_row`"""
+    k = k or ChartConfig.LEADERBOARD_TOP_K
+    keys = df[CELL_COLUMNS].astype(str)
+    codes, cells = pd.MultiIndex.from_frame(keys).factorize()
+    rows = np.arange(first_row, first_row + len(df), dtype=np.int64)
+    top, frequencies = {}, {}
+    for metric in metrics:
+        values = df[metric].to_numpy()
+        top[metric], frequencies[metric] = {}, {}
+        # Sorted by (cell, value desc, row): each cell's first k entries are its top-K,
+        # and equal neighbouring values collapse into the frequency table
+        order = np.lexsort((rows, -values.astype(np.int64), codes))
+        sorted_codes, sorted_values = codes[order], values[order]
+        bounds = np.searchsorted(sorted_codes, np.arange(len(cells) + 1))
+        for code, cell in enumerate(cells):
+            lo, hi = bounds[code], bounds[code + 1]
+            top[metric][cell] = (sorted_values[lo:min(hi, lo + k)], rows[order[lo:min(hi, lo + k)]])
+            cell_values = sorted_values[lo:hi][::-1]
+            starts = np.flatnonzero(np.r_[True, cell_values[1:] != cell_values[:-1]])
+            frequencies[metric][cell] = (cell_values[starts], np.diff(np.r_[starts, hi - lo]))
+    return Leaderboard(k, first_row + len(df), top, frequencies)
@@ -0,0 +1,374 @@
+"""
+Loader module untuk dataset Social Media Engagement
+CSV diparsing sekali menjadi file Parquet kolumnar dengan skema bertipe,
+lalu load berikutnya dibaca langsung (memory-mapped) dari cache tersebut.
+"""
+import hashlib
+import io
+import os
+import re
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow opsional: tanpa pyarrow, CSV diparsing langsung
+    pq = None
+
+from config.config import DataConfig
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_FILENAME = 'social_media_engagement1.csv'
+
+DAY_ORDER = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+METRIC_COLUMNS = ['likes', 'comments', 'shares']
+POST_TIME_FORMAT = '%m/%d/%Y %H:%M'
+
+# Explicit schema so pandas never has to infer types from the raw text
+CSV_DTYPES = {
+    'post_id': 'int64',
+    'platform': 'category',
+    'post_type': 'category',
+    'post_time': 'str',
+    'likes': 'int32',
+    'comments': 'int32',
+    'shares': 'int32',
+    'post_day': pd.CategoricalDtype(DAY_ORDER, ordered=True),
+    'sentiment_score': 'category',
+}
+
+# Integer time keys derived from post_time at ingest (day_number = days since 1970-01-01,
+# week = Monday-based weeks since the epoch, day_of_week 0 = Monday)
+TIME_FEATURES = {
+    'day_number': 'int32',
+    'hour': 'int8',
+    'day_of_week': 'int8',
+    'week': 'int32',
+}
+
+# Derived columns dropped by compact_frame while their source column is complete; only
+# day_number stays in memory and time_feature() derives the others on demand
+REDUNDANT_COLUMNS = {'day_of_week': 'day_number', 'week': 'day_number', 'hour': 'post_time'}
+# Dtypes of the typed loader's frame before compact_frame (post_time is already datetime64)
+TYPED_DTYPES = {**{c: d for c, d in CSV_DTYPES.items() if c != 'post_time'}, **TIME_FEATURES}
+# Text columns with at most this share of distinct values are dictionary-encoded
+CATEGORY_MAX_RATIO = 0.5
+
+# Bump when the on-disk layout changes so stale caches are rebuilt
+SCHEMA_VERSION = 2
+
+# Daily partitions carry their date in the file or directory name (e.g. date=2023-08-17)
+PARTITION_DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+
+
+def project_path(path):
+    """Path relatif di config dianggap relatif terhadap root project"""
+    path = Path(path)
+    return path if path.is_absolute() else PROJECT_ROOT / path
+
+
+def resolve_data_path(filename=DEFAULT_FILENAME):
+    """Cari file dataset di DataConfig.DATA_PATH, lalu fallback ke working directory"""
+    data_path = project_path(DataConfig.DATA_PATH) / filename
+    if not data_path.exists():
+        data_path = Path.cwd() / 'database' / 'data' / filename
+    if not data_path.exists():
+        raise FileNotFoundError(f"Data file not found at: {data_path}")
+    return data_path
+
+
+def resolve_data_dir(data_dir=None):
+    """Direktori partisi dataset: DataConfig.DATA_PATH, lalu fallback ke working directory"""
+    data_dir = project_path(data_dir or DataConfig.DATA_PATH)
+    if not data_dir.is_dir():
+        data_dir = Path.cwd() / 'database' / 'data'
+    if not data_dir.is_dir():
+        raise FileNotFoundError(f"Data directory not found at: {data_dir}")
+    return data_dir
+
+
+def discover_partitions(data_dir=None, pattern=None):
+    """Semua file partisi di bawah direktori data, urut berdasarkan path"""
+    data_dir = resolve_data_dir(data_dir)
+    files = sorted(p for p in data_dir.rglob(pattern or DataConfig.PARTITION_PATTERN) if p.is_file())
+    if not files:
+        raise FileNotFoundError(f"No data partitions found in: {data_dir}")
+    return files
+
+
+def source_signature(path):
+    """Kunci identitas sumber data: (path absolut, ukuran byte, mtime ns)"""
+    path = Path(path).resolve()
+    stat = path.stat()
+    return (str(path), stat.st_size, stat.st_mtime_ns)
+
+
+def dataset_signature(paths):
+    """Signature gabungan semua partisi; berubah jika ada partisi yang berubah"""
+    return tuple(source_signature(p) for p in paths)
+
+
+def cache_path_for(signature, cache_dir=None):
+    """
+    Lokasi file Parquet untuk sebuah signature sumber: <stem>-<hash path>-<hash versi>.
+    Hash path membedakan partisi bernama sama di direktori berbeda (date=.../part.csv).
+    """
+    cache_dir = project_path(cache_dir or DataConfig.CACHE_DIR)
+    source = hashlib.sha1(str(signature[0]).encode()).hexdigest()[:12]
+    version = hashlib.sha1(repr((SCHEMA_VERSION,) + tuple(signature)).encode()).hexdigest()[:16]
+    return cache_dir / f"{Path(signature[0]).stem}-{source}-{version}.parquet"
+
+
+def apply_schema(df):
+    """Paksa dtype sesuai CSV_DTYPES untuk kolom yang ada (no-op jika sudah sesuai)"""
+    for col, dtype in CSV_DTYPES.items():
+        if col in df.columns and col != 'post_time' and df[col].dtype != dtype:
+            df[col] = df[col].astype(dtype)
+    if 'post_time' in df.columns and not pd.api.types.is_datetime64_any_dtype(df['post_time']):
+        df['post_time'] = pd.to_datetime(df['post_time'], format=POST_TIME_FORMAT)
+    if 'post_time' in df.columns and 'day_number' not in df.columns:
+        add_time_features(df)
+    return df
+
+
+def add_time_features(df):
+    """
+    Tambahkan kolom TIME_FEATURES dari post_time (satu pass vektor tanpa objek Python).
+    post_day yang tidak cocok dengan post_time hanya diperingatkan; fitur waktu tetap dari post_time.
+    """
+    minutes = df['post_time'].to_numpy().astype('datetime64[m]').astype(np.int64)
+    df['day_number'] = (minutes // 1440).astype(np.int32)
+    for name in ('hour', 'day_of_week', 'week'):
+        df[name] = time_feature(df, name)
+    mismatched = post_day_mismatches(df)
+    if mismatched:
+        warnings.warn(
+            f"post_day does not match post_time in {mismatched} rows; "
+            "hour, day_of_week and week are derived from post_time",
+            stacklevel=2
+        )
+    return df
+
+
+def post_day_mismatches(df):
+    """Jumlah baris yang post_day-nya tidak sama dengan hari dari post_time (post_day kosong diabaikan)"""
+    if 'post_day' not in df.columns:
+        return 0
+    codes = df['post_day'].astype(CSV_DTYPES['post_day']).cat.codes.to_numpy()
+    return int(np.count_nonzero((codes >= 0) & (codes != time_feature(df, 'day_of_week'))))
+
+
+def time_feature(df, name):
+    """Kolom TIME_FEATURES `name` sebagai array; kolom yang dibuang compact_frame diturunkan ulang"""
+    if name in df.columns:
+        return df[name].to_numpy()
+    if name == 'hour':
+        minutes = df['post_time'].to_numpy().astype('datetime64[m]').astype(np.int64)
+        return (minutes % 1440 // 60).astype(np.int8)
+    day_number = df['day_number'].to_numpy().astype(np.int64)
+    if name == 'week':
+        return ((day_number + 3) // 7).astype(np.int32)
+    return ((day_number + 3) % 7).astype(np.int8)  # day_of_week; 1970-01-01 was a Thursday
+
+
+def compact_frame(df):
+    """
+    Representasi memori ringkas: teks berkardinalitas rendah sebagai kategori (tanpa
+    kategori tak terpakai, kecuali kategori berurutan seperti post_day), bilangan bulat diturunkan ke tipe terkecil yang aman untuk
+    rentang nilainya, dan kolom turunan yang redundan dibuang. Frame asli tidak diubah.
+    """
+    columns = {}
+    for col in df.columns:
+        source = REDUNDANT_COLUMNS.get(col)
+        if source in df.columns and df[source].notna().all():
+            continue
+        series = df[col]
+        if isinstance(series.dtype, pd.CategoricalDtype) and series.cat.ordered:
+            # Ordered dictionaries (post_day) are a fixed schema; their codes carry meaning
+            pass
+        elif isinstance(series.dtype, pd.CategoricalDtype):
+            series = series.cat.remove_unused_categories()
+        elif pd.api.types.is_integer_dtype(series.dtype):
+            series = pd.to_numeric(series, downcast='integer')
+        elif (pd.api.types.is_object_dtype(series.dtype) or pd.api.types.is_string_dtype(series.dtype)) \
+                and series.nunique() <= CATEGORY_MAX_RATIO * len(series):
+            series = series.astype('category')
+        columns[col] = series
+    return pd.DataFrame(columns)
+
+
+def memory_report(df):
+    """
+    Memori per kolom: `typed_mb` = ukuran kolom di frame bertipe sebelum compact_frame
+    (CSV_DTYPES + TIME_FEATURES, termasuk kolom turunan yang kini dibuang); `mb` = ukuran
+    frame saat ini. Baris 'total' memuat rasio keduanya.
+    """
+    rows = {}
+    for col in df.columns:
+        series = df[col]
+        typed = series.astype(TYPED_DTYPES[col]) if col in TYPED_DTYPES else series
+        rows[col] = {
+            'dtype': str(series.dtype),
+            'typed_mb': typed.memory_usage(deep=True, index=False) / 2 ** 20,
+            'mb': series.memory_usage(deep=True, index=False) / 2 ** 20,
+        }
+    for col, source in REDUNDANT_COLUMNS.items():
+        if col not in df.columns and source in df.columns:
+            rows[col] = {
+                'dtype': 'dibuang',
+                'typed_mb': len(df) * np.dtype(TIME_FEATURES[col]).itemsize / 2 ** 20,
+                'mb': 0.0,
+            }
+    report = pd.DataFrame.from_dict(rows, orient='index')
+    total = report[['typed_mb', 'mb']].sum()
+    report.loc['total'] = {'dtype': f"{total['typed_mb'] / total['mb']:.1f}x", **total}
+    return report
+
+
+def read_csv_typed(path, columns=None, **kwargs):
+    """Parse CSV engagement dengan dtype eksplisit dan format tanggal tetap"""
+    dtypes = CSV_DTYPES if columns is None else {c: CSV_DTYPES[c] for c in columns if c in CSV_DTYPES}
+    df = pd.read_csv(path, usecols=columns, dtype=dtypes, **kwargs)
+    return apply_schema(df)
+
+
+def iter_csv_typed(path, chunksize, columns=None):
+    """Baca CSV engagement per chunk (ukuran terbatas) dengan skema yang sama"""
+    dtypes = CSV_DTYPES if columns is None else {c: CSV_DTYPES[c] for c in columns if c in CSV_DTYPES}
+    with pd.read_csv(path, usecols=columns, dtype=dtypes, chunksize=chunksize) as reader:
+        for chunk in reader:
+            yield apply_schema(chunk)
+
+
+def _write_cache(df, cache_path):
+    """Tulis Parquet secara atomik dan hapus cache lama dari sumber (path) yang sama"""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    # <stem>-<source hash>: only older versions of this exact source file match
+    prefix = cache_path.stem.rsplit('-', 1)[0]
+    tmp_path = cache_path.with_suffix(f'.{os.getpid()}.tmp')
+    df.to_parquet(tmp_path, engine='pyarrow', index=False)
+    os.replace(tmp_path, cache_path)
+    for stale in cache_path.parent.glob(f'{prefix}-*.parquet'):
+        if stale != cache_path:
+            stale.unlink(missing_ok=True)
+
+
+def load_engagement(path=None, columns=None, cache_dir=None):
+    """
+    Load dataset engagement bertipe.
+    Konversi CSV -> Parquet hanya terjadi saat sumber berubah (path, ukuran, mtime);
+    load berikutnya memakai memory-map dan hanya membaca kolom yang diminta.
+    """
+    path = Path(path) if path is not None else resolve_data_path()
+    if pq is None:
+        return read_csv_typed(path, columns=columns)
+
+    cache_path = cache_path_for(source_signature(path), cache_dir)
+    if not cache_path.exists():
+        _write_cache(read_csv_typed(path), cache_path)
+
+    table = pq.read_table(cache_path, columns=columns, memory_map=True)
+    return apply_schema(table.to_pandas())
+
+
+def partition_time_bounds(path, cache_dir=None):
+    """
+    Rentang post_time [start, end) sebuah partisi tanpa membaca isinya:
+    dari tanggal di nama file/direktori, atau dari statistik Parquet cache.
+    Return None jika tidak diketahui (partisi tidak bisa di-prune).
+    """
+    match = PARTITION_DATE_RE.findall(Path(path).as_posix())
+    if match:
+        day = pd.Timestamp(match[-1])
+        return day, day + pd.Timedelta(days=1)
+
+    cache_path = cache_path_for(source_signature(path), cache_dir)
+    if pq is None or not cache_path.exists():
+        return None
+    metadata = pq.ParquetFile(cache_path).metadata
+    column = metadata.schema.names.index('post_time')
+    stats = [metadata.row_group(i).column(column).statistics for i in range(metadata.num_row_groups)]
+    if not stats or any(st is None or not st.has_min_max for st in stats):
+        return None
+    start = pd.Timestamp(min(st.min for st in stats))
+    end = pd.Timestamp(max(st.max for st in stats))
+    return start, end + pd.Timedelta(microseconds=1)
+
+
+def prune_partitions(paths, start=None, end=None, cache_dir=None):
+    """Buang partisi yang rentang waktunya pasti di luar [start, end)"""
+    if start is None and end is None:
+        return list(paths)
+    start = pd.Timestamp(start) if start is not None else None
+    end = pd.Timestamp(end) if end is not None else None
+    kept = []
+    for path in paths:
+        bounds = partition_time_bounds(path, cache_dir)
+        if bounds is not None:
+            if start is not None and bounds[1] <= start:
+                continue
+            if end is not None and bounds[0] >= end:
+                continue
+        kept.append(path)
+    return kept
+
+
+def unify_categories(frames):
+    """
+    Samakan kategori tiap kolom kategorikal agar pd.concat tetap bertipe category.
+    Kategori tak berurutan digabung terurut abjad; kategori berurutan mempertahankan
+    urutan frame pertama dan nilai baru ditambahkan di belakang.
+    """
+    frames = list(frames)
+    for col in frames[0].columns:
+        dtypes = [f[col].dtype for f in frames]
+        if not all(isinstance(d, pd.CategoricalDtype) for d in dtypes) or len(set(dtypes)) == 1:
+            continue
+        if dtypes[0].ordered:
+            categories = list(dtypes[0].categories)
+            for d in dtypes[1:]:
+                categories += [c for c in d.categories if c not in categories]
+        else:
+            categories = sorted(set().union(*(d.categories for d in dtypes)))
+        dtype = pd.CategoricalDtype(categories, ordered=dtypes[0].ordered)
+        # astype returns new frames, so callers' frames are never modified in place
+        frames = [f.astype({col: dtype}) for f in frames]
+    return frames
+
+
+def load_partitions(paths=None, start=None, end=None, columns=None, cache_dir=None, max_workers=None):
+    """
+    Load semua partisi dataset secara paralel (process pool) lalu gabungkan.
+    Partisi di luar rentang post_time [start, end) di-prune sebelum dibaca;
+    baris di partisi yang beririsan sebagian difilter setelah dibaca.
+    Hasil akhirnya dipadatkan dengan compact_frame().
+    """
+    paths = prune_partitions(paths or discover_partitions(), start, end, cache_dir)
+    if columns is not None and (start is not None or end is not None) and 'post_time' not in columns:
+        columns = list(columns) + ['post_time']
+    if not paths:
+        return read_csv_typed(empty_csv(), columns=columns)
+
+    max_workers = max_workers or DataConfig.LOAD_WORKERS or os.cpu_count()
+    if len(paths) == 1 or max_workers == 1:
+        frames = [load_engagement(p, columns, cache_dir) for p in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(paths))) as pool:
+            frames = list(pool.map(load_engagement, paths, repeat(columns), repeat(cache_dir)))
+
+    df = pd.concat(unify_categories(frames), ignore_index=True)
+    if start is not None:
+        df = df[df['post_time'] >= pd.Timestamp(start)]
+    if end is not None:
+        df = df[df['post_time'] < pd.Timestamp(end)]
+    return compact_frame(df.reset_index(drop=True))
+
+
+def empty_csv():
+    """CSV kosong dengan header skema, untuk hasil load tanpa partisi"""
+    return io.StringIO(','.join(CSV_DTYPES) + '\n')
@@ -0,0 +1,97 @@
+"""
+Waktu posting terbaik: rata-rata engagement per jam x hari dalam seminggu x platform
+Jumlah postingan dan total metrik per platform x post_type x hari x jam disimpan sebagai
+array padat yang diisi dengan satu np.bincount atas kunci waktu integer (day_number, hour);
+filter sidebar cukup menjumlahkan irisan array, ukurannya tetap 168 sel per kombinasi.
+"""
+import numpy as np
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from src.colors import blues_colorscale
+from src.loader import DAY_ORDER, METRIC_COLUMNS, time_feature
+from src.sentiment import _codes, _labels
+
+AXES = ['platform', 'post_type']
+HOURS = 24
+
+
+class PostingTimeCube:
+    """counts[p, t, d, h] dan sums[metric][p, t, d, h] untuk hari d (0 = Senin) dan jam h"""
+
+    def __init__(self, labels, counts, sums):
+        self.labels = labels
+        self.counts = counts
+        self.sums = sums
+
+    def _select(self, platforms=None, post_types=None):
+        platform_idx = [i for i, p in enumerate(self.labels['platform']) if platforms is None or p in platforms]
+        post_type_idx = [i for i, t in enumerate(self.labels['post_type']) if post_types is None or t in post_types]
+        return np.array(platform_idx, dtype=np.intp), np.array(post_type_idx, dtype=np.intp)
+
+    def by_platform(self, metric, platforms=None, post_types=None):
+        """{platform: (rata-rata [hari, jam], jumlah postingan [hari, jam])} untuk platform yang berisi data"""
+        p, t = self._select(platforms, post_types)
+        counts = self.counts[p][:, t].sum(axis=1)
+        sums = self.sums[metric][p][:, t].sum(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            means = sums / counts
+        return {
+            self.labels['platform'][code]: (means[i], counts[i])
+            for i, code in enumerate(p) if counts[i].any()
+        }
+
+    def merge(self, other):
+        """Gabungkan dua cube (mis. per chunk atau baris baru) pada gabungan label"""
+        labels = {
+            axis: self.labels[axis] + [v for v in other.labels[axis] if v not in self.labels[axis]]
+            for axis in AXES
+        }
+        shape = (len(labels['platform']), len(labels['post_type']), len(DAY_ORDER), HOURS)
+        counts = np.zeros(shape, dtype=np.int64)
+        sums = {m: np.zeros(shape) for m in METRIC_COLUMNS}
+        for cube in (self, other):
+            p, t = (np.array([labels[a].index(v) for v in cube.labels[a]], dtype=np.intp) for a in AXES)
+            counts[np.ix_(p, t)] += cube.counts
+            for m in METRIC_COLUMNS:
+                sums[m][np.ix_(p, t)] += cube.sums[m]
+        return PostingTimeCube(labels, counts, sums)
+
+
+def build_posting_time_cube(df):
+    """Bangun PostingTimeCube dengan satu bincount per array (kode gabungan via ravel_multi_index)"""
+    labels = {axis: _labels(df[axis]) for axis in AXES}
+    p, t = (_codes(df[axis], labels[axis]) for axis in AXES)
+    day = time_feature(df, 'day_of_week').astype(np.int64)
+    hour = time_feature(df, 'hour').astype(np.int64)
+    valid = (p >= 0) & (t >= 0)
+
+    shape = (len(labels['platform']), len(labels['post_type']), len(DAY_ORDER), HOURS)
+    flat = np.ravel_multi_index((p[valid], t[valid], day[valid], hour[valid]), shape)
+    size = int(np.prod(shape))
+    counts = np.bincount(flat, minlength=size).reshape(shape)
+    sums = {m: np.bincount(flat, weights=df[m].to_numpy()[valid], minlength=size).reshape(shape) for m in METRIC_COLUMNS}
+    return PostingTimeCube(labels, counts, sums)
+
+
+def posting_time_figure(by_platform, metric):
+    """Heatmap jam x hari per platform dengan satu skala warna Blues bersama"""
+    title = f"Rata-rata {metric.capitalize()} per Jam dan Hari Posting"
+    if not by_platform:
+        return go.Figure().update_layout(title=title)
+    names = list(by_platform)
+    fig = make_subplots(rows=len(names), cols=1, shared_xaxes=True, subplot_titles=names, vertical_spacing=0.08)
+    for row, name in enumerate(names, start=1):
+        means, counts = by_platform[name]
+        fig.add_trace(go.Heatmap(
+            z=means, x=list(range(HOURS)), y=DAY_ORDER, customdata=counts, coloraxis='coloraxis',
+            hovertemplate='%{y} %{x}:00<br>Rata-rata: %{z:.1f}<br>Postingan: %{customdata}<extra>' + name + '</extra>'
+        ), row=row, col=1)
+    fig.update_layout(
+        title=title,
+        coloraxis=dict(colorscale=blues_colorscale(), colorbar=dict(title=metric.capitalize())),
+        height=max(400, 280 * len(names))
+    )
+    fig.update_xaxes(title_text="Jam", dtick=2, row=len(names), col=1)
+    fig.update_yaxes(autorange='reversed')
+    return fig
@@ -0,0 +1,91 @@
+"""
+Instrumentasi per stage untuk dashboard (aktif jika Config.DEBUG)
+Setiap stage mencatat wall time, jumlah baris, delta memori, dan hit/miss cache;
+hasilnya ditampilkan di panel sidebar dan bisa diekspor sebagai JSON lines.
+"""
+import json
+import os
+import resource
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import pandas as pd
+
+from config.config import Config
+
+
+def rss_bytes():
+    """RSS proses saat ini (Linux /proc), atau RSS puncak dari getrusage sebagai fallback"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class Profiler:
+    """Pencatat stage untuk satu run script; tanpa biaya berarti saat tidak aktif"""
+
+    def __init__(self, page, enabled=None):
+        self.page = page
+        self.enabled = Config.DEBUG if enabled is None else enabled
+        self.run_at = time.strftime('%Y-%m-%dT%H:%M:%S')
+        self.records = []
+        self._open = []
+
+    @contextmanager
+    def stage(self, name, rows=None, cached=False):
+        """
+        Ukur blok kode sebagai satu stage. Record yang di-yield boleh diisi (mis. 'rows')
+        di dalam blok; stage `cached` dianggap hit kecuali miss() dipanggil di dalamnya.
+        """
+        record = {'page': self.page, 'run_at': self.run_at, 'stage': name, 'rows': rows,
+                  'cache': 'hit' if cached else None}
+        if not self.enabled:
+            yield record
+            return
+        self._open.append(record)
+        rss_before = rss_bytes()
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record['seconds'] = time.perf_counter() - start
+            record['mem_delta_mb'] = (rss_bytes() - rss_before) / 2 ** 20
+            self._open.pop()
+            self.records.append(record)
+
+    def miss(self):
+        """Tandai stage yang sedang berjalan sebagai cache miss (dipanggil dari badan fungsi ber-cache)"""
+        if self._open:
+            self._open[-1]['cache'] = 'miss'
+
+    def to_jsonl(self):
+        return ''.join(json.dumps(record, default=str) + '\n' for record in self.records)
+
+    def write_jsonl(self, path):
+        """Tambahkan record run ini ke file JSON lines `path`"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'a') as f:
+            f.write(self.to_jsonl())
+
+    def render(self):
+        """Panel profiling di sidebar (collapsible) plus unduhan JSONL"""
+        if not self.enabled or not self.records:
+            return
+        import streamlit as st
+
+        if Config.PROFILE_LOG:
+            self.write_jsonl(Config.PROFILE_LOG)
+        with st.sidebar.expander("Profiling", expanded=False):
+            table = pd.DataFrame(self.records)[['stage', 'seconds', 'rows', 'mem_delta_mb', 'cache']]
+            st.dataframe(table.round({'seconds': 4, 'mem_delta_mb': 1}), hide_index=True)
+            st.caption(f"Total: {sum(r['seconds'] for r in self.records):.3f} s")
+            st.download_button(
+                "Download JSONL",
+                data=self.to_jsonl(),
+                file_name=f"profile-{self.page}-{self.run_at}.jsonl",
+                mime='application/x-ndjson'
+            )
@@ -0,0 +1,148 @@
+"""
+Refresh inkremental untuk dataset engagement yang hanya bertambah (append-only)
+Offset byte tiap partisi dicatat; saat refresh hanya ekor file yang baru
+diparsing, lalu digabung ke frame, cube, filter index, leaderboard, dan cube sentimen
+yang sudah ada.
+"""
+import io
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from src.cube import build_cube, merge_cubes
+from src.filter_index import build_filter_index
+from src.leaderboard import build_leaderboard
+from src.posting_time import build_posting_time_cube
+from src.sentiment import build_sentiment_cube
+from src.loader import (
+    compact_frame, dataset_signature, discover_partitions, empty_csv, load_partitions, read_csv_typed,
+    unify_categories
+)
+
+
+def complete_size(path, block_size=1 << 16):
+    """Jumlah byte sampai akhir baris lengkap terakhir (baris yang sedang ditulis tidak dihitung)"""
+    with open(path, 'rb') as f:
+        pos = f.seek(0, io.SEEK_END)
+        while pos > 0:
+            start = max(0, pos - block_size)
+            f.seek(start)
+            newline = f.read(pos - start).rfind(b'\n')
+            if newline >= 0:
+                return start + newline + 1
+            pos = start
+    return 0
+
+
+def read_tail(path, offset):
+    """
+    Parse baris lengkap setelah byte `offset` (header ikut dipakai untuk nama kolom).
+    Return (frame atau None, offset baru); baris terakhir yang belum selesai
+    ditulis dibiarkan untuk refresh berikutnya.
+    """
+    with open(path, 'rb') as f:
+        header = f.readline()
+        start = max(offset, len(header))
+        f.seek(start)
+        data = f.read()
+    end = data.rfind(b'\n') + 1
+    if end == 0:
+        return None, start
+    return read_csv_typed(io.BytesIO(header + data[:end])), start + end
+
+
+class LiveDataset:
+    """Frame dan struktur turunannya (cube, filter index, leaderboard, sentimen, waktu posting) yang diperbarui dari baris baru saja"""
+
+    def __init__(self, data_dir=None):
+        self.data_dir = data_dir
+        self.version = 0
+        self.rows_added = 0
+        self.last_refresh = time.monotonic()
+        self._lock = threading.Lock()
+        self._full_load()
+
+    def _full_load(self):
+        while True:
+            signature = dataset_signature(discover_partitions(self.data_dir))
+            offsets = {s[0]: complete_size(s[0]) for s in signature}
+            whole = [s for s in signature if offsets[s[0]] == s[1]]
+            frames = [load_partitions([s[0] for s in whole])] if whole else []
+            # A writer may be mid-line: parse complete rows only, the rest is left for refresh()
+            for path, size, _ in signature:
+                if offsets[path] != size:
+                    tail, offsets[path] = read_tail(path, 0)
+                    if tail is not None:
+                        frames.append(tail)
+            # Files that grew while being read are loaded again so offsets match the frame
+            if dataset_signature([s[0] for s in whole]) == tuple(whole):
+                break
+        if not frames:
+            frames = [read_csv_typed(empty_csv())]
+        df = compact_frame(pd.concat(unify_categories(frames), ignore_index=True))
+        self._offsets = offsets
+        self._publish((df, build_cube(df), build_filter_index(df), build_leaderboard(df), build_sentiment_cube(df),
+                       build_posting_time_cube(df)))
+
+    def _publish(self, state):
+        # Signature and state are swapped in as one tuple (under the refresh lock), so a reader
+        # never pairs a frame with the version key of another refresh
+        self.version += 1
+        signature = (('live', self.version),) + tuple(sorted(self._offsets.items()))
+        self._current = (signature, state)
+
+    @property
+    def signature(self):
+        """Versi data saat ini, untuk key cache figure"""
+        return self._current[0]
+
+    def snapshot(self):
+        """(df, cube, filter_index, leaderboard, sentiment, posting_time) yang konsisten satu sama lain"""
+        return self._current[1]
+
+    def versioned_snapshot(self):
+        """(signature, snapshot()) dari refresh yang sama; dipakai sebagai key cache figure"""
+        return self._current
+
+    def refresh(self):
+        """Parse ekor baru semua partisi dan gabungkan; return jumlah baris baru"""
+        with self._lock:
+            self.last_refresh = time.monotonic()
+            tails = []
+            offsets = dict(self._offsets)
+            for path in discover_partitions(self.data_dir):
+                key = str(Path(path).resolve())
+                size = path.stat().st_size
+                offset = offsets.get(key, 0)
+                if size < offset:
+                    # Rewritten or truncated rather than appended: start over
+                    self._full_load()
+                    self.rows_added = len(self.snapshot()[0])
+                    return self.rows_added
+                if size > offset:
+                    tail, offsets[key] = read_tail(path, offset)
+                    if tail is not None and len(tail):
+                        tails.append(tail)
+            self._offsets = offsets
+            if not tails:
+                self.rows_added = 0
+                return 0
+
+            new = pd.concat(unify_categories(tails), ignore_index=True) if len(tails) > 1 else tails[0]
+            df, cube, filter_index, leaderboard, sentiment, posting_time = self.snapshot()
+            # Concat widens dtypes to fit the new rows; compact again to the smallest safe ones
+            df = compact_frame(pd.concat(unify_categories([df, new]), ignore_index=True))
+            self._publish((
+                df, merge_cubes(cube, build_cube(new)), filter_index.extend(new), leaderboard.extend(new),
+                sentiment.merge(build_sentiment_cube(new)), posting_time.merge(build_posting_time_cube(new))
+            ))
+            self.rows_added = len(new)
+            return self.rows_added
+
+    def refresh_if_due(self, interval):
+        """Refresh jika sudah lewat `interval` detik sejak refresh terakhir"""
+        if time.monotonic() - self.last_refresh >= interval:
+            return self.refresh()
+        return 0
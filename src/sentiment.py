@@ -0,0 +1,186 @@
+"""
+Analisis engagement per sentimen (sentiment_score)
+Jumlah postingan dan total metrik per sentimen x platform x post_type, serta komposisi
+sentimen per minggu, disimpan sebagai array padat yang diisi dengan satu np.bincount atas
+kode kategori; filter sidebar cukup memilih irisan array, bukan memindai baris lagi.
+"""
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from src.colors import blues_colorscale, blues_hex
+from src.loader import METRIC_COLUMNS, time_feature
+
+SENTIMENT_ORDER = ['positive', 'neutral', 'negative']
+AXES = ['sentiment_score', 'platform', 'post_type']
+
+
+def _codes(series, labels):
+    """Kode posisi tiap nilai di `labels` (-1 jika tidak ada) tanpa membuat objek per baris"""
+    categorical = series.astype('category')
+    categories = [str(v) for v in categorical.cat.categories]
+    mapping = np.array([labels.index(v) if v in labels else -1 for v in categories] + [-1])
+    return mapping[categorical.cat.codes.to_numpy()]
+
+
+def _labels(series, preferred=()):
+    present = [str(v) for v in series.astype('category').cat.categories]
+    return [v for v in preferred if v in present] + sorted(v for v in present if v not in preferred)
+
+
+class SentimentCube:
+    """
+    counts[s, p, t] dan sums[metric][s, p, t] untuk sentimen s, platform p, post_type t;
+    weekly[p, t, w, s] = jumlah postingan pada minggu first_week + w.
+    """
+
+    def __init__(self, labels, counts, sums, first_week, weekly):
+        self.labels = labels
+        self.counts = counts
+        self.sums = sums
+        self.first_week = first_week
+        self.weekly = weekly
+
+    def _select(self, platforms=None, post_types=None):
+        platform_idx = [i for i, p in enumerate(self.labels['platform']) if platforms is None or p in platforms]
+        post_type_idx = [i for i, t in enumerate(self.labels['post_type']) if post_types is None or t in post_types]
+        return np.array(platform_idx, dtype=np.intp), np.array(post_type_idx, dtype=np.intp)
+
+    def breakdown(self, platforms=None, post_types=None):
+        """Jumlah dan rata-rata metrik per (sentimen, platform, post_type) yang berisi data"""
+        p, t = self._select(platforms, post_types)
+        counts = self.counts[:, p][:, :, t]
+        index = pd.MultiIndex.from_product(
+            [self.labels['sentiment_score'], np.array(self.labels['platform'])[p], np.array(self.labels['post_type'])[t]],
+            names=AXES
+        )
+        frame = pd.DataFrame({'count': counts.ravel()}, index=index)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for m in METRIC_COLUMNS:
+                frame[m] = (self.sums[m][:, p][:, :, t] / counts).ravel()
+        return frame[frame['count'] > 0]
+
+    def by_sentiment(self, platforms=None, post_types=None):
+        """Rata-rata metrik per sentimen (index urut SENTIMENT_ORDER)"""
+        p, t = self._select(platforms, post_types)
+        counts = self.counts[:, p][:, :, t].sum(axis=(1, 2))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            frame = pd.DataFrame(
+                {m: self.sums[m][:, p][:, :, t].sum(axis=(1, 2)) / counts for m in METRIC_COLUMNS},
+                index=pd.Index(self.labels['sentiment_score'], name='sentiment_score')
+            )
+        return frame[counts > 0]
+
+    def weekly_mix(self, platforms=None, post_types=None):
+        """Porsi tiap sentimen per minggu (baris = awal minggu, Senin; kolom = sentimen)"""
+        p, t = self._select(platforms, post_types)
+        counts = self.weekly[p][:, t].sum(axis=(0, 1))
+        totals = counts.sum(axis=1)
+        keep = totals > 0
+        # Week 0 starts on Monday 1969-12-29 (see loader.add_time_features)
+        starts = ((self.first_week + np.arange(len(counts))) * 7 - 3).astype('datetime64[D]')
+        return pd.DataFrame(
+            counts[keep] / totals[keep, None],
+            index=pd.DatetimeIndex(starts[keep], name='week'),
+            columns=self.labels['sentiment_score']
+        )
+
+    def merge(self, other):
+        """Gabungkan dua cube (mis. per chunk atau baris baru) pada gabungan label"""
+        labels = {
+            axis: self.labels[axis] + [v for v in other.labels[axis] if v not in self.labels[axis]]
+            for axis in AXES
+        }
+        first_week = min(self.first_week, other.first_week)
+        n_weeks = max(self.first_week + self.weekly.shape[2], other.first_week + other.weekly.shape[2]) - first_week
+        shape = tuple(len(labels[axis]) for axis in AXES)
+        counts = np.zeros(shape, dtype=np.int64)
+        sums = {m: np.zeros(shape) for m in METRIC_COLUMNS}
+        weekly = np.zeros((shape[1], shape[2], n_weeks, shape[0]), dtype=np.int64)
+        for cube in (self, other):
+            s, p, t = (np.array([labels[a].index(v) for v in cube.labels[a]], dtype=np.intp) for a in AXES)
+            counts[np.ix_(s, p, t)] += cube.counts
+            for m in METRIC_COLUMNS:
+                sums[m][np.ix_(s, p, t)] += cube.sums[m]
+            w = np.arange(cube.weekly.shape[2]) + cube.first_week - first_week
+            weekly[np.ix_(p, t, w, s)] += cube.weekly
+        return SentimentCube(labels, counts, sums, first_week, weekly)
+
+
+def build_sentiment_cube(df):
+    """Bangun SentimentCube dengan satu bincount per array (kode gabungan via ravel_multi_index)"""
+    labels = {axis: _labels(df[axis], SENTIMENT_ORDER if axis == 'sentiment_score' else ()) for axis in AXES}
+    codes = [_codes(df[axis], labels[axis]) for axis in AXES]
+    week = time_feature(df, 'week')
+    valid = np.logical_and.reduce([c >= 0 for c in codes])
+    first_week = int(week.min()) if len(week) else 0
+    n_weeks = int(week.max()) - first_week + 1 if len(week) else 0
+
+    s, p, t = (c[valid] for c in codes)
+    shape = tuple(len(labels[axis]) for axis in AXES)
+    flat = np.ravel_multi_index((s, p, t), shape)
+    size = int(np.prod(shape))
+    counts = np.bincount(flat, minlength=size).reshape(shape)
+    sums = {m: np.bincount(flat, weights=df[m].to_numpy()[valid], minlength=size).reshape(shape) for m in METRIC_COLUMNS}
+
+    weekly_shape = (shape[1], shape[2], n_weeks, shape[0])
+    weekly_flat = np.ravel_multi_index((p, t, week[valid] - first_week, s), weekly_shape)
+    weekly = np.bincount(weekly_flat, minlength=int(np.prod(weekly_shape))).reshape(weekly_shape)
+    return SentimentCube(labels, counts, sums, first_week, weekly)
+
+
+def sentiment_bar_figure(means):
+    """Grouped bar rata-rata metrik per sentimen, satu normalisasi Blues lintas trace"""
+    vmin, vmax = np.nanmin(means.to_numpy()), np.nanmax(means.to_numpy())
+    fig = go.Figure()
+    for metric in METRIC_COLUMNS:
+        fig.add_trace(go.Bar(
+            x=means.index, y=means[metric], name=f'Rata-rata {metric.capitalize()}',
+            marker_color=blues_hex(means[metric], vmin, vmax)
+        ))
+    fig.update_layout(
+        title="Rata-rata Engagement Berdasarkan Sentimen",
+        xaxis_title="Sentimen",
+        yaxis_title="Jumlah Rata-rata",
+        barmode='group'
+    )
+    return fig
+
+
+def sentiment_heatmap_figure(breakdown, metric):
+    """Heatmap rata-rata `metric` per (platform / post_type) x sentimen"""
+    table = breakdown[metric].unstack('sentiment_score')
+    table = table[[s for s in breakdown.index.unique('sentiment_score') if s in table.columns]]
+    fig = go.Figure(go.Heatmap(
+        z=table.to_numpy(),
+        x=list(table.columns),
+        y=[f'{p} / {t}' for p, t in table.index],
+        colorscale=blues_colorscale(),
+        colorbar=dict(title=metric.capitalize())
+    ))
+    fig.update_layout(
+        title=f"Rata-rata {metric.capitalize()} per Sentimen, Platform, dan Jenis Postingan",
+        xaxis_title="Sentimen",
+        yaxis_title="Platform / Jenis Postingan",
+        height=max(400, 24 * len(table))
+    )
+    return fig
+
+
+def sentiment_mix_figure(mix):
+    """Area bertumpuk porsi sentimen per minggu"""
+    # Lightest shade is reserved for the background, so the scale starts one step below
+    colors = blues_hex(np.arange(len(mix.columns))[::-1], -1, len(mix.columns) - 1)
+    fig = go.Figure()
+    for sentiment, color in zip(mix.columns, colors):
+        fig.add_trace(go.Scatter(
+            x=mix.index, y=mix[sentiment], name=sentiment, stackgroup='mix',
+            mode='lines', line=dict(color=color, width=0.5)
+        ))
+    fig.update_layout(
+        title="Komposisi Sentimen per Minggu",
+        xaxis_title="Minggu",
+        yaxis=dict(title="Porsi Postingan", tickformat='.0%'),
+        hovermode='x unified'
+    )
+    return fig
@@ -0,0 +1,178 @@
+"""
+Dataset engagement bersama untuk deployment Streamlit multi-replika
+Satu proses loader menulis kolom bertipe frame yang sudah dipadatkan sebagai file .npy
+(kolom kategori sebagai kode integer) di StreamlitConfig.SHARED_DATASET_DIR, secara default
+di /dev/shm. Setiap replika memetakan file tersebut dengan np.load(mmap_mode='r') sehingga
+semua proses berbagi halaman memori yang sama tanpa menyalin maupun mem-parsing ulang.
+
+    python -m src.shared_dataset                 # publish + jalankan StreamlitConfig.REPLICAS replika
+    python -m src.shared_dataset --publish-only  # publish saja (mis. dari cron setelah data berubah)
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from config.config import Config, StreamlitConfig
+from src.loader import dataset_signature, discover_partitions, load_partitions, project_path
+
+CURRENT = 'current.json'
+META = 'meta.json'
+DASHBOARD = 'dashboard_social_media_engagement.py'
+
+
+def _root(root=None):
+    return project_path(root or StreamlitConfig.SHARED_DATASET_DIR)
+
+
+def _version_name(signature):
+    return hashlib.sha1(repr(tuple(tuple(s) for s in signature)).encode()).hexdigest()[:16]
+
+
+def _write_json(path, payload):
+    # Written beside the target then renamed, so readers never see a partial file
+    tmp = path.with_name(f".{path.name}.{os.getpid()}")
+    tmp.write_text(json.dumps(payload))
+    os.replace(tmp, path)
+
+
+def _write_columns(df, directory):
+    columns = []
+    for i, col in enumerate(df.columns):
+        series = df[col]
+        if not isinstance(series.dtype, pd.CategoricalDtype) and \
+                (pd.api.types.is_object_dtype(series.dtype) or pd.api.types.is_string_dtype(series.dtype)):
+            # Python objects cannot be mapped; high-cardinality text is shared as codes too
+            series = series.astype('category')
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Saved in the dtype from_codes keeps, so attach() never narrows (copies) the mapped codes
+            codes = pd.Categorical.from_codes(series.array.codes, dtype=series.dtype).codes
+            np.save(directory / f"{i}.npy", codes)
+            columns.append({
+                'name': col, 'categories': [str(c) for c in series.cat.categories],
+                'ordered': bool(series.cat.ordered)
+            })
+        else:
+            np.save(directory / f"{i}.npy", series.to_numpy())
+            columns.append({'name': col})
+    return columns
+
+
+def publish(paths=None, root=None):
+    """
+    Load dan padatkan dataset lalu publikasikan sebagai versi baru (jika belum ada), arahkan
+    current.json ke versi tersebut, dan hapus versi yang lebih lama dari versi sebelumnya.
+    Versi sebelumnya dipertahankan sampai publish berikutnya, sehingga replika yang baru
+    membaca signature lama masih bisa attach. Return signature yang dipublikasikan.
+    """
+    root = _root(root)
+    root.mkdir(parents=True, exist_ok=True)
+    paths = paths or discover_partitions()
+    signature = dataset_signature(paths)
+    name = _version_name(signature)
+    target = root / name
+    current = root / CURRENT
+    previous = json.loads(current.read_text())['version'] if current.exists() else None
+
+    if not (target / META).exists():
+        df = load_partitions(paths)
+        staging = root / f".{name}.{os.getpid()}"
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir()
+        columns = _write_columns(df, staging)
+        (staging / META).write_text(json.dumps({'signature': signature, 'rows': len(df), 'columns': columns}))
+        shutil.rmtree(target, ignore_errors=True)
+        os.rename(staging, target)
+
+    _write_json(current, {'version': name, 'signature': signature})
+    # A replica may have read the previous signature just before the switch
+    for old in root.iterdir():
+        if old.is_dir() and old.name not in (name, previous) and not old.name.startswith('.'):
+            shutil.rmtree(old, ignore_errors=True)
+    return signature
+
+
+def published_signature(root=None):
+    """Signature versi yang sedang dipublikasikan; dipakai replika sebagai key cache"""
+    path = _root(root) / CURRENT
+    if not path.exists():
+        raise FileNotFoundError(f"No shared dataset published in {path.parent}; run: python -m src.shared_dataset")
+    return tuple(tuple(s) for s in json.loads(path.read_text())['signature'])
+
+
+def attach(signature, root=None):
+    """
+    Frame read-only yang kolomnya dipetakan langsung dari file versi `signature` (zero-copy,
+    termasuk kode kolom kategori). Cek dengan df[col].array.codes / df[col].to_numpy(), bukan
+    df[col].cat.codes (Series baru, salinan) atau np.load kedua (mapping lain, alamat berbeda).
+    """
+    directory = _root(root) / _version_name(signature)
+    meta = json.loads((directory / META).read_text())
+    columns = {}
+    for i, column in enumerate(meta['columns']):
+        values = np.load(directory / f"{i}.npy", mmap_mode='r')
+        if 'categories' in column:
+            dtype = pd.CategoricalDtype(column['categories'], ordered=column['ordered'])
+            values = pd.Categorical.from_codes(values, dtype=dtype)
+        columns[column['name']] = values
+    return pd.DataFrame(columns, copy=False)
+
+
+def run_replicas(replicas=None, port=None, root=None):
+    """
+    Publish dataset lalu jalankan `replicas` proses Streamlit (port, port + 1, ...) dengan
+    DATA_SOURCE=shared. Dengan Config.REFRESH_INTERVAL_SECONDS > 0, dataset dipublikasikan
+    ulang saat partisi berubah; replika mengikuti pada rerun berikutnya.
+    """
+    replicas = replicas or StreamlitConfig.REPLICAS
+    port = port or StreamlitConfig.SERVER_PORT
+    signature = publish(root=root)
+    env = dict(os.environ, DATA_SOURCE='shared', SHARED_DATASET_DIR=str(_root(root)))
+    processes = [
+        subprocess.Popen(
+            [sys.executable, '-m', 'streamlit', 'run', DASHBOARD, '--server.port', str(port + i),
+             '--server.headless', 'true', '--logger.level', StreamlitConfig.LOGGER_LEVEL],
+            cwd=project_path('.'), env=env
+        )
+        for i in range(replicas)
+    ]
+    # SIGTERM (e.g. from a process manager) also goes through the cleanup below
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    print(f"{replicas} replica(s) on ports {port}-{port + replicas - 1}, dataset in {_root(root)}")
+    try:
+        while all(p.poll() is None for p in processes):
+            time.sleep(Config.REFRESH_INTERVAL_SECONDS or 1)
+            if Config.REFRESH_INTERVAL_SECONDS > 0 and dataset_signature(discover_partitions()) != signature:
+                signature = publish(root=root)
+    finally:
+        for p in processes:
+            p.terminate()
+        for p in processes:
+            p.wait()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--replicas', type=int, help=f'default: {StreamlitConfig.REPLICAS}')
+    parser.add_argument('--port', type=int, help=f'first replica port (default: {StreamlitConfig.SERVER_PORT})')
+    parser.add_argument('--root', help=f'default: {StreamlitConfig.SHARED_DATASET_DIR}')
+    parser.add_argument('--publish-only', action='store_true', help='publish the dataset and exit')
+    args = parser.parse_args(argv)
+
+    if args.publish_only:
+        publish(root=args.root)
+        print(f"Dataset published in {_root(args.root)}")
+        return
+    run_replicas(args.replicas, args.port, args.root)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,247 @@
+"""
+Ekspor snapshot statis dashboard Social Media Engagement
+Enam visualisasi beserta insight-nya dihitung tanpa server Streamlit untuk view default
+dan kombinasi filter di SnapshotConfig.FILTERS, lalu ditulis sebagai HTML mandiri
+(figure Plotly tertanam) dan JSON. manifest.json mencatat partisi data yang dipakai tiap
+snapshot; hanya snapshot yang partisinya berubah yang dibangun ulang.
+
+    python -m src.snapshot
+    python -m src.snapshot --force
+"""
+import argparse
+import html
+import json
+import re
+import time
+
+import numpy as np
+from plotly.offline import get_plotlyjs
+
+from config.config import SnapshotConfig
+from src.boxstats import box_figure, platform_box_stats
+from src.charts import BOX_CHART, ENGAGEMENT_CHARTS, ENGAGEMENT_SECTIONS, ChartSet
+from src.cube import build_cube
+from src.filter_index import build_filter_index
+from src.loader import (
+    METRIC_COLUMNS, discover_partitions, load_engagement, load_partitions, project_path, source_signature
+)
+
+MANIFEST = 'manifest.json'
+FILTER_KEYS = ['platforms', 'post_types']
+PAGE_STYLE = (
+    "body{font-family:sans-serif;max-width:1200px;margin:auto;padding:1rem}"
+    ".row{display:flex;gap:1rem}.row>div{flex:1;min-width:0}"
+)
+
+
+def normalize_filters(filters):
+    """{'platforms': [...] | None, 'post_types': [...] | None}; None = semua nilai"""
+    unknown = set(filters) - set(FILTER_KEYS)
+    if unknown:
+        raise ValueError(f"Unknown snapshot filter keys: {sorted(unknown)}")
+    return {key: sorted(filters[key]) if filters.get(key) else None for key in FILTER_KEYS}
+
+
+def parse_filters(spec, platforms):
+    """View default plus kombinasi dari `spec` (JSON), atau satu snapshot per platform"""
+    combos = json.loads(spec) if spec else [{'platforms': [p]} for p in platforms]
+    combos = [normalize_filters({})] + [normalize_filters(c) for c in combos]
+    unique = []
+    for combo in combos:
+        if combo not in unique:
+            unique.append(combo)
+    return unique
+
+
+def snapshot_slug(filters):
+    """Nama file snapshot, mis. 'default' atau 'platforms-instagram__post_types-image-video'"""
+    parts = [f"{key}-{'-'.join(values)}" for key, values in filters.items() if values is not None]
+    return re.sub(r'[^a-z0-9_-]+', '_', '__'.join(parts).lower()) or 'default'
+
+
+def partition_cells(path, cache_dir=None):
+    """Pasangan (platform, post_type) yang ada di sebuah partisi (hanya dua kolom dibaca)"""
+    cells = load_engagement(path, columns=['platform', 'post_type'], cache_dir=cache_dir).astype(str)
+    return set(cells.itertuples(index=False, name=None))
+
+
+def dependencies(filters, cells_by_partition):
+    """Signature partisi yang berisi baris untuk `filters`"""
+    return [
+        list(signature) for signature, cells in cells_by_partition.items()
+        if any(
+            (filters['platforms'] is None or platform in filters['platforms'])
+            and (filters['post_types'] is None or post_type in filters['post_types'])
+            for platform, post_type in cells
+        )
+    ]
+
+
+def build_snapshot(df, cube, filter_index, filters):
+    """Figure dan insight keenam bagian dashboard untuk satu state filter"""
+    platforms, post_types = filters['platforms'], filters['post_types']
+    rows = filter_index.select(platform=platforms, post_type=post_types)
+
+    def histograms(metrics):
+        return {m: np.histogram(df[m].to_numpy()[rows], bins=20) for m in metrics}
+
+    charts = ChartSet(ENGAGEMENT_CHARTS, cube, histograms, platforms, post_types)
+    sections = []
+    for section in ENGAGEMENT_SECTIONS:
+        figures = []
+        for chart_id in section.chart_ids:
+            if chart_id == 'box':
+                box_platforms = [p for p in filter_index.values['platform'] if platforms is None or p in platforms]
+                figures.append(box_figure(*platform_box_stats(df, rows, box_platforms, METRIC_COLUMNS), **BOX_CHART))
+            else:
+                figures.append(charts.figure(chart_id))
+        sections.append((section, figures))
+    return len(rows), sections
+
+
+def _markdown_html(text):
+    """Markdown sederhana teks insight: **tebal** dan paragraf dipisah baris kosong"""
+    escaped = re.sub(r'[*][*](.+?)[*][*]', r'<strong>\1</strong>', html.escape(text))
+    return ''.join(f"<p>{p.strip()}</p>" for p in escaped.split('\n\n') if p.strip())
+
+
+def _filter_label(filters):
+    parts = [f"{key}: {', '.join(values)}" for key, values in filters.items() if values is not None]
+    return '; '.join(parts) or 'semua data (view default)'
+
+
+def render_html(filters, n_rows, sections, generated, plotlyjs):
+    """Halaman HTML mandiri; plotly.js disertakan sekali sesuai mode `plotlyjs`"""
+    body = []
+    first = True
+    for section, figures in sections:
+        divs = []
+        for fig in figures:
+            include = plotlyjs if first else False
+            divs.append(f"<div>{fig.to_html(full_html=False, include_plotlyjs=include)}</div>")
+            first = False
+        body.append(
+            f"<h2>{html.escape(section.title)}</h2><div class=\"row\">{''.join(divs)}</div>"
+            f"{_markdown_html(section.insight)}"
+        )
+    return (
+        "<!DOCTYPE html><html lang=\"id\"><head><meta charset=\"utf-8\">"
+        f"<title>Social Media Engagement Dashboard - {html.escape(_filter_label(filters))}</title>"
+        f"<style>{PAGE_STYLE}</style></head><body>"
+        "<h1>📊 Social Media Engagement Dashboard</h1>"
+        f"<p>Filter: {html.escape(_filter_label(filters))} | {n_rows:,} records | dibuat {generated}</p>"
+        f"{''.join(body)}</body></html>"
+    )
+
+
+def render_index(manifest):
+    items = ''.join(
+        f"<li><a href=\"{slug}.html\">{html.escape(_filter_label(entry['filters']))}</a>"
+        f" ({entry['rows']:,} records, {entry['generated']})</li>"
+        for slug, entry in manifest.items()
+    )
+    return (
+        "<!DOCTYPE html><html lang=\"id\"><head><meta charset=\"utf-8\">"
+        f"<title>Snapshot Social Media Engagement</title><style>{PAGE_STYLE}</style></head><body>"
+        f"<h1>📊 Snapshot Social Media Engagement</h1><ul>{items}</ul></body></html>"
+    )
+
+
+def export_snapshots(output_dir=None, filters=None, force=False, data_dir=None, cache_dir=None, plotlyjs=None):
+    """
+    Tulis snapshot yang kedaluwarsa ke `output_dir`; return {'written': [...], 'skipped': [...],
+    'empty': [...]}. Snapshot dianggap kedaluwarsa bila signature partisi yang berisi barisnya
+    berubah, filternya baru, atau filenya hilang. State filter tanpa baris tidak dibangun
+    (dilaporkan di 'empty'). Data hanya di-load jika ada yang perlu dibangun.
+    """
+    output_dir = project_path(output_dir or SnapshotConfig.OUTPUT_DIR)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    plotlyjs = plotlyjs or SnapshotConfig.PLOTLYJS
+    paths = discover_partitions(data_dir)
+    cells_by_partition = {source_signature(p): partition_cells(p, cache_dir) for p in paths}
+    platforms = sorted({platform for cells in cells_by_partition.values() for platform, _ in cells})
+    combos = parse_filters(SnapshotConfig.FILTERS if filters is None else filters, platforms)
+
+    manifest_path = output_dir / MANIFEST
+    previous = json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+    manifest, stale, empty = {}, [], []
+    for combo in combos:
+        slug = snapshot_slug(combo)
+        deps = dependencies(combo, cells_by_partition)
+        if not deps:
+            # No partition holds a matching row, so there is nothing to chart
+            empty.append(slug)
+            continue
+        entry = previous.get(slug)
+        files_exist = all((output_dir / f"{slug}.{ext}").exists() for ext in ('html', 'json'))
+        if force or entry is None or entry['dependencies'] != deps or not files_exist:
+            stale.append((slug, combo, deps))
+        else:
+            manifest[slug] = entry
+
+    if stale:
+        df = load_partitions(paths, cache_dir=cache_dir)
+        cube = build_cube(df)
+        filter_index = build_filter_index(df)
+        if plotlyjs == 'directory' and not (output_dir / 'plotly.min.js').exists():
+            (output_dir / 'plotly.min.js').write_text(get_plotlyjs(), encoding='utf-8')
+        for slug, combo, deps in stale:
+            generated = time.strftime('%Y-%m-%d %H:%M:%S')
+            n_rows, sections = build_snapshot(df, cube, filter_index, combo)
+            payload = {
+                'filters': combo,
+                'rows': n_rows,
+                'generated': generated,
+                'sections': [
+                    {
+                        'section_id': section.section_id,
+                        'title': section.title,
+                        'insight': section.insight,
+                        'figures': [json.loads(fig.to_json()) for fig in figures],
+                    }
+                    for section, figures in sections
+                ],
+            }
+            (output_dir / f"{slug}.json").write_text(json.dumps(payload), encoding='utf-8')
+            (output_dir / f"{slug}.html").write_text(
+                render_html(combo, n_rows, sections, generated, plotlyjs), encoding='utf-8'
+            )
+            manifest[slug] = {'filters': combo, 'dependencies': deps, 'rows': n_rows, 'generated': generated}
+
+    manifest = {snapshot_slug(c): manifest[snapshot_slug(c)] for c in combos if snapshot_slug(c) in manifest}
+    manifest_path.write_text(json.dumps(manifest, indent=2))
+    (output_dir / 'index.html').write_text(render_index(manifest), encoding='utf-8')
+
+    # Files of snapshots dropped from the configuration (or left without rows) are removed
+    # only once the new manifest and index no longer link to them
+    for slug in set(previous) - set(manifest):
+        for ext in ('html', 'json'):
+            (output_dir / f"{slug}.{ext}").unlink(missing_ok=True)
+
+    return {
+        'output_dir': output_dir,
+        'written': [slug for slug, _, _ in stale],
+        'skipped': [slug for slug in manifest if slug not in {s for s, _, _ in stale}],
+        'empty': empty,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--output-dir', help=f'default: {SnapshotConfig.OUTPUT_DIR}')
+    parser.add_argument('--filters', help='JSON list of filter states, e.g. \'[{"platforms": ["Instagram"]}]\'')
+    parser.add_argument('--force', action='store_true', help='rebuild every snapshot')
+    args = parser.parse_args(argv)
+
+    result = export_snapshots(args.output_dir, args.filters, args.force)
+    for slug in result['written']:
+        print(f"written  {slug}")
+    for slug in result['skipped']:
+        print(f"skipped  {slug} (data unchanged)")
+    for slug in result['empty']:
+        print(f"skipped  {slug} (no rows match these filters)")
+    print(f"\nSnapshots in {result['output_dir']}")
+
+
+if __name__ == '__main__':
+    main()
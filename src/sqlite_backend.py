@@ -0,0 +1,263 @@
+"""
+Backend SQLite untuk dataset Social Media Engagement
+CSV diimpor sekali ke tabel SQLite berindeks di database DatabaseConfig.DB_PATH (tabel lain
+di database yang sama tidak disentuh); filter
+sidebar dan agregasi per platform/post_type/hari/tanggal dijalankan sebagai SQL
+lewat pool koneksi read-only, sehingga proses Streamlit hanya memegang hasil agregat.
+"""
+import queue
+import sqlite3
+from contextlib import closing, contextmanager
+
+import numpy as np
+import pandas as pd
+
+from config.config import DatabaseConfig
+from src.boxstats import MAX_OUTLIERS, frequency_box_stats
+from src.loader import CSV_DTYPES, METRIC_COLUMNS, SCHEMA_VERSION, TIME_FEATURES, iter_csv_typed, project_path
+
+TABLE = 'engagement'
+# The import fills this table first and renames it to TABLE in one transaction
+STAGING_TABLE = f'{TABLE}_new'
+# Namespaced so the import never clashes with other tables in DatabaseConfig.DB_PATH
+META_TABLE = f'{TABLE}_meta'
+TABLE_SCHEMA = """
+CREATE TABLE {table} (
+    post_id INTEGER PRIMARY KEY,
+    platform TEXT NOT NULL,
+    post_type TEXT NOT NULL,
+    post_time TEXT NOT NULL,
+    likes INTEGER NOT NULL,
+    comments INTEGER NOT NULL,
+    shares INTEGER NOT NULL,
+    post_day TEXT NOT NULL,
+    sentiment_score TEXT,
+    day_number INTEGER NOT NULL,
+    hour INTEGER NOT NULL,
+    day_of_week INTEGER NOT NULL,
+    week INTEGER NOT NULL
+)
+"""
+INDEXES = [
+    f"CREATE INDEX idx_{TABLE}_platform ON {TABLE} (platform, post_type)",
+    f"CREATE INDEX idx_{TABLE}_post_type ON {TABLE} (post_type)",
+    f"CREATE INDEX idx_{TABLE}_post_day ON {TABLE} (post_day)",
+    f"CREATE INDEX idx_{TABLE}_day_number ON {TABLE} (day_number)",
+]
+
+# Dashboard grouping keys -> table columns
+GROUP_COLUMNS = {'platform': 'platform', 'post_type': 'post_type', 'post_day': 'post_day', 'date': 'day_number'}
+
+
+def db_path(path=None):
+    return project_path(path or DatabaseConfig.DB_PATH)
+
+
+def _signature_value(signature):
+    # The loader schema version is part of the key so a layout change forces a re-import
+    return repr((SCHEMA_VERSION,) + tuple(signature))
+
+
+def stored_signature(path=None):
+    """Signature sumber yang tersimpan di database, atau None jika belum diimpor"""
+    path = db_path(path)
+    if not path.exists():
+        return None
+    # sqlite3's context manager only commits; closing() releases the connection
+    with closing(sqlite3.connect(f'file:{path}?mode=ro', uri=True)) as conn:
+        try:
+            row = conn.execute(f"SELECT value FROM {META_TABLE} WHERE key = 'signature'").fetchone()
+        except sqlite3.DatabaseError:
+            return None
+    return row[0] if row else None
+
+
+def import_engagement(signature, path=None, chunksize=100000):
+    """
+    Impor semua partisi CSV ke tabel staging di database yang ada, lalu dalam satu transaksi
+    ganti tabel engagement lama, buat indeks, dan simpan signature sumbernya. Pembaca
+    melihat tabel lama atau tabel baru yang lengkap; tabel lain di database tidak berubah.
+    """
+    path = db_path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    columns = list(CSV_DTYPES) + list(TIME_FEATURES)
+
+    # Autocommit mode, so the transactions below are exactly the explicit BEGIN/COMMIT pairs
+    conn = sqlite3.connect(path, isolation_level=None)
+    try:
+        conn.execute(f'CREATE TABLE IF NOT EXISTS {META_TABLE} (key TEXT PRIMARY KEY, value TEXT)')
+        conn.execute(f'DROP TABLE IF EXISTS {STAGING_TABLE}')
+        conn.execute(TABLE_SCHEMA.format(table=STAGING_TABLE))
+        conn.execute('BEGIN')
+        for source in signature:
+            for chunk in iter_csv_typed(source[0], chunksize):
+                rows = chunk.assign(post_time=chunk['post_time'].dt.strftime('%Y-%m-%d %H:%M:%S'))
+                conn.executemany(
+                    f"INSERT INTO {STAGING_TABLE} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                    rows[columns].astype(object).itertuples(index=False, name=None),
+                )
+        conn.execute('COMMIT')
+
+        conn.execute('BEGIN IMMEDIATE')
+        conn.execute(f'DROP TABLE IF EXISTS {TABLE}')
+        conn.execute(f'ALTER TABLE {STAGING_TABLE} RENAME TO {TABLE}')
+        # Indexes are built once after the bulk insert, which is much faster than per row
+        for statement in INDEXES:
+            conn.execute(statement)
+        conn.execute(
+            f"INSERT OR REPLACE INTO {META_TABLE} VALUES ('signature', ?)", (_signature_value(signature),)
+        )
+        conn.execute('COMMIT')
+        conn.execute(f'ANALYZE {TABLE}')
+    except BaseException:
+        if conn.in_transaction:
+            conn.execute('ROLLBACK')
+        raise
+    finally:
+        conn.close()
+    return path
+
+
+class ReadOnlyPool:
+    """Pool koneksi SQLite read-only yang aman dipakai bersama antar thread Streamlit"""
+
+    def __init__(self, path, size):
+        self._connections = queue.Queue()
+        self._closed = False
+        for _ in range(size):
+            conn = sqlite3.connect(f'file:{path}?mode=ro', uri=True, check_same_thread=False)
+            self._connections.put(conn)
+
+    @contextmanager
+    def connection(self):
+        conn = self._connections.get()
+        try:
+            yield conn
+        finally:
+            # A connection checked out while the pool closed is closed on return
+            if self._closed:
+                conn.close()
+            else:
+                self._connections.put(conn)
+
+    def close(self):
+        """Tutup semua koneksi yang sedang tidak dipakai; sisanya ditutup saat dikembalikan"""
+        self._closed = True
+        while True:
+            try:
+                self._connections.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def query(self, sql, params=()):
+        with self.connection() as conn:
+            return conn.execute(sql, params).fetchall()
+
+    def query_frame(self, sql, params=()):
+        with self.connection() as conn:
+            return pd.read_sql_query(sql, conn, params=params)
+
+
+def _where(platforms=None, post_types=None, **equals):
+    """Klausa WHERE berparameter untuk filter sidebar"""
+    clauses, params = [], []
+    for col, selected in [('platform', platforms), ('post_type', post_types)]:
+        if selected is not None:
+            selected = [str(v) for v in selected]
+            clauses.append(f"{col} IN ({', '.join('?' * len(selected))})")
+            params.extend(selected)
+    for col, value in equals.items():
+        clauses.append(f'{col} = ?')
+        params.append(value)
+    return (' WHERE ' + ' AND '.join(clauses) if clauses else ''), params
+
+
+class SqliteEngagementStore:
+    """
+    Query agregat engagement di SQLite. mean()/total() punya kontrak yang sama
+    dengan EngagementCube sehingga Visualisasi 2-5 bisa memakai keduanya.
+    """
+
+    def __init__(self, path=None, pool_size=None):
+        self.path = db_path(path)
+        self.pool = ReadOnlyPool(self.path, pool_size or DatabaseConfig.POOL_SIZE)
+        self.n_rows = self.pool.query(f'SELECT COUNT(*) FROM {TABLE}')[0][0]
+        self.shape = (self.n_rows, len(CSV_DTYPES))
+
+    def close(self):
+        """Tutup pool koneksi (mis. saat store lama dikeluarkan dari cache Streamlit)"""
+        self.pool.close()
+
+    def distinct(self, col):
+        """Nilai unik kolom dalam urutan kemunculan pertama (seperti Series.unique)"""
+        rows = self.pool.query(f'SELECT {col} FROM {TABLE} GROUP BY {col} ORDER BY MIN(rowid)')
+        return [r[0] for r in rows]
+
+    def count(self, platforms=None, post_types=None):
+        where, params = _where(platforms, post_types)
+        return self.pool.query(f'SELECT COUNT(*) FROM {TABLE}{where}', params)[0][0]
+
+    def preview(self, platforms=None, post_types=None, n=5):
+        where, params = _where(platforms, post_types)
+        df = self.pool.query_frame(
+            f"SELECT {', '.join(CSV_DTYPES)} FROM {TABLE}{where} ORDER BY rowid LIMIT {int(n)}", params
+        )
+        df['post_time'] = pd.to_datetime(df['post_time'])
+        return df
+
+    def _grouped(self, func, by, platforms=None, post_types=None):
+        col = GROUP_COLUMNS[by]
+        where, params = _where(platforms, post_types)
+        aggregates = ', '.join(f'{func}({m}) AS {m}' for m in METRIC_COLUMNS)
+        df = self.pool.query_frame(
+            f'SELECT {col} AS {by}, {aggregates} FROM {TABLE}{where} GROUP BY {col} ORDER BY {col}', params
+        )
+        if by == 'date':
+            df['date'] = pd.to_datetime(df['date'].to_numpy().astype('datetime64[D]'))
+        return df.set_index(by)
+
+    def mean(self, by, platforms=None, post_types=None):
+        """Rata-rata likes/comments/shares per nilai `by`, dihitung oleh SQLite"""
+        return self._grouped('AVG', by, platforms, post_types).astype(float)
+
+    def total(self, by, platforms=None, post_types=None):
+        """Total likes/comments/shares per nilai `by`, dihitung oleh SQLite"""
+        return self._grouped('SUM', by, platforms, post_types).astype(np.int64)
+
+    def histogram(self, metric, platforms=None, post_types=None, bins=20):
+        """Setara np.histogram(values, bins); bin dihitung dengan GROUP BY di SQL"""
+        where, params = _where(platforms, post_types)
+        lo, hi, n = self.pool.query(f'SELECT MIN({metric}), MAX({metric}), COUNT(*) FROM {TABLE}{where}', params)[0]
+        if not n:
+            return np.zeros(bins, dtype=np.int64), np.linspace(0, 1, bins + 1)
+        if lo == hi:
+            lo, hi = lo - 0.5, hi + 0.5
+        rows = self.pool.query(
+            f'SELECT MIN(CAST(({metric} - ?) * ? / ? AS INTEGER), ?) AS bin, COUNT(*) '
+            f'FROM {TABLE}{where} GROUP BY bin',
+            [lo, bins, hi - lo, bins - 1] + params,
+        )
+        counts = np.zeros(bins, dtype=np.int64)
+        for b, c in rows:
+            counts[b] = c
+        return counts, np.linspace(lo, hi, bins + 1)
+
+    def box_stats(self, metric, platform, post_types=None, max_outliers=MAX_OUTLIERS):
+        """Statistik box eksak dari tabel frekuensi nilai; None jika tidak ada baris"""
+        where, params = _where(None, post_types, platform=str(platform))
+        rows = self.pool.query(
+            f'SELECT {metric}, COUNT(*) FROM {TABLE}{where} GROUP BY {metric} ORDER BY {metric}', params
+        )
+        if not rows:
+            return None
+        values, counts = np.array(rows, dtype=np.int64).T
+        return frequency_box_stats(values, counts, max_outliers)
+
+
+def open_store(signature, path=None):
+    """Pastikan database sesuai signature sumber (impor ulang jika berubah), lalu buka store"""
+    if DatabaseConfig.DB_TYPE != 'sqlite':
+        raise ValueError(f"Unsupported DB_TYPE {DatabaseConfig.DB_TYPE!r}: only 'sqlite' is implemented")
+    if stored_signature(path) != _signature_value(signature):
+        import_engagement(signature, path)
+    return SqliteEngagementStore(path)
@@ -0,0 +1,262 @@
+"""
+Streaming ingestion untuk file CSV yang lebih besar dari RAM
+CSV dibaca per chunk; setiap chunk memperbarui agregat berjalan (cube,
+histogram sketch, reservoir sample) sehingga memori puncak tidak
+bergantung pada ukuran file.
+"""
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from config.config import DataConfig
+from src.cube import build_cube, merge_cubes
+from src.loader import METRIC_COLUMNS, iter_csv_typed
+from src.posting_time import build_posting_time_cube
+from src.sentiment import build_sentiment_cube
+
+SKETCH_BINS = 1024
+
+
+class StreamHistogram:
+    """
+    Histogram sketch untuk bilangan bulat non-negatif yang bisa di-merge.
+    Jumlah bin tetap; lebar bin (pangkat dua) dilipatgandakan saat nilai
+    melewati jangkauan, sehingga histogram dan kuantil bisa dihitung ulang
+    dengan resolusi (max / SKETCH_BINS) tanpa menyimpan data mentah.
+    """
+
+    def __init__(self):
+        self.counts = np.zeros(SKETCH_BINS, dtype=np.int64)
+        self.width = 1
+        self.n = 0
+        self.min = None
+        self.max = None
+
+    def _grow(self, upper, width=1):
+        while upper >= self.width * SKETCH_BINS or self.width < width:
+            halved = self.counts.reshape(-1, 2).sum(axis=1)
+            self.counts = np.concatenate([halved, np.zeros(SKETCH_BINS // 2, dtype=np.int64)])
+            self.width *= 2
+
+    def update(self, values):
+        values = np.clip(np.asarray(values, dtype=np.int64), 0, None)
+        if len(values) == 0:
+            return self
+        lo, hi = int(values.min()), int(values.max())
+        self._grow(hi)
+        self.counts += np.bincount(values // self.width, minlength=SKETCH_BINS)
+        self.n += len(values)
+        self.min = lo if self.min is None else min(self.min, lo)
+        self.max = hi if self.max is None else max(self.max, hi)
+        return self
+
+    def merge(self, other):
+        if other.n == 0:
+            return self
+        self._grow(other.max, other.width)
+        step = self.width // other.width
+        counts = other.counts
+        if step > 1:
+            # Re-bin the finer sketch onto this sketch's bin width
+            counts = np.bincount(np.arange(SKETCH_BINS) // step, weights=counts, minlength=SKETCH_BINS).astype(np.int64)
+        self.counts += counts[:SKETCH_BINS]
+        self.n += other.n
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        return self
+
+    def histogram(self, bins=20):
+        """Setara np.histogram(values, bins) dengan resolusi sketch"""
+        if self.n == 0:
+            return np.zeros(bins, dtype=np.int64), np.linspace(0, 1, bins + 1)
+        lo, hi = (self.min, self.max) if self.max > self.min else (self.min - 0.5, self.max + 0.5)
+        edges = np.linspace(lo, hi, bins + 1)
+        # Sketch bin i holds the integers i * width .. i * width + width - 1
+        centers = np.clip(np.arange(SKETCH_BINS) * self.width + (self.width - 1) / 2, self.min, self.max)
+        idx = np.clip(((centers - lo) / (hi - lo) * bins).astype(int), 0, bins - 1)
+        return np.bincount(idx, weights=self.counts, minlength=bins).astype(np.int64), edges
+
+    def _order_statistic(self, k):
+        """Perkiraan nilai terurut ke-k (0-based), tersebar merata di dalam bin"""
+        cdf = np.cumsum(self.counts)
+        idx = np.minimum(np.searchsorted(cdf, k, side='right'), SKETCH_BINS - 1)
+        before = np.where(idx > 0, cdf[idx - 1], 0)
+        within = (k - before + 0.5) / np.maximum(self.counts[idx], 1)
+        return np.clip(idx * self.width + within * (self.width - 1), self.min, self.max)
+
+    def quantile(self, q):
+        """Kuantil dengan interpolasi linear antar nilai terurut (seperti np.quantile)"""
+        rank = np.atleast_1d(np.asarray(q, dtype=float)) * (self.n - 1)
+        lower, upper = np.floor(rank), np.ceil(rank)
+        lo, hi = self._order_statistic(lower), self._order_statistic(upper)
+        return lo + (rank - lower) * (hi - lo)
+
+    def box_stats(self):
+        """Statistik box plot (kuartil dan pagar Tukey 1.5 IQR) dari sketch"""
+        q1, median, q3 = self.quantile([0.25, 0.5, 0.75])
+        iqr = q3 - q1
+        return {
+            'q1': q1,
+            'median': median,
+            'q3': q3,
+            'lowerfence': max(self.min, q1 - 1.5 * iqr),
+            'upperfence': min(self.max, q3 + 1.5 * iqr),
+        }
+
+
+class Reservoir:
+    """
+    Sampel acak seragam berukuran tetap untuk preview baris.
+    Setiap baris diberi kunci acak; reservoir menyimpan `size` kunci terkecil
+    (bottom-k), setara Algorithm R tetapi bisa diproses per chunk secara vektor.
+    """
+
+    def __init__(self, size, seed=0):
+        self.size = size
+        self.seen = 0
+        self.rows = None
+        self._keys = np.empty(0)
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, chunk):
+        keys = self._rng.random(len(chunk))
+        rows = chunk.assign(_row=np.arange(self.seen, self.seen + len(chunk)))
+        self.seen += len(chunk)
+        if len(self._keys) >= self.size:
+            keep = keys < self._keys[-1]
+            rows, keys = rows[keep], keys[keep]
+        if self.rows is not None:
+            rows = pd.concat([self.rows, rows], ignore_index=True)
+            keys = np.concatenate([self._keys, keys])
+        order = np.argsort(keys, kind='stable')[:self.size]
+        self.rows = rows.iloc[order].reset_index(drop=True)
+        self._keys = keys[order]
+
+    def sample(self):
+        """Baris sampel dalam urutan aslinya di file"""
+        if self.rows is None:
+            return pd.DataFrame()
+        return self.rows.sort_values('_row').drop(columns='_row').reset_index(drop=True)
+
+
+class EngagementAggregates:
+    """Agregat hasil streaming: cube, histogram sketch per grup, cube sentimen, cube waktu posting, dan reservoir"""
+
+    def __init__(self, cube, sketches, sample, n_rows, n_columns, sentiment=None, posting_time=None):
+        self.cube = cube
+        self.sketches = sketches
+        self.sentiment = sentiment
+        self.posting_time = posting_time
+        self.sample = sample
+        self.n_rows = n_rows
+        self.n_columns = n_columns
+
+    @property
+    def shape(self):
+        return (self.n_rows, self.n_columns)
+
+    def _merged(self, metric, platforms=None, post_types=None):
+        merged = StreamHistogram()
+        for (platform, post_type, m), sketch in self.sketches.items():
+            if m != metric:
+                continue
+            if platforms is not None and platform not in platforms:
+                continue
+            if post_types is not None and post_type not in post_types:
+                continue
+            merged.merge(sketch)
+        return merged
+
+    def histogram(self, metric, platforms=None, post_types=None, bins=20):
+        """Histogram metrik untuk seleksi filter (counts, edges)"""
+        return self._merged(metric, platforms, post_types).histogram(bins)
+
+    def sketch(self, metric, platforms=None, post_types=None):
+        """Sketch gabungan untuk seleksi filter, mis. untuk kuantil box plot"""
+        return self._merged(metric, platforms, post_types)
+
+    def preview(self, platforms=None, post_types=None, n=5):
+        sample = self.sample
+        if platforms is not None:
+            sample = sample[sample['platform'].isin(platforms)]
+        if post_types is not None:
+            sample = sample[sample['post_type'].isin(post_types)]
+        return sample.head(n)
+
+
+def stream_engagement(paths, chunksize=None, reservoir_size=None):
+    """Ingest satu atau beberapa CSV partisi engagement per chunk menjadi EngagementAggregates"""
+    chunksize = chunksize or DataConfig.CHUNK_ROWS
+    reservoir = Reservoir(reservoir_size or DataConfig.RESERVOIR_SIZE)
+    cube = sentiment = posting_time = None
+    sketches = {}
+    n_rows = n_columns = 0
+
+    if isinstance(paths, (str, Path)):
+        paths = [paths]
+    chunks = (chunk for path in paths for chunk in iter_csv_typed(path, chunksize))
+    for chunk in chunks:
+        n_rows += len(chunk)
+        n_columns = chunk.shape[1]
+        chunk_cube = build_cube(chunk)
+        cube = chunk_cube if cube is None else merge_cubes(cube, chunk_cube)
+        chunk_sentiment = build_sentiment_cube(chunk)
+        sentiment = chunk_sentiment if sentiment is None else sentiment.merge(chunk_sentiment)
+        chunk_posting_time = build_posting_time_cube(chunk)
+        posting_time = chunk_posting_time if posting_time is None else posting_time.merge(chunk_posting_time)
+        for (platform, post_type), group in chunk.groupby(['platform', 'post_type'], observed=True):
+            for m in METRIC_COLUMNS:
+                sketches.setdefault((platform, post_type, m), StreamHistogram()).update(group[m].to_numpy())
+        reservoir.update(chunk)
+
+    return EngagementAggregates(cube, sketches, reservoir.sample(), n_rows, n_columns, sentiment, posting_time)
+
+
+class CsvSummary:
+    """Ringkasan streaming untuk CSV generik (mis. upload COVID-19)"""
+
+    def __init__(self, n_rows, columns, sample, daily):
+        self.n_rows = n_rows
+        self.columns = columns
+        self.sample = sample
+        self.daily = daily
+
+    @property
+    def shape(self):
+        return (self.n_rows, len(self.columns))
+
+
+class CsvSummaryBuilder:
+    """Akumulator CsvSummary per chunk: jumlah baris, reservoir preview, dan total harian"""
+
+    def __init__(self, reservoir_size=None, date_col='date'):
+        self.date_col = date_col
+        self.reservoir = Reservoir(reservoir_size or DataConfig.RESERVOIR_SIZE)
+        self.n_rows = 0
+        self.columns = []
+        self.daily = None
+
+    def update(self, chunk):
+        self.n_rows += len(chunk)
+        self.columns = list(chunk.columns)
+        self.reservoir.update(chunk)
+        if self.date_col in chunk.columns:
+            sums = chunk.groupby(self.date_col, observed=True).sum(numeric_only=True)
+            self.daily = sums if self.daily is None else self.daily.add(sums, fill_value=0)
+
+    def summary(self):
+        daily = self.daily.sort_index().reset_index() if self.daily is not None else None
+        return CsvSummary(self.n_rows, self.columns, self.reservoir.sample(), daily)
+
+
+def stream_csv_summary(source, chunksize=None, reservoir_size=None, date_col='date'):
+    """
+    Baca CSV per chunk: jumlah baris, reservoir preview, dan total harian
+    semua kolom numerik per `date_col` (jika kolom tersebut ada).
+    """
+    builder = CsvSummaryBuilder(reservoir_size, date_col)
+    with pd.read_csv(source, chunksize=chunksize or DataConfig.CHUNK_ROWS) as reader:
+        for chunk in reader:
+            builder.update(chunk)
+    return builder.summary()
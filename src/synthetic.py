@@ -0,0 +1,52 @@
+"""
+Generator dataset engagement sintetis untuk benchmark
+Skema dan sebaran nilai mengikuti social_media_engagement1.csv (post_time per 15 menit
+sepanjang satu tahun, post_day konsisten dengan post_time); ditulis per chunk sehingga
+1e8 baris pun tidak perlu muat di memori.
+"""
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.loader import CSV_DTYPES, DAY_ORDER, POST_TIME_FORMAT
+
+PLATFORMS = ['Facebook', 'Instagram', 'Twitter']
+POST_TYPES = ['carousel', 'image', 'poll', 'text', 'video']
+SENTIMENTS = ['positive', 'neutral', 'negative']
+SENTIMENT_WEIGHTS = [0.46, 0.27, 0.27]
+METRIC_RANGES = {'likes': (10, 5000), 'comments': (10, 500), 'shares': (10, 1000)}
+SLOT_MINUTES = 15
+
+
+def generate_engagement(n_rows, seed=0, first_id=1, start='2023-01-01', days=365):
+    """Frame engagement mentah (post_time masih string) berisi `n_rows` baris"""
+    rng = np.random.default_rng(seed)
+    slots = rng.integers(0, days * 24 * 60 // SLOT_MINUTES, n_rows)
+    post_time = pd.Timestamp(start) + pd.to_timedelta(slots * SLOT_MINUTES, unit='min')
+    df = pd.DataFrame({
+        'post_id': np.arange(first_id, first_id + n_rows, dtype=np.int64),
+        'platform': np.array(PLATFORMS)[rng.integers(0, len(PLATFORMS), n_rows)],
+        'post_type': np.array(POST_TYPES)[rng.integers(0, len(POST_TYPES), n_rows)],
+        'post_time': post_time.strftime(POST_TIME_FORMAT),
+    })
+    for metric, (low, high) in METRIC_RANGES.items():
+        df[metric] = rng.integers(low, high + 1, n_rows, dtype=np.int32)
+    df['post_day'] = np.array(DAY_ORDER)[post_time.dayofweek]
+    df['sentiment_score'] = rng.choice(SENTIMENTS, n_rows, p=SENTIMENT_WEIGHTS)
+    return df[list(CSV_DTYPES)]
+
+
+def write_engagement_csv(path, n_rows, seed=0, chunk_rows=1_000_000, **kwargs):
+    """Tulis CSV sintetis `n_rows` baris per chunk; hasil deterministik untuk `seed` yang sama"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'w', newline='') as f:
+        for i, start in enumerate(range(0, n_rows, chunk_rows)):
+            chunk = generate_engagement(
+                min(chunk_rows, n_rows - start), seed=[seed, i], first_id=start + 1, **kwargs
+            )
+            chunk.to_csv(f, header=(i == 0), index=False)
+    tmp_path.replace(path)
+    return path
@@ -0,0 +1,135 @@
+"""
+Pipeline upload CSV untuk dashboard COVID-19
+Isi upload di-hash sebagai key cache, diparsing per chunk dengan dtype yang diperkecil
+(kategori untuk state/county, int32 untuk hitungan, tanggal terparsing), dan dijaga oleh
+anggaran memori: upload yang melebihinya ditolak atau diringkas (sampel + total harian).
+"""
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from config.config import DataConfig, UploadConfig
+from src.loader import unify_categories
+from src.streaming import CsvSummaryBuilder
+
+DATE_COLUMN = 'date'
+# Always categorical when present; other text columns only if values repeat enough
+CATEGORY_COLUMNS = ['state', 'county']
+CATEGORY_MAX_RATIO = 0.5
+INT32_MIN, INT32_MAX = np.iinfo(np.int32).min, np.iinfo(np.int32).max
+
+
+class UploadTooLarge(ValueError):
+    """Upload melebihi UploadConfig.MEMORY_BUDGET_MB dengan kebijakan 'reject'"""
+
+
+def content_hash(file, block_size=1 << 20):
+    """SHA-1 isi file-like (dibaca per blok, posisi dikembalikan ke awal)"""
+    digest = hashlib.sha1()
+    file.seek(0)
+    for block in iter(lambda: file.read(block_size), b''):
+        digest.update(block)
+    file.seek(0)
+    return digest.hexdigest()
+
+
+def infer_dtypes(chunk):
+    """Rencana dtype ringkas dari chunk pertama; dipakai untuk semua chunk berikutnya"""
+    plan = {}
+    for col in chunk.columns:
+        values = chunk[col]
+        if col == DATE_COLUMN:
+            plan[col] = 'datetime'
+        elif pd.api.types.is_integer_dtype(values):
+            plan[col] = 'int32' if _fits_int32(values) else 'int64'
+        elif pd.api.types.is_object_dtype(values) or pd.api.types.is_string_dtype(values):
+            if col in CATEGORY_COLUMNS or values.nunique() <= CATEGORY_MAX_RATIO * len(values):
+                plan[col] = 'category'
+    return plan
+
+
+def _fits_int32(values):
+    return values.empty or (values.min() >= INT32_MIN and values.max() <= INT32_MAX)
+
+
+def apply_dtypes(chunk, plan):
+    """Terapkan rencana dtype ke chunk; kolom int32 yang nilainya tidak muat diperlebar di `plan`"""
+    for col, dtype in plan.items():
+        if dtype == 'datetime':
+            chunk[col] = pd.to_datetime(chunk[col], errors='coerce')
+        elif dtype in ('int32', 'int64') and not pd.api.types.is_integer_dtype(chunk[col]):
+            # A later chunk with missing values cannot be a plain integer column
+            continue
+        elif dtype == 'int32' and not _fits_int32(chunk[col]):
+            # astype would wrap silently; widen for this and all later chunks (concat upcasts earlier ones)
+            plan[col] = 'int64'
+            chunk[col] = chunk[col].astype('int64')
+        else:
+            chunk[col] = chunk[col].astype(dtype)
+    return chunk
+
+
+class ParsedUpload:
+    """Hasil parsing upload: frame lengkap, atau ringkasan jika melebihi anggaran memori"""
+
+    def __init__(self, digest, frame=None, summary=None):
+        self.digest = digest
+        self.frame = frame
+        self.summary = summary
+
+    @property
+    def sampled(self):
+        return self.frame is None
+
+    @property
+    def shape(self):
+        return self.frame.shape if self.frame is not None else self.summary.shape
+
+    @property
+    def memory_mb(self):
+        if self.frame is not None:
+            return self.frame.memory_usage(deep=True).sum() / 2 ** 20
+        return self.summary.sample.memory_usage(deep=True).sum() / 2 ** 20
+
+
+def parse_upload(file, digest=None, budget_mb=None, over_budget=None, chunksize=None):
+    """
+    Parse CSV per chunk dengan dtype ringkas. Bila total memori frame melewati `budget_mb`,
+    'reject' melempar UploadTooLarge; 'sample' melanjutkan sebagai CsvSummary
+    (reservoir sampel + total harian) sehingga memori tetap terbatas.
+    """
+    budget = (budget_mb or UploadConfig.MEMORY_BUDGET_MB) * 2 ** 20
+    over_budget = over_budget or UploadConfig.OVER_BUDGET
+    digest = digest or content_hash(file)
+    file.seek(0)
+
+    frames, used, plan, builder = [], 0, None, None
+    with pd.read_csv(file, chunksize=chunksize or DataConfig.CHUNK_ROWS) as reader:
+        for chunk in reader:
+            if plan is None:
+                plan = infer_dtypes(chunk)
+            chunk = apply_dtypes(chunk, plan)
+            if builder is not None:
+                builder.update(chunk)
+                continue
+            frames.append(chunk)
+            used += chunk.memory_usage(deep=True).sum()
+            if used > budget:
+                if over_budget == 'reject':
+                    raise UploadTooLarge(
+                        f"Upload melebihi anggaran memori {budget / 2 ** 20:.0f} MB setelah "
+                        f"{sum(len(f) for f in frames):,} baris"
+                    )
+                # Switch to bounded summaries; rows parsed so far seed them
+                builder = CsvSummaryBuilder(date_col=DATE_COLUMN)
+                for frame in frames:
+                    builder.update(frame)
+                frames = []
+
+    if builder is not None:
+        return ParsedUpload(digest, summary=builder.summary())
+    if not frames:
+        return ParsedUpload(digest, frame=pd.DataFrame())
+    frame = pd.concat(unify_categories(frames), ignore_index=True) if len(frames) > 1 else frames[0]
+    return ParsedUpload(digest, frame=frame)
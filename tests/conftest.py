@@ -0,0 +1,28 @@
+"""
+Fixture bersama: cache Parquet terisolasi per tes dan dataset engagement sintetis
+(src.synthetic) yang cukup besar untuk mengisi setiap sel platform x post_type x hari.
+"""
+import pytest
+
+from config.config import DataConfig
+from src.loader import load_partitions
+from src.synthetic import write_engagement_csv
+
+SYNTHETIC_ROWS = 5000
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(DataConfig, 'CACHE_DIR', str(tmp_path / 'cache'))
+    monkeypatch.setattr(DataConfig, 'LOAD_WORKERS', 1)
+
+
+@pytest.fixture(scope='session')
+def synthetic_csv(tmp_path_factory):
+    return write_engagement_csv(tmp_path_factory.mktemp('data') / 'engagement.csv', SYNTHETIC_ROWS)
+
+
+@pytest.fixture
+def engagement(synthetic_csv):
+    """Frame sintetis yang sudah dipadatkan, sama seperti hasil load_data() di dashboard"""
+    return load_partitions([synthetic_csv])
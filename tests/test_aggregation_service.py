@@ -0,0 +1,89 @@
+"""
+Layanan agregasi: hasil lewat HTTP sama dengan pandas, partisi hanya dipindai ulang
+tiap rescan_seconds, dan kegagalan tak terduga tetap dijawab sebagai JSON 500.
+"""
+import shutil
+import threading
+from http.server import ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import src.aggregation_service as aggregation_service
+from src.aggregation_service import AggregationClient, AggregationService, _Handler
+from src.loader import METRIC_COLUMNS
+
+
+@pytest.fixture
+def data_dir(synthetic_csv, tmp_path):
+    data_dir = tmp_path / 'data'
+    data_dir.mkdir()
+    shutil.copy(synthetic_csv, data_dir / 'engagement.csv')
+    return data_dir
+
+
+@pytest.fixture
+def scans(monkeypatch):
+    calls = []
+    discover = aggregation_service.discover_partitions
+
+    def counting(data_dir=None):
+        calls.append(data_dir)
+        return discover(data_dir)
+
+    monkeypatch.setattr(aggregation_service, 'discover_partitions', counting)
+    return calls
+
+
+def _serve(service):
+    handler = type('Handler', (_Handler,), {'service': service})
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, AggregationClient(f'http://127.0.0.1:{server.server_address[1]}')
+
+
+def test_client_results_match_pandas(engagement, data_dir):
+    server, client = _serve(AggregationService(data_dir))
+    try:
+        platforms, post_types = ['Facebook', 'Twitter'], ['video', 'image']
+        rows = engagement[engagement['platform'].isin(platforms) & engagement['post_type'].isin(post_types)]
+        assert client.count(platforms, post_types) == len(rows)
+        expected = rows.groupby(rows['platform'].astype(str))[METRIC_COLUMNS].mean()
+        pd.testing.assert_frame_equal(client.mean('platform', platforms, post_types), expected, check_names=False)
+        counts, edges = client.histogram('likes', platforms, post_types)
+        expected_counts, expected_edges = np.histogram(rows['likes'].to_numpy(), bins=20)
+        np.testing.assert_array_equal(counts, expected_counts)
+        np.testing.assert_allclose(edges, expected_edges)
+    finally:
+        server.shutdown()
+
+
+def test_partitions_are_rescanned_once_per_interval(data_dir, scans):
+    service = AggregationService(data_dir, rescan_seconds=3600)
+    for platforms in (None, ['Instagram'], ['Twitter']):
+        service.query('count', {'platforms': platforms})
+    service.signature()
+    assert len(scans) == 1
+
+
+def test_rescan_picks_up_changed_partitions(synthetic_csv, data_dir):
+    service = AggregationService(data_dir, rescan_seconds=0)
+    n_rows = service.current()[1].shape[0]
+    shutil.copy(synthetic_csv, data_dir / 'engagement-2.csv')
+    assert service.current()[1].shape[0] == 2 * n_rows
+
+
+def test_unexpected_errors_are_json_500(data_dir, monkeypatch):
+    service = AggregationService(data_dir)
+    server, client = _serve(service)
+    try:
+        monkeypatch.setattr(service, 'current', lambda: (_ for _ in ()).throw(OSError('partition hilang')))
+        with pytest.raises(RuntimeError, match='OSError: partition hilang'):
+            client.count()
+        with pytest.raises(RuntimeError, match='OSError: partition hilang'):
+            client.signature()
+        with pytest.raises(RuntimeError, match='Unknown operation'):
+            client._query('median')
+    finally:
+        server.shutdown()
@@ -0,0 +1,71 @@
+"""
+Statistik box: kuartil sama dengan np.quantile, pagar sama dengan observasi terjauh
+di dalam 1.5 IQR, dan jalur tabel frekuensi sama persis dengan jalur array terurut.
+"""
+import numpy as np
+import pytest
+
+from src.boxstats import frequency_box_stats, grouped_box_stats, platform_box_stats, sorted_box_stats
+from src.loader import METRIC_COLUMNS
+
+SAMPLES = {
+    'uniform': np.random.default_rng(0).integers(10, 5000, 2001),
+    'heavy_tail': np.random.default_rng(1).pareto(1.5, 999).round(1) * 100,
+    'ties': np.repeat([3, 5, 5, 8, 40], [10, 200, 3, 50, 1]),
+    'single': np.array([7]),
+}
+
+
+def _naive_box_stats(values):
+    q1, median, q3 = np.quantile(values, [0.25, 0.5, 0.75])
+    iqr = q3 - q1
+    inside = values[(values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)]
+    return {'q1': q1, 'median': median, 'q3': q3, 'lowerfence': inside.min(), 'upperfence': inside.max()}
+
+
+def _assert_stats_equal(got, expected):
+    for key, value in expected.items():
+        np.testing.assert_allclose(got[key], value, err_msg=key)
+
+
+@pytest.mark.parametrize('name', SAMPLES)
+def test_sorted_box_stats_match_numpy(name):
+    values = np.sort(SAMPLES[name])
+    stats = sorted_box_stats(values)
+    _assert_stats_equal(stats, _naive_box_stats(values))
+
+    outliers = values[(values < stats['lowerfence']) | (values > stats['upperfence'])]
+    assert len(stats['outliers']) == min(len(outliers), 50)
+    assert set(stats['outliers']) <= set(outliers)
+    if len(outliers):
+        assert stats['outliers'][0] == outliers[0] and stats['outliers'][-1] == outliers[-1]
+
+
+@pytest.mark.parametrize('name', SAMPLES)
+def test_frequency_box_stats_match_sorted_path(name):
+    values = np.sort(SAMPLES[name])
+    unique, counts = np.unique(values, return_counts=True)
+    expected = sorted_box_stats(values)
+    got = frequency_box_stats(unique, counts)
+    _assert_stats_equal(got, expected)
+    np.testing.assert_array_equal(got['outliers'], expected['outliers'])
+
+
+def test_platform_box_stats_match_pandas(engagement):
+    rows = np.flatnonzero(engagement['post_type'].isin(['video', 'text']).to_numpy())
+    platforms, stats = platform_box_stats(engagement, rows, ['Twitter', 'Facebook', 'Instagram'], METRIC_COLUMNS)
+    assert platforms == ['Twitter', 'Facebook', 'Instagram']
+
+    grouped = engagement.iloc[rows].groupby('platform', observed=True)[METRIC_COLUMNS]
+    for q, key in [(0.25, 'q1'), (0.5, 'median'), (0.75, 'q3')]:
+        expected = grouped.quantile(q).loc[platforms]
+        for metric in METRIC_COLUMNS:
+            np.testing.assert_allclose([s[key] for s in stats[metric]], expected[metric].to_numpy())
+
+
+def test_grouped_box_stats_skip_missing_groups():
+    codes = np.array([2, 0, 2, 2, 0])
+    values = np.array([5.0, 1.0, 3.0, 4.0, 2.0])
+    stats = grouped_box_stats(codes, values)
+    assert sorted(stats) == [0, 2]
+    _assert_stats_equal(stats[2], _naive_box_stats(np.array([3.0, 4.0, 5.0])))
@@ -0,0 +1,99 @@
+"""
+Analitik COVID per negara bagian: deret harian, rata-rata bergulir, ringkasan rentang
+tanggal, dan StateWindow inkremental harus sama dengan groupby pandas biasa.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.covid import PER_CAPITA, ROLLING_DAYS, STATE_POPULATION, StateWindow, build_state_analytics
+
+STATES = ['Texas', 'Alaska', 'Ohio', 'Guam']
+WINDOWS = [
+    ('2020-03-01', '2020-06-30'),
+    ('2020-03-10', '2020-03-20'),
+    ('2020-04-02', '2020-04-02'),
+    ('2020-05-15', '2020-07-31'),
+    ('2020-07-01', '2020-07-10'),
+]
+
+
+@pytest.fixture(scope='module')
+def counties():
+    """Frame kumulatif per county, acak urutannya, dengan hari kosong dan baris tanpa tanggal"""
+    rng = np.random.default_rng(7)
+    frames = []
+    for i, state in enumerate(STATES):
+        days = pd.date_range('2020-03-01', '2020-06-30')[i * 5:]
+        days = days[rng.random(len(days)) > 0.1]
+        for county in range(1 + i % 3):
+            cases = np.cumsum(rng.integers(0, 300, len(days)))
+            frames.append(pd.DataFrame({
+                'date': days.strftime('%Y-%m-%d'),
+                'state': state,
+                'county': f'{state}-{county}',
+                'cases': cases,
+                'deaths': cases // 40,
+            }))
+    df = pd.concat(frames, ignore_index=True).sample(frac=1, random_state=1)
+    return pd.concat([df, pd.DataFrame({'date': ['bukan tanggal'], 'state': ['Ohio'], 'cases': [5], 'deaths': [1]})])
+
+
+@pytest.fixture(scope='module')
+def daily(counties):
+    """Referensi pandas: deret harian per negara bagian dari groupby (state, date)"""
+    df = counties.assign(date=pd.to_datetime(counties['date'], errors='coerce')).dropna(subset=['date'])
+    df = df.groupby(['state', 'date'], as_index=False)[['cases', 'deaths']].sum().sort_values(['state', 'date'])
+    by_state = df.groupby('state')
+    df['new_cases'] = by_state['cases'].diff().fillna(df['cases'])
+    df['new_deaths'] = by_state['deaths'].diff().fillna(df['deaths'])
+    df['avg7_cases'] = by_state['new_cases'].transform(lambda s: s.rolling(ROLLING_DAYS, min_periods=1).mean())
+    return df.reset_index(drop=True)
+
+
+def _expected_summary(daily, start, end):
+    start, end = pd.Timestamp(start), pd.Timestamp(end)
+    rows = []
+    for state in sorted(STATES):
+        series = daily[daily['state'] == state]
+        upto = series[series['date'] <= end]
+        before = series[series['date'] < start]
+        cases_total = upto['cases'].iloc[-1] if len(upto) else 0.0
+        deaths_total = upto['deaths'].iloc[-1] if len(upto) else 0.0
+        cases = cases_total - (before['cases'].iloc[-1] if len(before) else 0.0)
+        rows.append({
+            'state': state,
+            'cases': cases,
+            'deaths': deaths_total - (before['deaths'].iloc[-1] if len(before) else 0.0),
+            'cases_total': cases_total,
+            'deaths_total': deaths_total,
+            'avg7_cases': upto['avg7_cases'].iloc[-1] if len(upto) else np.nan,
+            'cases_per_100k': cases / STATE_POPULATION[state] * PER_CAPITA,
+            'cfr': deaths_total / cases_total * 100 if cases_total > 0 else np.nan,
+        })
+    return pd.DataFrame(rows).astype({c: float for c in rows[0] if c != 'state'})
+
+
+def test_daily_series_match_pandas(counties, daily):
+    analytics = build_state_analytics(counties)
+    assert list(analytics.states) == sorted(STATES)
+    np.testing.assert_array_equal(analytics.cases_cum, daily['cases'])
+    np.testing.assert_array_equal(analytics.new_cases, daily['new_cases'])
+    np.testing.assert_array_equal(analytics.new_deaths, daily['new_deaths'])
+    np.testing.assert_allclose(analytics.avg7_cases, daily['avg7_cases'])
+
+    national = daily.groupby('date')[['new_cases', 'new_deaths']].sum()
+    national = national.reindex(pd.date_range(national.index.min(), national.index.max()), fill_value=0.0)
+    got = analytics.national_daily().set_index('date')
+    np.testing.assert_array_equal(got.index, national.index)
+    np.testing.assert_array_equal(got['new_cases'], national['new_cases'])
+    np.testing.assert_allclose(got['avg7_cases'], national['new_cases'].rolling(ROLLING_DAYS, min_periods=1).mean())
+
+
+def test_sliding_window_matches_fresh_summary(counties, daily):
+    window = StateWindow(build_state_analytics(counties))
+    for start, end in WINDOWS:
+        pd.testing.assert_frame_equal(
+            window.summary(start, end), _expected_summary(daily, start, end), check_categorical=False,
+            check_index_type=False
+        )
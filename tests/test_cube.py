@@ -0,0 +1,56 @@
+"""
+EngagementCube: roll-up sel cube harus sama dengan groupby pandas biasa atas baris
+yang lolos filter, dan cube gabungan per chunk sama dengan cube dari seluruh frame.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.cube import build_cube, merge_cubes
+from src.loader import METRIC_COLUMNS
+
+SELECTIONS = [
+    (None, None),
+    (['Instagram'], None),
+    (['Facebook', 'Twitter'], ['video', 'image']),
+]
+
+
+def _selected(df, platforms, post_types):
+    mask = np.ones(len(df), dtype=bool)
+    if platforms is not None:
+        mask &= df['platform'].isin(platforms).to_numpy()
+    if post_types is not None:
+        mask &= df['post_type'].isin(post_types).to_numpy()
+    return df[mask]
+
+
+def _group_key(df, by):
+    return df['post_time'].dt.normalize().rename('date') if by == 'date' else df[by]
+
+
+def _assert_same(got, expected):
+    got = got.set_axis(got.index.astype(str))
+    expected = expected.set_axis(expected.index.astype(str))
+    pd.testing.assert_frame_equal(got.sort_index(), expected.sort_index(), check_dtype=False, check_names=False)
+
+
+@pytest.mark.parametrize('platforms, post_types', SELECTIONS)
+@pytest.mark.parametrize('by', ['platform', 'post_type', 'post_day', 'date'])
+def test_rollups_match_pandas_groupby(engagement, by, platforms, post_types):
+    cube = build_cube(engagement)
+    rows = _selected(engagement, platforms, post_types)
+    grouped = rows.groupby(_group_key(rows, by), observed=True)[METRIC_COLUMNS]
+
+    _assert_same(cube.mean(by, platforms, post_types), grouped.mean())
+    _assert_same(cube.total(by, platforms, post_types), grouped.sum())
+    _assert_same(cube.std(by, platforms, post_types), grouped.std(ddof=0))
+
+
+def test_merged_chunks_match_whole_frame(engagement):
+    chunks = [engagement.iloc[i:i + 1500] for i in range(0, len(engagement), 1500)]
+    merged = merge_cubes(*(build_cube(chunk) for chunk in chunks))
+    whole = build_cube(engagement)
+    for by in ['platform', 'post_day', 'date']:
+        _assert_same(merged.total(by), whole.total(by))
+        _assert_same(merged.mean(by, ['Twitter'], ['poll']), whole.mean(by, ['Twitter'], ['poll']))
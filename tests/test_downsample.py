@@ -0,0 +1,80 @@
+"""
+Downsampling: LTTB sama dengan implementasi naif titik-per-titik, anggaran titik dan
+ujung seri dipertahankan, dan min-max menyimpan ekstrem setiap bucket.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.downsample import downsample_frame, lttb_indices, minmax_indices
+
+N_OUT = 60
+
+
+def _series(n, seed=0):
+    rng = np.random.default_rng(seed)
+    x = np.datetime64('2023-01-01') + np.arange(n).astype('timedelta64[D]')
+    y = np.cumsum(rng.normal(size=n)) + 50 * (rng.random(n) < 0.01)
+    return x, y
+
+
+def _naive_lttb(x, y, n_out):
+    """LTTB menurut makalah Steinarsson, satu titik per iterasi tanpa vektorisasi"""
+    x = x.astype('datetime64[ns]').astype(np.int64).astype(float)
+    n = len(y)
+    every = (n - 2) / (n_out - 2)
+    selected, a = [0], 0
+    for i in range(n_out - 2):
+        start, stop = int(i * every) + 1, int((i + 1) * every) + 1
+        next_start, next_stop = stop, min(int((i + 2) * every) + 1, n)
+        if i == n_out - 3:
+            avg_x, avg_y = x[n - 1], y[n - 1]
+        else:
+            avg_x, avg_y = x[next_start:next_stop].mean(), y[next_start:next_stop].mean()
+        best, best_area = start, -1.0
+        for j in range(start, stop):
+            area = abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a]))
+            if area > best_area:
+                best, best_area = j, area
+        selected.append(best)
+        a = best
+    return np.array(selected + [n - 1])
+
+
+@pytest.mark.parametrize('n', [61, 500, 3653])
+def test_lttb_matches_naive_reference(n):
+    x, y = _series(n)
+    idx = lttb_indices(x, y, N_OUT)
+    assert len(idx) == N_OUT
+    assert idx[0] == 0 and idx[-1] == n - 1
+    assert np.all(np.diff(idx) > 0)
+    np.testing.assert_array_equal(idx, _naive_lttb(x, y, N_OUT))
+
+
+@pytest.mark.parametrize('n', [61, 500, 3653])
+def test_minmax_keeps_bucket_extremes(n):
+    _, y = _series(n, seed=1)
+    idx = minmax_indices(y, N_OUT)
+    assert len(idx) <= N_OUT
+    assert np.all(np.diff(idx) > 0)
+    assert y.argmin() in idx and y.argmax() in idx
+    edges = np.linspace(0, n, N_OUT // 2 + 1).astype(int)
+    for bucket in (np.arange(start, stop) for start, stop in zip(edges[:-1], edges[1:])):
+        kept = y[np.intersect1d(idx, bucket)]
+        assert kept.min() == y[bucket].min() and kept.max() == y[bucket].max()
+
+
+def test_short_series_pass_through():
+    x, y = _series(40)
+    np.testing.assert_array_equal(lttb_indices(x, y, N_OUT), np.arange(40))
+    np.testing.assert_array_equal(minmax_indices(y, N_OUT), np.arange(40))
+
+
+@pytest.mark.parametrize('method', ['lttb', 'minmax'])
+def test_downsample_frame_returns_original_rows(method):
+    x, y = _series(1000)
+    frame = pd.DataFrame({'date': x, 'likes': y})
+    series = downsample_frame(frame, 'date', 'likes', max_points=N_OUT, method=method)
+    assert len(series) <= N_OUT
+    pd.testing.assert_frame_equal(series, frame.loc[series.index])
+    assert series['date'].is_monotonic_increasing
@@ -0,0 +1,50 @@
+"""
+FilterIndex: posisi dan jumlah baris hasil seleksi bitmap harus sama dengan mask
+isin() pandas, juga setelah baris baru ditambahkan lewat extend().
+"""
+import numpy as np
+import pytest
+
+from src.filter_index import build_filter_index
+
+SELECTIONS = [
+    (None, None),
+    (['Instagram'], None),
+    (None, ['poll']),
+    (['Facebook', 'Twitter'], ['video', 'image']),
+    (['Instagram'], ['bukan-jenis']),
+    ([], None),
+]
+
+
+def _expected_rows(df, platforms, post_types):
+    mask = np.ones(len(df), dtype=bool)
+    if platforms is not None:
+        mask &= df['platform'].isin(platforms).to_numpy()
+    if post_types is not None:
+        mask &= df['post_type'].isin(post_types).to_numpy()
+    return np.flatnonzero(mask)
+
+
+@pytest.mark.parametrize('platforms, post_types', SELECTIONS)
+def test_select_matches_isin_mask(engagement, platforms, post_types):
+    index = build_filter_index(engagement)
+    expected = _expected_rows(engagement, platforms, post_types)
+    np.testing.assert_array_equal(index.select(platform=platforms, post_type=post_types), expected)
+    assert index.count(platform=platforms, post_type=post_types) == len(expected)
+
+
+@pytest.mark.parametrize('platforms, post_types', SELECTIONS + [(['LinkedIn'], None)])
+def test_extended_index_matches_full_rebuild(engagement, platforms, post_types):
+    frame = engagement.astype({'platform': str, 'post_type': str})
+    # A platform unseen in the first rows needs its own bitmap, zero-padded at the front
+    frame.loc[frame.index[4000::9], 'platform'] = 'LinkedIn'
+    head, tail = frame.iloc[:3000], frame.iloc[3000:]
+    extended = build_filter_index(head).extend(tail)
+
+    expected = _expected_rows(frame, platforms, post_types)
+    np.testing.assert_array_equal(extended.select(platform=platforms, post_type=post_types), expected)
+    assert extended.count(platform=platforms, post_type=post_types) == len(expected)
+    rebuilt = build_filter_index(frame).select(platform=platforms, post_type=post_types)
+    np.testing.assert_array_equal(extended.select(platform=platforms, post_type=post_types), rebuilt)
+    assert extended.values['platform'][-1] == 'LinkedIn'
@@ -0,0 +1,55 @@
+"""
+Leaderboard: top-K hasil merge per sel harus sama dengan pengurutan pandas atas baris
+yang lolos filter, persentil sama dengan Series.quantile, juga setelah extend().
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.leaderboard import PERCENTILES, build_leaderboard
+from src.loader import METRIC_COLUMNS
+
+K = 25
+SELECTIONS = [
+    (None, None),
+    (['Instagram'], None),
+    (['Facebook', 'Twitter'], ['video', 'image']),
+    (['Instagram'], ['bukan-jenis']),
+]
+
+
+def _selected(df, platforms, post_types):
+    mask = np.ones(len(df), dtype=bool)
+    if platforms is not None:
+        mask &= df['platform'].isin(platforms).to_numpy()
+    if post_types is not None:
+        mask &= df['post_type'].isin(post_types).to_numpy()
+    return df.reset_index(drop=True)[mask]
+
+
+def _assert_matches_pandas(board, df, platforms, post_types):
+    rows = _selected(df, platforms, post_types)
+    for metric in METRIC_COLUMNS:
+        # Ties go to the earlier post, as in the dashboard's leaderboard
+        expected = rows[metric].reset_index().sort_values([metric, 'index'], ascending=[False, True]).head(K)
+        values, positions = board.top_k(metric, platforms, post_types)
+        np.testing.assert_array_equal(values, expected[metric])
+        np.testing.assert_array_equal(positions, expected['index'])
+
+    table = board.percentile_table(platforms, post_types)
+    expected = pd.DataFrame(
+        [[rows[m].quantile(q) for q in PERCENTILES.values()] for m in METRIC_COLUMNS],
+        index=pd.Index(METRIC_COLUMNS, name='metric'), columns=list(PERCENTILES)
+    )
+    pd.testing.assert_frame_equal(table, expected)
+
+
+@pytest.mark.parametrize('platforms, post_types', SELECTIONS)
+def test_leaderboard_matches_pandas(engagement, platforms, post_types):
+    _assert_matches_pandas(build_leaderboard(engagement, K), engagement, platforms, post_types)
+
+
+@pytest.mark.parametrize('platforms, post_types', SELECTIONS)
+def test_extended_leaderboard_matches_pandas(engagement, platforms, post_types):
+    board = build_leaderboard(engagement.iloc[:1200], K).extend(engagement.iloc[1200:3100]).extend(engagement.iloc[3100:])
+    _assert_matches_pandas(board, engagement, platforms, post_types)
@@ -0,0 +1,27 @@
+"""
+Loader: post_day yang tidak cocok dengan post_time tidak menghentikan load; jumlahnya
+diperingatkan dan dilaporkan, dan fitur waktu tetap diturunkan dari post_time.
+"""
+import pandas as pd
+import pytest
+
+from src.loader import load_partitions, post_day_mismatches, time_feature
+
+
+def test_post_day_mismatch_warns_and_keeps_loading(synthetic_csv, tmp_path):
+    raw = pd.read_csv(synthetic_csv)
+    wrong = raw.index[[3, 40]]
+    raw.loc[wrong, 'post_day'] = raw.loc[wrong, 'post_day'].map({'Monday': 'Tuesday'}).fillna('Monday')
+    path = tmp_path / 'engagement.csv'
+    raw.to_csv(path, index=False)
+
+    with pytest.warns(UserWarning, match='in 2 rows'):
+        df = load_partitions([path])
+    assert len(df) == len(raw)
+    assert post_day_mismatches(df) == 2
+    expected = pd.to_datetime(raw['post_time'], format='%m/%d/%Y %H:%M').dt.dayofweek
+    assert (time_feature(df, 'day_of_week') == expected.to_numpy()).all()
+
+
+def test_consistent_post_day_reports_no_mismatch(engagement):
+    assert post_day_mismatches(engagement) == 0
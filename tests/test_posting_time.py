@@ -0,0 +1,60 @@
+"""
+PostingTimeCube: rata-rata dan jumlah postingan per platform x hari x jam harus sama
+dengan groupby pandas atas post_time, juga untuk cube gabungan per chunk.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.loader import METRIC_COLUMNS
+from src.posting_time import HOURS, build_posting_time_cube
+
+SELECTIONS = [
+    (None, None),
+    (['Instagram'], None),
+    (['Facebook', 'Twitter'], ['video', 'image']),
+]
+
+
+def _expected(df, metric, platforms, post_types):
+    """{platform: (rata-rata [hari, jam], jumlah [hari, jam])} dari groupby pandas"""
+    mask = np.ones(len(df), dtype=bool)
+    if platforms is not None:
+        mask &= df['platform'].isin(platforms).to_numpy()
+    if post_types is not None:
+        mask &= df['post_type'].isin(post_types).to_numpy()
+    rows = df[mask]
+    keys = [rows['platform'].astype(str), rows['post_time'].dt.dayofweek, rows['post_time'].dt.hour]
+    grouped = rows.groupby(keys)[metric].agg(['mean', 'size'])
+    full = pd.MultiIndex.from_product([range(7), range(HOURS)])
+    return {
+        platform: (
+            cells['mean'].droplevel(0).reindex(full).to_numpy().reshape(7, HOURS),
+            cells['size'].droplevel(0).reindex(full, fill_value=0).to_numpy().reshape(7, HOURS),
+        )
+        for platform, cells in grouped.groupby(level=0)
+    }
+
+
+def _assert_matches_pandas(cube, df, platforms, post_types):
+    for metric in METRIC_COLUMNS:
+        got = cube.by_platform(metric, platforms, post_types)
+        expected = _expected(df, metric, platforms, post_types)
+        assert sorted(got) == sorted(expected)
+        for platform, (means, counts) in expected.items():
+            np.testing.assert_array_equal(got[platform][1], counts)
+            np.testing.assert_allclose(got[platform][0], means)
+
+
+@pytest.mark.parametrize('platforms, post_types', SELECTIONS)
+def test_posting_time_cube_matches_pandas(engagement, platforms, post_types):
+    _assert_matches_pandas(build_posting_time_cube(engagement), engagement, platforms, post_types)
+
+
+@pytest.mark.parametrize('platforms, post_types', SELECTIONS)
+def test_merged_chunks_match_pandas(engagement, platforms, post_types):
+    chunks = [engagement.iloc[i:i + 1700] for i in range(0, len(engagement), 1700)]
+    cube = build_posting_time_cube(chunks[0])
+    for chunk in chunks[1:]:
+        cube = cube.merge(build_posting_time_cube(chunk))
+    _assert_matches_pandas(cube, engagement, platforms, post_types)
@@ -0,0 +1,85 @@
+"""
+LiveDataset: refresh inkremental lalu snapshot harus sama dengan load ulang penuh
+(frame, cube, filter index, leaderboard, cube sentimen, dan cube waktu posting).
+"""
+import numpy as np
+import pandas as pd
+
+from src.loader import METRIC_COLUMNS, resolve_data_path
+from src.refresh import LiveDataset
+
+SOURCE_LINES = resolve_data_path().read_text().splitlines(keepends=True)
+HEADER = SOURCE_LINES[0]
+# Weekend posts first, so the initial load lacks most weekdays and refreshes add them
+ROWS = sorted(SOURCE_LINES[1:], key=lambda line: not any(day in line for day in ('Saturday', 'Sunday')))
+WEEKEND_ROWS = sum(any(day in line for day in ('Saturday', 'Sunday')) for line in ROWS)
+
+
+def _sorted_cells(cube):
+    cells = cube.cells.astype({c: str for c in ['platform', 'post_type', 'post_day']})
+    return cells.sort_values(['platform', 'post_type', 'post_day', 'day_number']).reset_index(drop=True)
+
+
+def assert_same_state(live, full):
+    df, cube, filter_index, leaderboard, sentiment, posting_time = live.snapshot()
+    full_df, full_cube, full_index, full_leaderboard, full_sentiment, full_posting_time = full.snapshot()
+
+    pd.testing.assert_frame_equal(df, full_df)
+    pd.testing.assert_frame_equal(_sorted_cells(cube), _sorted_cells(full_cube), check_dtype=False)
+
+    for col, values in full_index.values.items():
+        assert sorted(filter_index.values[col]) == sorted(values)
+        for value in values:
+            np.testing.assert_array_equal(filter_index.select(**{col: [value]}), full_index.select(**{col: [value]}))
+
+    for metric in METRIC_COLUMNS:
+        for got, expected in zip(leaderboard.top_k(metric), full_leaderboard.top_k(metric)):
+            np.testing.assert_array_equal(got, expected)
+    pd.testing.assert_frame_equal(leaderboard.percentile_table(), full_leaderboard.percentile_table())
+
+    breakdown, full_breakdown = sentiment.breakdown(), full_sentiment.breakdown()
+    pd.testing.assert_frame_equal(breakdown.sort_index(), full_breakdown.sort_index())
+    pd.testing.assert_frame_equal(sentiment.weekly_mix(), full_sentiment.weekly_mix(), check_like=True)
+
+    for metric in METRIC_COLUMNS:
+        got, expected = posting_time.by_platform(metric), full_posting_time.by_platform(metric)
+        assert sorted(got) == sorted(expected)
+        for platform in expected:
+            np.testing.assert_array_equal(got[platform][0], expected[platform][0])
+            np.testing.assert_array_equal(got[platform][1], expected[platform][1])
+
+
+def test_refresh_matches_full_reload(tmp_path):
+    data_dir = tmp_path / 'data'
+    data_dir.mkdir()
+    first = data_dir / 'a.csv'
+    first.write_text(HEADER + ''.join(ROWS[:WEEKEND_ROWS]))
+    live = LiveDataset(data_dir)
+    assert live.snapshot()[0]['post_day'].nunique() == 2
+    first_signature, _ = live.versioned_snapshot()
+
+    # Appended rows plus a line the writer has not finished yet
+    partial = ROWS[70]
+    with open(first, 'a') as f:
+        f.write(''.join(ROWS[WEEKEND_ROWS:70]) + partial[:12])
+    assert live.refresh() == 70 - WEEKEND_ROWS
+    assert_same_state(live, LiveDataset(data_dir))
+    signature, state = live.versioned_snapshot()
+    assert signature != first_signature and len(state[0]) == 70
+
+    # The line is completed and a new partition appears
+    with open(first, 'a') as f:
+        f.write(partial[12:])
+    (data_dir / 'b.csv').write_text(HEADER + ''.join(ROWS[71:]))
+    assert live.refresh() == len(ROWS) - 70
+    assert_same_state(live, LiveDataset(data_dir))
+    assert len(live.snapshot()[0]) == len(ROWS)
+
+
+def test_full_load_ignores_unfinished_line(tmp_path):
+    data_dir = tmp_path / 'data'
+    data_dir.mkdir()
+    (data_dir / 'a.csv').write_text(HEADER + ''.join(ROWS[:10]) + '21,Facebook,ima')
+    live = LiveDataset(data_dir)
+    assert len(live.snapshot()[0]) == 10
+    assert live.refresh() == 0
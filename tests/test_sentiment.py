@@ -0,0 +1,61 @@
+"""
+SentimentCube: jumlah, rata-rata per sentimen, dan komposisi mingguan harus sama dengan
+groupby pandas atas baris yang lolos filter, juga untuk cube gabungan per chunk.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.loader import METRIC_COLUMNS
+from src.sentiment import AXES, build_sentiment_cube
+
+SELECTIONS = [
+    (None, None),
+    (['Instagram'], None),
+    (['Facebook', 'Twitter'], ['video', 'image']),
+]
+
+
+def _selected(df, platforms, post_types):
+    mask = np.ones(len(df), dtype=bool)
+    if platforms is not None:
+        mask &= df['platform'].isin(platforms).to_numpy()
+    if post_types is not None:
+        mask &= df['post_type'].isin(post_types).to_numpy()
+    return df[mask].astype({axis: str for axis in AXES})
+
+
+def _assert_matches_pandas(cube, df, platforms, post_types):
+    rows = _selected(df, platforms, post_types)
+
+    grouped = rows.groupby(AXES)[METRIC_COLUMNS]
+    expected = grouped.mean().assign(count=grouped.size())[['count'] + METRIC_COLUMNS]
+    got = cube.breakdown(platforms, post_types)
+    pd.testing.assert_frame_equal(got.sort_index(), expected.sort_index(), check_dtype=False)
+
+    expected = rows.groupby('sentiment_score')[METRIC_COLUMNS].mean()
+    got = cube.by_sentiment(platforms, post_types)
+    assert list(got.index) == [s for s in ['positive', 'neutral', 'negative'] if s in expected.index]
+    pd.testing.assert_frame_equal(got, expected.loc[got.index])
+
+    # Weeks start on Monday, as loader.time_feature counts them
+    week = rows['post_time'].dt.to_period('W-SUN').dt.start_time.rename('week')
+    expected = pd.crosstab(week, rows['sentiment_score'], normalize='index')
+    got = cube.weekly_mix(platforms, post_types)
+    pd.testing.assert_frame_equal(
+        got[expected.columns], expected, check_names=False, check_index_type=False, check_freq=False
+    )
+
+
+@pytest.mark.parametrize('platforms, post_types', SELECTIONS)
+def test_sentiment_cube_matches_pandas(engagement, platforms, post_types):
+    _assert_matches_pandas(build_sentiment_cube(engagement), engagement, platforms, post_types)
+
+
+@pytest.mark.parametrize('platforms, post_types', SELECTIONS)
+def test_merged_chunks_match_pandas(engagement, platforms, post_types):
+    chunks = [engagement.iloc[i:i + 1700] for i in range(0, len(engagement), 1700)]
+    cube = build_sentiment_cube(chunks[0])
+    for chunk in chunks[1:]:
+        cube = cube.merge(build_sentiment_cube(chunk))
+    _assert_matches_pandas(cube, engagement, platforms, post_types)
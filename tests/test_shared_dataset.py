@@ -0,0 +1,56 @@
+"""
+Dataset bersama: attach memetakan setiap kolom tanpa menyalin, dan versi sebelumnya
+tetap bisa di-attach sampai publish berikutnya.
+"""
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.loader import resolve_data_path
+from src.shared_dataset import META, _version_name, attach, publish
+
+SOURCE_LINES = resolve_data_path().read_text().splitlines(keepends=True)
+
+
+def _write(path, n_rows):
+    path.write_text(''.join(SOURCE_LINES[:n_rows + 1]))
+    return [path]
+
+
+def _mapped_file(values):
+    # Every np.load(mmap_mode='r') is a new mapping, so compare the backing file, not addresses
+    while values is not None:
+        if isinstance(values, np.memmap):
+            return Path(values.filename)
+        values = values.base
+
+
+def test_attach_maps_columns_without_copy(tmp_path):
+    root = tmp_path / 'shared'
+    signature = publish(_write(tmp_path / 'a.csv', 50), root)
+    df = attach(signature, root)
+    directory = root / _version_name(signature)
+    meta = json.loads((directory / META).read_text())
+
+    assert len(df) == 50
+    for i, column in enumerate(meta['columns']):
+        series = df[column['name']]
+        values = series.array.codes if isinstance(series.dtype, pd.CategoricalDtype) else series.to_numpy()
+        assert _mapped_file(values) == directory / f"{i}.npy", column['name']
+
+
+def test_publish_keeps_previous_version(tmp_path):
+    root = tmp_path / 'shared'
+    path = tmp_path / 'a.csv'
+    first = publish(_write(path, 10), root)
+    second = publish(_write(path, 20), root)
+
+    # A replica that read `first` just before the switch can still attach it
+    assert len(attach(first, root)) == 10
+    assert len(attach(second, root)) == 20
+
+    publish(_write(path, 30), root)
+    assert not (root / _version_name(first)).exists()
+    assert len(attach(second, root)) == 20
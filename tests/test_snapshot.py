@@ -0,0 +1,56 @@
+"""
+Snapshot statis: angka di figure sama dengan pandas biasa, dan state filter tanpa baris
+dilewati tanpa meninggalkan tautan ke file yang sudah dihapus.
+"""
+import json
+
+import numpy as np
+import pytest
+
+from src.cube import build_cube
+from src.filter_index import build_filter_index
+from src.loader import METRIC_COLUMNS, load_partitions, resolve_data_path
+from src.snapshot import build_snapshot, export_snapshots, normalize_filters
+
+
+def _figures(sections):
+    return {chart_id: fig for section, figures in sections for chart_id, fig in zip(section.chart_ids, figures)}
+
+
+def test_snapshot_figures_match_pandas():
+    df = load_partitions([resolve_data_path()])
+    filters = normalize_filters({'platforms': ['Instagram', 'Twitter'], 'post_types': ['video']})
+    n_rows, sections = build_snapshot(df, build_cube(df), build_filter_index(df), filters)
+
+    selected = df[df['platform'].isin(filters['platforms']) & df['post_type'].isin(filters['post_types'])]
+    assert n_rows == len(selected)
+    figures = _figures(sections)
+
+    expected = selected.groupby('platform', observed=True)[METRIC_COLUMNS].mean()
+    for metric, trace in zip(METRIC_COLUMNS, figures['platform'].data):
+        np.testing.assert_allclose(np.asarray(trace.y, dtype=float), expected.loc[list(trace.x), metric])
+
+    counts, _ = np.histogram(selected['likes'].to_numpy(), bins=20)
+    np.testing.assert_array_equal(figures['hist_likes'].data[0].y, counts)
+
+    for metric, trace in zip(METRIC_COLUMNS, figures['box'].data):
+        for platform, median in zip(trace.x, trace.median):
+            values = selected.loc[selected['platform'] == platform, metric]
+            assert median == pytest.approx(values.median())
+
+
+def test_empty_filter_state_is_skipped(tmp_path):
+    output_dir = tmp_path / 'snapshots'
+    data_dir = resolve_data_path().parent
+    first = export_snapshots(output_dir, '[{"platforms": ["Instagram"]}]', data_dir=data_dir)
+    assert first['written'] == ['default', 'platforms-instagram']
+
+    result = export_snapshots(output_dir, '[{"platforms": ["LinkedIn"]}]', data_dir=data_dir)
+    assert result['empty'] == ['platforms-linkedin']
+    assert result['skipped'] == ['default']
+
+    manifest = json.loads((output_dir / 'manifest.json').read_text())
+    assert list(manifest) == ['default']
+    assert not (output_dir / 'platforms-instagram.html').exists()
+    assert 'platforms-instagram' not in (output_dir / 'index.html').read_text()
+    assert manifest['default']['rows'] > 0
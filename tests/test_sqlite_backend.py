@@ -0,0 +1,82 @@
+"""
+SqliteEngagementStore: agregat SQL harus sama dengan pandas/NumPy atas frame yang sama,
+termasuk histogram (np.histogram) dan statistik box dari tabel frekuensi.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from config.config import DatabaseConfig
+from src.boxstats import sorted_box_stats
+from src.loader import METRIC_COLUMNS, dataset_signature
+from src.sqlite_backend import open_store
+
+SELECTIONS = [
+    (None, None),
+    (['Instagram'], None),
+    (['Facebook', 'Twitter'], ['video', 'image']),
+]
+
+
+@pytest.fixture
+def store(synthetic_csv, tmp_path):
+    store = open_store(dataset_signature([synthetic_csv]), tmp_path / 'engagement.db')
+    yield store
+    store.close()
+
+
+def _selected(df, platforms, post_types):
+    mask = np.ones(len(df), dtype=bool)
+    if platforms is not None:
+        mask &= df['platform'].isin(platforms).to_numpy()
+    if post_types is not None:
+        mask &= df['post_type'].isin(post_types).to_numpy()
+    return df[mask]
+
+
+@pytest.mark.parametrize('platforms, post_types', SELECTIONS)
+def test_group_bys_match_pandas(engagement, store, platforms, post_types):
+    rows = _selected(engagement, platforms, post_types)
+    assert store.count(platforms, post_types) == len(rows)
+    for by in ['platform', 'post_type', 'post_day']:
+        grouped = rows.groupby(rows[by].astype(str))[METRIC_COLUMNS]
+        pd.testing.assert_frame_equal(store.mean(by, platforms, post_types), grouped.mean(), check_names=False)
+        pd.testing.assert_frame_equal(
+            store.total(by, platforms, post_types), grouped.sum().astype(np.int64), check_names=False
+        )
+    daily = rows.groupby(rows['post_time'].dt.normalize().rename('date'))[METRIC_COLUMNS].sum()
+    pd.testing.assert_frame_equal(
+        store.total('date', platforms, post_types), daily.astype(np.int64), check_index_type=False, check_freq=False
+    )
+
+
+@pytest.mark.parametrize('platforms, post_types', SELECTIONS + [(['Instagram'], ['bukan-jenis'])])
+@pytest.mark.parametrize('metric', METRIC_COLUMNS)
+def test_histogram_matches_numpy(engagement, store, metric, platforms, post_types):
+    values = _selected(engagement, platforms, post_types)[metric].to_numpy()
+    counts, edges = store.histogram(metric, platforms, post_types)
+    if len(values):
+        expected_counts, expected_edges = np.histogram(values, bins=20)
+        np.testing.assert_allclose(edges, expected_edges)
+        np.testing.assert_array_equal(counts, expected_counts)
+    else:
+        assert counts.sum() == 0
+
+
+@pytest.mark.parametrize('metric', METRIC_COLUMNS)
+@pytest.mark.parametrize('post_types', [None, ['poll', 'text']])
+def test_box_stats_match_sorted_values(engagement, store, metric, post_types):
+    for platform in ['Facebook', 'Instagram', 'Twitter']:
+        values = np.sort(_selected(engagement, [platform], post_types)[metric].to_numpy())
+        got = store.box_stats(metric, platform, post_types)
+        expected = sorted_box_stats(values)
+        for key, value in expected.items():
+            np.testing.assert_array_equal(got[key], value, err_msg=key)
+    assert store.box_stats(metric, 'LinkedIn', post_types) is None
+
+
+def test_unsupported_db_type_is_rejected(synthetic_csv, tmp_path, monkeypatch):
+    monkeypatch.setattr(DatabaseConfig, 'DB_TYPE', 'postgresql')
+    with pytest.raises(ValueError, match='DB_TYPE'):
+        open_store(dataset_signature([synthetic_csv]), tmp_path / 'engagement.db')
+    assert not (tmp_path / 'engagement.db').exists()
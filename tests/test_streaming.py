@@ -0,0 +1,65 @@
+"""
+Streaming: agregat per chunk sama dengan frame penuh, dan histogram/kuantil sketch sama
+dengan NumPy (eksak bila lebar bin sketch 1, selain itu dalam resolusi sketch).
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.cube import build_cube
+from src.loader import METRIC_COLUMNS
+from src.sentiment import build_sentiment_cube
+from src.streaming import StreamHistogram, stream_engagement
+
+QUANTILES = [0, 0.1, 0.25, 0.5, 0.75, 0.9, 1]
+
+
+@pytest.fixture
+def aggregates(synthetic_csv):
+    return stream_engagement(synthetic_csv, chunksize=700)
+
+
+def test_chunked_aggregates_match_whole_frame(engagement, aggregates):
+    assert aggregates.n_rows == len(engagement)
+    for by in ['platform', 'post_day', 'date']:
+        pd.testing.assert_frame_equal(
+            aggregates.cube.total(by).sort_index(), build_cube(engagement).total(by).sort_index(),
+            check_categorical=False
+        )
+    pd.testing.assert_frame_equal(
+        aggregates.sentiment.breakdown().sort_index(), build_sentiment_cube(engagement).breakdown().sort_index()
+    )
+
+
+@pytest.mark.parametrize('metric', METRIC_COLUMNS)
+@pytest.mark.parametrize('platforms, post_types', [(None, None), (['Instagram'], ['video', 'poll'])])
+def test_sketch_matches_numpy(engagement, aggregates, metric, platforms, post_types):
+    rows = engagement
+    if platforms is not None:
+        rows = rows[rows['platform'].isin(platforms) & rows['post_type'].isin(post_types)]
+    values = rows[metric].to_numpy()
+    sketch = aggregates.sketch(metric, platforms, post_types)
+    counts, edges = sketch.histogram()
+    expected_counts, expected_edges = np.histogram(values, bins=20)
+
+    np.testing.assert_allclose(edges, expected_edges)
+    assert counts.sum() == len(values)
+    if sketch.width == 1:
+        np.testing.assert_array_equal(counts, expected_counts)
+        np.testing.assert_allclose(sketch.quantile(QUANTILES), np.quantile(values, QUANTILES))
+    else:
+        # A sketch bin straddling a histogram edge lands on one side as a whole
+        assert np.abs(counts - expected_counts).max() <= sketch.counts.max()
+        np.testing.assert_allclose(sketch.quantile(QUANTILES), np.quantile(values, QUANTILES), atol=sketch.width)
+
+
+def test_merged_sketches_match_single_sketch():
+    rng = np.random.default_rng(1)
+    parts = [rng.integers(0, 300, 1000), rng.integers(0, 40_000, 1000), rng.integers(0, 5, 10)]
+    merged = StreamHistogram()
+    for part in parts:
+        merged.merge(StreamHistogram().update(part))
+    single = StreamHistogram().update(np.concatenate(parts))
+    assert merged.width == single.width
+    np.testing.assert_array_equal(merged.counts, single.counts)
+    np.testing.assert_allclose(merged.quantile(QUANTILES), single.quantile(QUANTILES))
@@ -0,0 +1,72 @@
+"""
+Upload COVID: parsing per chunk dengan dtype ringkas harus memberi nilai yang sama dengan
+pd.read_csv biasa, termasuk saat chunk berikutnya tidak muat int32 atau memuat nilai kosong.
+"""
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.uploads import UploadTooLarge, parse_upload
+
+CHUNK_ROWS = 40
+
+
+def _csv(df):
+    return io.BytesIO(df.to_csv(index=False).encode())
+
+
+@pytest.fixture
+def states():
+    rng = np.random.default_rng(3)
+    n = 200
+    return pd.DataFrame({
+        'date': pd.date_range('2021-01-01', periods=n // 4).repeat(4).strftime('%Y-%m-%d'),
+        'state': np.tile(['Texas', 'Ohio', 'Guam', 'Utah'], n // 4),
+        'fips': np.tile([48, 39, 66, 49], n // 4),
+        'cases': np.cumsum(rng.integers(0, 1000, n)),
+        'deaths': np.cumsum(rng.integers(0, 10, n)),
+    })
+
+
+def _assert_values_equal(parsed, df):
+    expected = pd.read_csv(_csv(df), parse_dates=['date'])
+    pd.testing.assert_frame_equal(
+        parsed.astype({'state': str}), expected.astype({'state': str}), check_dtype=False
+    )
+
+
+def test_chunked_parse_matches_read_csv(states):
+    parsed = parse_upload(_csv(states), chunksize=CHUNK_ROWS)
+    assert not parsed.sampled
+    _assert_values_equal(parsed.frame, states)
+    assert parsed.frame['cases'].dtype == np.int32
+    assert isinstance(parsed.frame['state'].dtype, pd.CategoricalDtype)
+
+
+def test_late_int32_overflow_widens_instead_of_wrapping(states):
+    states.loc[len(states) - 1, 'cases'] = 2 ** 31 + 5
+    parsed = parse_upload(_csv(states), chunksize=CHUNK_ROWS)
+    _assert_values_equal(parsed.frame, states)
+    assert parsed.frame['cases'].dtype == np.int64
+    assert parsed.frame['cases'].iloc[-1] == 2 ** 31 + 5
+
+
+def test_late_missing_values_are_kept(states):
+    states['deaths'] = states['deaths'].astype(float)
+    states.loc[150, 'deaths'] = np.nan
+    parsed = parse_upload(_csv(states), chunksize=CHUNK_ROWS)
+    _assert_values_equal(parsed.frame, states)
+    assert np.isnan(parsed.frame['deaths'].iloc[150])
+
+
+def test_over_budget_summary_matches_pandas(states):
+    summary = parse_upload(_csv(states), budget_mb=1e-3, over_budget='sample', chunksize=CHUNK_ROWS).summary
+    assert summary.shape == states.shape
+    expected = states.assign(date=pd.to_datetime(states['date'])).groupby('date')[['fips', 'cases', 'deaths']].sum()
+    got = summary.daily.set_index('date')[['fips', 'cases', 'deaths']]
+    pd.testing.assert_frame_equal(got, expected, check_dtype=False)
+
+    with pytest.raises(UploadTooLarge):
+        parse_upload(_csv(states), budget_mb=1e-3, over_budget='reject', chunksize=CHUNK_ROWS)